@@ -5,7 +5,9 @@ from various sources, managing document templates, and delivering documents
 through different services such as email, SFTP, or Amazon S3.
 
 Classes and Components:
+    AsyncPostgreSQLSource: Class for loading data from PostgreSQL databases with asyncio.
     AWSConfig: Configuration class for AWS services.
+    ChromiumBackend: PDF backend using headless Chromium through Playwright.
     Connectable: Abstract base class for connectable data sources.
     CSVSource: Class for loading data from CSV files.
     DataBaseSource: Abstract base class for database sources.
@@ -19,41 +21,78 @@ Classes and Components:
     MongoDBSource: Class for connecting to and loading data from MongoDB databases.
     MySQLSource: Class for connecting to and loading data from MySQL databases.
     ParquetSource: Class for loading data from Parquet files.
+    PDFBackend: Abstract base class for the engines that lay out HTML as PDF.
     PostgreSQLSource: Class for connecting to and loading data from PostgreSQL databases.
     S3Delivery: Class for uploading files to Amazon S3.
     SFTPDelivery: Class for transferring files via SFTP.
     SMTPConfig: Configuration class for SMTP server settings.
     Template: Class for managing HTML templates with associated assets and CSS.
     TemplateManager: Class for managing and integrating document templates with data sources.
+    WeasyPrintBackend: PDF backend using WeasyPrint, the default one.
     XLSXSource: Class for loading data from XLSX files.
 """
 
-from .data_sources import (
-    CSVDataSource,
-    CSVSource,
-    DataBaseSource,
-    DataSource,
-    FileSource,
-    MongoDBSource,
-    MySQLSource,
-    ParquetSource,
-    PostgreSQLSource,
-    XLSXSource,
-)
-from .models import Template
-from .services import (
-    AWSConfig,
-    EmailMessageBuilder,
-    EmailSender,
-    S3Delivery,
-    SFTPDelivery,
-    SMTPConfig,
-    TemplateManager,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .utils import Connectable, DBConfig, EncodingType, ReplacementsDict, ValidReplacementValue
 
+if TYPE_CHECKING:
+    from .data_sources import (
+        AsyncPostgreSQLSource,
+        CSVDataSource,
+        CSVSource,
+        DataBaseSource,
+        DataSource,
+        FileSource,
+        MongoDBSource,
+        MySQLSource,
+        ParquetSource,
+        PostgreSQLSource,
+        XLSXSource,
+    )
+    from .models import ChromiumBackend, PDFBackend, Template, WeasyPrintBackend
+    from .services import (
+        AWSConfig,
+        EmailMessageBuilder,
+        EmailSender,
+        S3Delivery,
+        SFTPDelivery,
+        SMTPConfig,
+        TemplateManager,
+    )
+
+# Exports are imported on first access (PEP 562), so importing the package doesn't load
+# the dependencies of every component.
+_LAZY_EXPORTS: dict[str, str] = {
+    "AsyncPostgreSQLSource": ".data_sources",
+    "CSVDataSource": ".data_sources",
+    "CSVSource": ".data_sources",
+    "DataSource": ".data_sources",
+    "DataBaseSource": ".data_sources",
+    "FileSource": ".data_sources",
+    "MongoDBSource": ".data_sources",
+    "MySQLSource": ".data_sources",
+    "ParquetSource": ".data_sources",
+    "PostgreSQLSource": ".data_sources",
+    "XLSXSource": ".data_sources",
+    "ChromiumBackend": ".models",
+    "PDFBackend": ".models",
+    "WeasyPrintBackend": ".models",
+    "Template": ".models",
+    "AWSConfig": ".services",
+    "S3Delivery": ".services",
+    "SFTPDelivery": ".services",
+    "EmailMessageBuilder": ".services",
+    "EmailSender": ".services",
+    "SMTPConfig": ".services",
+    "TemplateManager": ".services",
+}
+
 __all__ = [
+    "AsyncPostgreSQLSource",
     "AWSConfig",
+    "ChromiumBackend",
     "Connectable",
     "CSVDataSource",
     "CSVSource",
@@ -69,11 +108,26 @@ __all__ = [
     "MongoDBSource",
     "MySQLSource",
     "ParquetSource",
+    "PDFBackend",
     "PostgreSQLSource",
     "S3Delivery",
     "SFTPDelivery",
     "SMTPConfig",
     "Template",
     "TemplateManager",
+    "WeasyPrintBackend",
     "XLSXSource",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,7 @@ and MySQL. Each class abstracts the complexity of data retrieval, allowing users
 interact with and load data from different sources.
 
 Classes:
+    AsyncPostgreSQLSource: Class for loading data from PostgreSQL databases with asyncio.
     CSVSource: Class for loading data from CSV files.
     DataBaseSource: Abstract base class for database sources.
     FileSource: Abstract base class for file-based data sources.
@@ -15,18 +16,39 @@ Classes:
     XLSXSource: Class for loading data from XLSX files.
 """
 
-from .csv_data_source import CSVDataSource  # Deprecated
-from .csv_source import CSVSource
-from .data_source import DataSource
-from .database_source import DataBaseSource
-from .file_source import FileSource
-from .mongo_source import MongoDBSource
-from .mysql_source import MySQLSource
-from .parquet_source import ParquetSource
-from .postgre_source import PostgreSQLSource
-from .xlsx_source import XLSXSource
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_postgre_source import AsyncPostgreSQLSource
+    from .csv_data_source import CSVDataSource  # Deprecated
+    from .csv_source import CSVSource
+    from .data_source import DataSource
+    from .database_source import DataBaseSource
+    from .file_source import FileSource
+    from .mongo_source import MongoDBSource
+    from .mysql_source import MySQLSource
+    from .parquet_source import ParquetSource
+    from .postgre_source import PostgreSQLSource
+    from .xlsx_source import XLSXSource
+
+# Imported on first access, like the root package exports.
+_LAZY_EXPORTS: dict[str, str] = {
+    "AsyncPostgreSQLSource": ".async_postgre_source",
+    "CSVDataSource": ".csv_data_source",
+    "CSVSource": ".csv_source",
+    "DataSource": ".data_source",
+    "DataBaseSource": ".database_source",
+    "FileSource": ".file_source",
+    "MongoDBSource": ".mongo_source",
+    "MySQLSource": ".mysql_source",
+    "ParquetSource": ".parquet_source",
+    "PostgreSQLSource": ".postgre_source",
+    "XLSXSource": ".xlsx_source",
+}
 
 __all__ = [
+    "AsyncPostgreSQLSource",
     "CSVDataSource",  # Deprecated
     "CSVSource",
     "DataBaseSource",
@@ -38,3 +60,16 @@ __all__ = [
     "PostgreSQLSource",
     "XLSXSource",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
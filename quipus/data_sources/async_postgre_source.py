@@ -0,0 +1,170 @@
+import asyncio
+from typing import Optional
+
+import polars as pl
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool
+
+from .postgre_source import PostgreSQLSource
+
+
+class AsyncPostgreSQLSource(PostgreSQLSource):
+    """
+    A PostgreSQL source that also loads data with asyncio, through an asynchronous
+    connection pool.
+
+    While a query waits on the network, the event loop runs other work, so the queries
+    of several sources can overlap with `asyncio.gather`. The synchronous methods
+    inherited from PostgreSQLSource keep working and use their own connections.
+
+    Attributes:
+        connection_string (str): The connection string for the PostgreSQL database.
+        query (str): The SQL query to be executed on the database.
+        use_connectorx (bool): Whether `aload_data` reads through ConnectorX.
+        partition_on (Optional[str]): The numeric column ConnectorX splits the query on.
+        use_copy (bool): Whether `aload_data` reads through a binary COPY.
+        use_binary (bool): Whether `aload_data` fetches rows in PostgreSQL's binary format.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes an AsyncPostgreSQLSource instance.
+
+        Takes the same parameters as PostgreSQLSource.
+        """
+        super().__init__(*args, **kwargs)
+        self._async_pool: Optional[AsyncConnectionPool] = None
+
+    async def __aenter__(self):
+        """
+        Enters an asynchronous runtime context, opening the connection pool.
+
+        Returns:
+            AsyncPostgreSQLSource: The current instance of the class.
+        """
+        await self.ainitialize_pool()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Exits the asynchronous runtime context, closing the connection pool.
+
+        Args:
+            exc_type (type): The type of the exception.
+            exc_value (Exception): The exception instance.
+            traceback (TracebackType): The traceback object.
+        """
+        await self.aclose()
+
+    async def ainitialize_pool(
+        self, min_connections: int = 1, max_connections: int = 10
+    ) -> None:
+        """
+        Opens the asynchronous connection pool, if it isn't open yet.
+
+        Parameters:
+            min_connections (int): The minimum number of connections in the pool. Defaults to 1.
+            max_connections (int): The maximum number of connections in the pool. Defaults to 10.
+
+        Raises:
+            RuntimeError: If an error occurs while trying to connect to the database.
+        """
+        if self._async_pool is not None:
+            return
+
+        pool = AsyncConnectionPool(
+            conninfo=self.connection_string,
+            min_size=min_connections,
+            max_size=max_connections,
+            open=False,
+        )
+        try:
+            await pool.open()
+        except Exception as e:
+            raise RuntimeError(f"Error connecting to the database: {e}") from e
+        self._async_pool = pool
+
+    async def aclose(self) -> None:
+        """
+        Closes the asynchronous connection pool and all its connections.
+        """
+        if self._async_pool is not None:
+            pool, self._async_pool = self._async_pool, None
+            await pool.close()
+
+    async def aload_data(self) -> pl.DataFrame:
+        """
+        Executes the configured SQL query and loads data from the PostgreSQL database
+        into a Polars DataFrame, without blocking the event loop while waiting on it.
+
+        A connection is borrowed from the asynchronous pool for the duration of the query,
+        opening the pool with its default size if needed. Rows are streamed and converted
+        in batches of `BATCH_SIZE`, like `load_data`. With `use_connectorx`, the read
+        runs in a worker thread instead.
+
+        Returns:
+            pl.DataFrame: A DataFrame containing the query result.
+
+        Raises:
+            RuntimeError: If an error occurs during execution.
+        """
+        if self.use_connectorx:
+            return await asyncio.to_thread(self._load_data_with_connectorx)
+
+        await self.ainitialize_pool()
+
+        try:
+            # The pool wraps the borrowed connection in a transaction, which server-side
+            # cursors need.
+            async with self._async_pool.connection() as connection:
+                if self.use_copy:
+                    return await self.__aload_data_with_copy(connection)
+
+                async with connection.cursor(
+                    name="quipus_load_data", binary=self.use_binary
+                ) as cursor:
+                    cursor.itersize = self.BATCH_SIZE
+                    await cursor.execute(self.query)
+                    columns = [desc[0] for desc in cursor.description]
+
+                    frames = []
+                    while rows := await cursor.fetchmany(self.BATCH_SIZE):
+                        frames.append(self._rows_to_frame(rows, columns))
+        except Exception as e:
+            raise RuntimeError(f"Error loading data: {e}") from e
+
+        return self._concat_frames(frames, columns)
+
+    async def __aload_data_with_copy(self, connection) -> pl.DataFrame:
+        """
+        Executes the configured SQL query through `COPY ... TO STDOUT (FORMAT BINARY)`.
+
+        Parameters:
+            connection (AsyncConnection): The connection borrowed from the pool.
+
+        Returns:
+            pl.DataFrame: A DataFrame containing the query result.
+        """
+        # The configured query is run as is, like in `aload_data`; it's only wrapped.
+        query = sql.SQL(self.query.strip().rstrip(";"))
+        async with connection.cursor() as cursor:
+            await cursor.execute(
+                sql.SQL("SELECT * FROM ({}) AS quipus_query LIMIT 0").format(query)
+            )
+            columns = [desc.name for desc in cursor.description]
+            type_oids = [desc.type_code for desc in cursor.description]
+
+            frames = []
+            batch = []
+            copy_statement = sql.SQL("COPY ({}) TO STDOUT (FORMAT BINARY)").format(query)
+            async with cursor.copy(copy_statement) as copy:
+                copy.set_types(type_oids)
+                async for row in copy.rows():
+                    batch.append(row)
+                    if len(batch) == self.BATCH_SIZE:
+                        frames.append(self._rows_to_frame(batch, columns))
+                        batch = []
+            if batch:
+                frames.append(self._rows_to_frame(batch, columns))
+
+        return self._concat_frames(frames, columns)
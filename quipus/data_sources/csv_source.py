@@ -1,5 +1,10 @@
+import codecs
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, override
+from typing import Any, Iterator, Optional, Union, override
 
 import polars as pl
 
@@ -8,12 +13,31 @@ from quipus.utils import EncodingType
 from .file_source import FileSource
 
 
+def _validate_single_char(value: str, name: str) -> None:
+    """
+    Validates that a parsing option is a single character string.
+
+    Parameters:
+        value (str): The value to validate.
+        name (str): The option name used in error messages.
+
+    Raises:
+        TypeError: If the value is not a string.
+        ValueError: If the value is not a single character.
+    """
+    if not isinstance(value, str):
+        raise TypeError(f"{name} must be a string.")
+    if len(value) != 1:
+        raise ValueError(f"{name} must be a single character.")
+
+
 class CSVSource(FileSource):
     """
     A class for loading and processing data from CSV files.
 
     Attributes:
-        file_path (Union[str, Path]): The path to the CSV file.
+        file_path (Union[str, Path]): The path to the CSV file, or a glob pattern matching
+            several CSV files with the same columns.
         delimiter (str): The character used to separate values in the CSV file.
         quote_char (Optional[str]): The character used to quote strings in the CSV file.
         skip_rows (int): The number of rows to skip at the start of the file.
@@ -22,6 +46,9 @@ class CSVSource(FileSource):
         has_header (bool): Indicates if the CSV file has a header row.
         columns (Optional[list[str]]): A list of columns to read from the file.
         date_columns (Optional[list[str]]): A list of column names that contain date values.
+        parquet_cache (bool): Whether UTF-8 files are read through a Parquet copy kept
+            next to the CSV file.
+        row_filter (Optional[pl.Expr]): A predicate selecting the rows to load.
     """
 
     def __init__(
@@ -35,12 +62,15 @@ class CSVSource(FileSource):
         has_header: bool = True,
         columns: Optional[list[str]] = None,
         date_columns: Optional[list[str]] = None,
+        parquet_cache: bool = False,
+        row_filter: Optional[pl.Expr] = None,
     ):
         """
         Initializes a CSVSource instance with the specified parameters.
 
         Parameters:
-          file_path (Union[str, Path]): The path to the CSV file.
+          file_path (Union[str, Path]): The path to the CSV file, or a glob pattern in its file
+            name, e.g. "exports/*.csv". The matching files are read in parallel and stacked.
           delimiter (str): The character used to separate values. Defaults to ",".
           quote_char (Optional[str]): Character used to quote strings. Defaults to None.
           skip_rows (int): The number of rows to skip at the start of the file. Defaults to 0.
@@ -49,6 +79,10 @@ class CSVSource(FileSource):
           has_header (bool): Indicates if the file has a header row. Defaults to True.
           columns (Optional[list[str]]): Columns to read from the file. Defaults to None.
           date_columns (Optional[list[str]]): Columns containing date values. Defaults to None.
+          parquet_cache (bool): Whether to convert UTF-8 files to a Parquet copy on first read
+            and read that copy afterwards. Defaults to False.
+          row_filter (Optional[pl.Expr]): A predicate selecting the rows to load, e.g.
+            `pl.col("lang") == "es"`. Defaults to None, which loads every row.
         """
         super().__init__(
             file_path=file_path,
@@ -61,6 +95,11 @@ class CSVSource(FileSource):
         self.quote_char = quote_char
         self.skip_rows = skip_rows
         self.na_values = na_values if na_values else []
+        self.parquet_cache = parquet_cache
+        self.row_filter = row_filter
+        self._read_kwargs_cache: Optional[tuple[tuple, dict[str, Any]]] = None
+        self._scan_cache: Optional[tuple[tuple, pl.LazyFrame]] = None
+        self._columns_cache: Optional[tuple[tuple, list[str]]] = None
 
     @property
     def delimiter(self) -> str:
@@ -81,10 +120,7 @@ class CSVSource(FileSource):
             ValueError: If the delimiter is not a single character.
             TypeError: If the delimiter is not a string.
         """
-        if not isinstance(value, str):
-            raise TypeError("Delimiter must be a string.")
-        if len(value) != 1:
-            raise ValueError("Delimiter must be a single character.")
+        _validate_single_char(value, "Delimiter")
         self._delimiter = value
 
     @property
@@ -113,10 +149,7 @@ class CSVSource(FileSource):
         if value is None:
             self._quote_char = value
             return
-        if not isinstance(value, str):
-            raise TypeError("Quote character must be a string.")
-        if len(value) != 1:
-            raise ValueError("Quote character must be a single character.")
+        _validate_single_char(value, "Quote character")
         if value == self.delimiter:
             raise ValueError("Quote character cannot be the same as the delimiter.")
         self._quote_char = value
@@ -179,23 +212,373 @@ class CSVSource(FileSource):
 
         self._na_values = value
 
+    @property
+    def parquet_cache(self) -> bool:
+        """
+        bool: Whether UTF-8 files are read through a Parquet copy kept next to the CSV file.
+
+        The copy is columnar, so reading a few columns only touches those columns. It is
+        rebuilt when the CSV file is modified, and each combination of parsing options
+        gets its own copy.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        return self._parquet_cache
+
+    @parquet_cache.setter
+    def parquet_cache(self, value: bool) -> None:
+        """
+        Sets whether UTF-8 files are read through a Parquet copy.
+
+        Parameters:
+            value (bool): Boolean indicating if the Parquet copy is used.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        if not isinstance(value, bool):
+            raise TypeError("parquet_cache must be a boolean value.")
+        self._parquet_cache = value
+
+    @property
+    def row_filter(self) -> Optional[pl.Expr]:
+        """
+        Optional[pl.Expr]: A predicate selecting the rows to load.
+
+        For UTF-8 files, the predicate is pushed down into the CSV reader, so rows that
+        don't match it are dropped as they are parsed instead of being loaded first, and
+        columns it refers to don't need to be in `columns`. Other encodings, and
+        `load_data_batched`, apply it to the rows read, so when `columns` is set the
+        columns it refers to must be among them.
+
+        Raises:
+            TypeError: If the value is not a Polars expression.
+        """
+        return self._row_filter
+
+    @row_filter.setter
+    def row_filter(self, value: Optional[pl.Expr]) -> None:
+        """
+        Sets the predicate selecting the rows to load.
+
+        Parameters:
+            value (Optional[pl.Expr]): The predicate, or None to load every row.
+
+        Raises:
+            TypeError: If the value is not a Polars expression.
+        """
+        if value is not None and not isinstance(value, pl.Expr):
+            raise TypeError("row_filter must be a Polars expression.")
+        self._row_filter = value
+
     @override
-    def load_data(self) -> pl.DataFrame:
+    def scan_data(self) -> pl.LazyFrame:
+        """
+        Lazily scans the CSV file, pushing the column selection down into the reader.
+
+        UTF-8 files share the scan used by `get_columns`, or read the Parquet copy when
+        `parquet_cache` is set. A glob pattern is scanned as a single query over every
+        matching file, which Polars parses in parallel. `pl.scan_csv` can't decode other
+        encodings, so those files are transcoded and read eagerly, then wrapped in a
+        LazyFrame.
+
+        Returns:
+            pl.LazyFrame: The lazy query reading the CSV file.
+        """
+        # Expanded once per read; the caches below are keyed on the pattern.
+        paths = self.file_paths
+        if self.encoding is not EncodingType.UTF8:
+            lazy_frame = pl.concat(
+                [self._read_transcoded(path) for path in paths], rechunk=False
+            ).lazy()
+            if self.row_filter is not None:
+                lazy_frame = lazy_frame.filter(self.row_filter)
+            return lazy_frame
+
+        if self.parquet_cache and not self._is_glob:
+            lazy_frame = pl.scan_parquet(self._ensure_parquet_cache())
+        else:
+            lazy_frame = self._scan(paths)
+        if self.row_filter is not None:
+            lazy_frame = lazy_frame.filter(self.row_filter)
+        if self.columns:
+            # Keep the file order of the columns, as `pl.read_csv` does.
+            names = self._header_columns(paths)
+            wanted = set(self.columns)
+            missing = sorted(wanted.difference(names))
+            lazy_frame = lazy_frame.select([n for n in names if n in wanted] + missing)
+        return lazy_frame
+
+    def _read_transcoded(self, path: Path) -> pl.DataFrame:
+        """
+        Reads a CSV file that isn't UTF-8 encoded, transcoding it to UTF-8 first.
+
+        The file is memory-mapped and decoded straight from the mapping, saving the copy
+        Polars makes when it reads the whole file into memory before decoding it.
+
+        Parameters:
+            path (Path): The path of the CSV file.
+
+        Returns:
+            pl.DataFrame: The data from the CSV file.
         """
-        Loads data from the CSV file into a Polars DataFrame.
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                data = b""
+            else:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    data = codecs.decode(mapped, self._polars_encoding).encode()
+
+        return pl.read_csv(
+            **{**self._read_kwargs, "source": data, "encoding": "utf8"}, columns=self.columns
+        )
+
+    def _ensure_parquet_cache(self) -> Path:
+        """
+        Writes the Parquet copy of the CSV file, unless an up-to-date one already exists.
+
+        Returns:
+            Path: The path of the Parquet copy.
+        """
+        options_digest = hashlib.blake2b(
+            repr(self._parse_options_key()[1:]).encode(), digest_size=4
+        ).hexdigest()
+        cache_path = self.file_path.with_name(
+            f"{self.file_path.name}.{options_digest}.parquet.cache"
+        )
+
+        if (
+            not cache_path.is_file()
+            or cache_path.stat().st_mtime_ns < self.file_path.stat().st_mtime_ns
+        ):
+            # Written aside and renamed, so concurrent readers never see a partial file.
+            tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+            self._scan([self.file_path]).sink_parquet(
+                tmp_path, compression="snappy", row_group_size=100_000
+            )
+            os.replace(tmp_path, cache_path)
+
+        return cache_path
+
+    def _scan(self, paths: list[Path]) -> pl.LazyFrame:
+        """
+        Builds the lazy scan of the CSV files, cached until a parsing option or the files
+        matching the pattern change.
+
+        Only available for UTF-8 files, the only encoding `pl.scan_csv` supports.
+
+        Parameters:
+            paths (list[Path]): The files to scan, as expanded from `file_path`.
+
+        Returns:
+            pl.LazyFrame: The lazy scan of the CSV files.
+        """
+        scan_key = (self._parse_options_key(), tuple(paths))
+        if self._scan_cache is None or self._scan_cache[0] != scan_key:
+            source = paths if self._is_glob else self.file_path
+            self._scan_cache = (scan_key, pl.scan_csv(**{**self._read_kwargs, "source": source}))
+        return self._scan_cache[1]
+
+    @property
+    def _read_kwargs(self) -> dict[str, Any]:
+        """
+        dict[str, Any]: The keyword arguments shared by the Polars CSV readers.
+
+        Built once and reused until a parsing option changes; callers must not mutate it.
+        With a glob pattern, 'source' is the pattern itself, so readers pass the files it
+        matches instead.
+        """
+        options_key = self._parse_options_key()
+        if self._read_kwargs_cache is None or self._read_kwargs_cache[0] != options_key:
+            read_kwargs = {
+                "source": self.file_path,
+                "separator": self.delimiter,
+                "quote_char": self.quote_char,
+                "encoding": self._polars_encoding,
+                "has_header": self.has_header,
+                "skip_rows": self.skip_rows,
+                "null_values": self.na_values,
+            }
+            self._read_kwargs_cache = (options_key, read_kwargs)
+        return self._read_kwargs_cache[1]
+
+    def _parse_options_key(self) -> tuple:
+        """
+        Gets the options that determine how the file is parsed, used to key the caches.
+
+        The path or glob pattern is used as is, so building the key doesn't touch the
+        filesystem.
+
+        Returns:
+            tuple: The file path and parsing options.
+        """
+        return (
+            self.file_path,
+            self.delimiter,
+            self.quote_char,
+            self.encoding,
+            self.has_header,
+            self.skip_rows,
+            tuple(self.na_values),
+        )
+
+    def load_data_batched(self, batch_size: int = 100_000) -> Iterator[pl.DataFrame]:
+        """
+        Lazily loads the CSV file in batches.
+
+        UTF-8 files are read in a single pass with bounded memory. On Polars versions
+        with `LazyFrame.collect_batches`, the scan of `scan_data` is streamed, which
+        applies `row_filter` before batching. Older versions, down to the 1.12 floor,
+        use `pl.read_csv_batched`, which that method deprecates; there `row_filter` is
+        applied to each batch, so batches may hold fewer rows than `batch_size`.
+        Empty batches are skipped.
+
+        Other encodings can't be decoded by either reader: the whole file is transcoded
+        and loaded with `load_data`, then sliced, so memory is not bounded.
+
+        Parameters:
+            batch_size (int): The number of rows Polars reads per batch. Defaults to 100_000.
+
+        Yields:
+            pl.DataFrame: Consecutive chunks of the CSV file, in file order.
+
+        Raises:
+            TypeError: If batch_size is not an integer.
+            ValueError: If batch_size is not positive.
+        """
+        if not isinstance(batch_size, int):
+            raise TypeError("batch_size must be an integer value.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        if self.encoding is not EncodingType.UTF8:
+            # The batched readers only decode UTF-8; other encodings are read at once.
+            yield from self.load_data().iter_slices(batch_size)
+            return
+
+        if hasattr(pl.LazyFrame, "collect_batches"):
+            batches = self.scan_data().collect_batches(chunk_size=batch_size, lazy=True)
+            yield from (batch for batch in batches if not batch.is_empty())
+            return
+
+        read_kwargs = self._read_kwargs
+        for path in self.file_paths:
+            reader = pl.read_csv_batched(
+                **{**read_kwargs, "source": path}, columns=self.columns, batch_size=batch_size
+            )
+            while batches := reader.next_batches(4):
+                if self.row_filter is None:
+                    yield from batches
+                    continue
+                for batch in batches:
+                    if not (batch := batch.filter(self.row_filter)).is_empty():
+                        yield batch
+
+    def load_data_parallel(self, n_workers: Optional[int] = None) -> pl.DataFrame:
+        """
+        Loads the CSV file by parsing byte ranges of it concurrently.
+
+        The file is memory-mapped and split into roughly equal ranges aligned to line
+        breaks, each parsed in its own thread. Splitting on line breaks is only safe when
+        no quoted field can span lines, so files with a `quote_char` or a non UTF-8
+        encoding fall back to `load_data`, as do glob patterns, whose files `load_data`
+        already parses in parallel, and sources with a `row_filter`, which `load_data`
+        applies while parsing.
+
+        Parameters:
+            n_workers (Optional[int]): The number of ranges to parse concurrently.
+                Defaults to None, which uses the CPU count.
 
         Returns:
             pl.DataFrame: A Polars DataFrame with the data from the CSV file.
+
+        Raises:
+            TypeError: If n_workers is not an integer.
+            ValueError: If n_workers is not positive.
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if not isinstance(n_workers, int):
+            raise TypeError("n_workers must be an integer value.")
+        if n_workers < 1:
+            raise ValueError("n_workers must be a positive integer.")
+
+        if (
+            n_workers == 1
+            or self._is_glob
+            or self.row_filter is not None
+            or self.quote_char is not None
+            or self.encoding is not EncodingType.UTF8
+            or self.file_paths[0].stat().st_size == 0
+        ):
+            return self.load_data()
+
+        chunks = self._split_line_ranges(n_workers)
+        if len(chunks) < 2:
+            return self.load_data()
+
+        first = self._read_chunk(chunks[0])
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            rest = executor.map(
+                lambda chunk: self._read_chunk(chunk, first.schema), chunks[1:]
+            )
+            return pl.concat([first, *rest], rechunk=False)
+
+    def _split_line_ranges(self, n_ranges: int) -> list[bytes]:
+        """
+        Splits the file into up to `n_ranges` chunks aligned to line breaks.
+
+        Rows skipped through `skip_rows` are dropped, and the header line, if any, is
+        prepended to every chunk so each one can be parsed on its own.
+
+        Parameters:
+            n_ranges (int): The maximum number of chunks to produce.
+
+        Returns:
+            list[bytes]: The chunks, in file order.
+        """
+        with open(self.file_path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            size = len(data)
+            start = 0
+            for _ in range(self.skip_rows):
+                start = data.find(b"\n", start) + 1 or size
+
+            header = b""
+            if self.has_header:
+                end = data.find(b"\n", start) + 1 or size
+                header, start = data[start:end], end
+
+            step = max((size - start) // n_ranges, 1)
+            chunks = []
+            while start < size:
+                end = data.find(b"\n", min(start + step, size - 1)) + 1 or size
+                chunks.append(header + data[start:end])
+                start = end
+            return chunks
+
+    def _read_chunk(self, chunk: bytes, schema: Optional[pl.Schema] = None) -> pl.DataFrame:
+        """
+        Parses a chunk produced by `_split_line_ranges` with the source options.
+
+        Parameters:
+            chunk (bytes): The chunk to parse.
+            schema (Optional[pl.Schema]): Column types to enforce, so every chunk matches
+                the types inferred for the first one. Defaults to None.
+
+        Returns:
+            pl.DataFrame: The parsed chunk.
         """
         return pl.read_csv(
-            source=self.file_path,
+            source=chunk,
             separator=self.delimiter,
-            quote_char=self.quote_char,
-            encoding=self.encoding.value,
+            quote_char=None,
             has_header=self.has_header,
             columns=self.columns,
-            skip_rows=self.skip_rows,
             null_values=self.na_values,
+            schema_overrides=schema,
         )
 
     @override
@@ -203,15 +586,34 @@ class CSVSource(FileSource):
         """
         Retrieves the list of columns from the CSV file.
 
+        The header is parsed once and cached until an option affecting it changes.
+
         Returns:
             list[str]: A list of column names.
         """
-        df = pl.read_csv(
-            source=self.file_path,
-            n_rows=0,
-            separator=self.delimiter,
-            quote_char=self.quote_char,
-            encoding=self.encoding.value,
-            has_header=self.has_header,
-        )
-        return df.columns
+        return list(self._header_columns())
+
+    def _header_columns(self, paths: Optional[list[Path]] = None) -> list[str]:
+        """
+        Gets the cached column names, parsing the header of the first file on a miss.
+
+        Parameters:
+            paths (Optional[list[Path]]): The files already expanded from `file_path` by
+                the caller, if any. Defaults to None, which expands it on a miss.
+
+        Returns:
+            list[str]: The column names; callers must not mutate the list.
+        """
+        cache_key = self._parse_options_key()
+        if self._columns_cache is not None and self._columns_cache[0] == cache_key:
+            return self._columns_cache[1]
+
+        if paths is None:
+            paths = self.file_paths
+        if self.encoding is EncodingType.UTF8:
+            columns = self._scan(paths).collect_schema().names()
+        else:
+            columns = pl.read_csv(**{**self._read_kwargs, "source": paths[0]}, n_rows=0).columns
+
+        self._columns_cache = (cache_key, columns)
+        return columns
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Iterable, Optional
+
+import polars as pl
 
 from quipus.utils import Connectable, DBConfig
 
@@ -65,3 +67,60 @@ class DataBaseSource(DataSource, Connectable):
         if not isinstance(value, bool):
             raise TypeError("The connected attribute must be a boolean.")
         self._connected = value
+
+    def _rows_to_frame(self, rows: list[tuple], columns: list[str]) -> pl.DataFrame:
+        """
+        Builds a Polars DataFrame from a batch of rows fetched by a database cursor.
+
+        The rows are transposed into one sequence per column and each column is built
+        in one go, which is faster than letting Polars ingest them row by row. Every
+        value of a column is used to infer its type, not only the first rows.
+
+        Parameters:
+            rows (list[tuple]): The rows, all with one value per column.
+            columns (list[str]): The column names.
+
+        Returns:
+            pl.DataFrame: The DataFrame holding the rows.
+        """
+        if not rows:
+            return pl.DataFrame(schema=columns)
+
+        return pl.DataFrame(
+            [pl.Series(name, values, strict=False) for name, values in zip(columns, zip(*rows))]
+        )
+
+    def _concat_batches(self, batches: Iterable[list[tuple]], columns: list[str]) -> pl.DataFrame:
+        """
+        Builds a single Polars DataFrame from consecutive batches of rows.
+
+        Each batch is converted as soon as it is fetched, so only one batch of Python
+        tuples is alive at a time.
+
+        Parameters:
+            batches (Iterable[list[tuple]]): The batches of rows, in result order.
+            columns (list[str]): The column names.
+
+        Returns:
+            pl.DataFrame: The DataFrame holding every row.
+        """
+        return self._concat_frames(
+            [self._rows_to_frame(rows, columns) for rows in batches], columns
+        )
+
+    def _concat_frames(self, frames: list[pl.DataFrame], columns: list[str]) -> pl.DataFrame:
+        """
+        Concatenates the DataFrames built from consecutive batches of rows.
+
+        Parameters:
+            frames (list[pl.DataFrame]): The DataFrames, in result order.
+            columns (list[str]): The column names, used when there are no frames.
+
+        Returns:
+            pl.DataFrame: The DataFrame holding every row.
+        """
+        if not frames:
+            return pl.DataFrame(schema=columns)
+
+        # A batch may infer a narrower type, e.g. Null when all its values are NULL.
+        return pl.concat(frames, how="vertical_relaxed")
@@ -1,17 +1,27 @@
+from abc import abstractmethod
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, override
+
+import polars as pl
 
 from quipus.utils import EncodingType
 
 from .data_source import DataSource
 
+_ENCODING_VALUES: frozenset[str] = frozenset(EncodingType.values())
+_GLOB_CHARS: frozenset[str] = frozenset("*?[")
+
 
 class FileSource(DataSource):
     """
     An abstract base class for file-based data sources.
 
+    Local files are read through memory mappings: the Polars scanners map them natively,
+    and subclasses map files themselves when they need to preprocess the raw bytes.
+
     Attributes:
-        file_path (Path): The path to the file.
+        file_path (Path): The path to the file, or a glob pattern in its file name matching
+            several files with the same layout.
         encoding (EncodingType): The encoding used for reading the file.
         has_header (bool): Indicates whether the file has a header row.
         columns (Optional[list[str]]): A list of column names to read from the file.
@@ -32,7 +42,8 @@ class FileSource(DataSource):
         Initializes a FileSource instance.
 
         Parameters:
-            file_path (Union[str, Path]): The path to the file.
+            file_path (Union[str, Path]): The path to the file, or a glob pattern in its file
+                name, e.g. "data/*.csv".
             encoding (Optional[EncodingType]): The encoding used for reading the file.
                 Defaults to "utf-8".
             has_header (bool): Indicates if the file has a header row. Defaults to True.
@@ -42,20 +53,42 @@ class FileSource(DataSource):
             date_columns (Optional[list[str]]): List of columns containing date values.
                 Defaults to None.
         """
-        self.file_path = Path(file_path)
+        self.file_path = file_path
         self.encoding = encoding
         self.has_header = has_header
         self.columns = columns
         self.read_options = read_options if read_options else {}
         self.date_columns = date_columns
 
+    @abstractmethod
+    def scan_data(self) -> pl.LazyFrame:
+        """
+        Abstract method to be overridden by subclasses to lazily scan the file.
+
+        Column selection must be applied to the returned plan, so that Polars only reads
+        the requested columns.
+
+        Returns:
+            pl.LazyFrame: The lazy query reading the file.
+        """
+
+    @override
+    def load_data(self) -> pl.DataFrame:
+        """
+        Loads data from the file into a Polars DataFrame by collecting `scan_data`.
+
+        Returns:
+            pl.DataFrame: The loaded data as a Polars DataFrame.
+        """
+        return self.scan_data().collect()
+
     @property
     def file_path(self) -> Path:
         """
-        Path: The path to the file.
+        Path: The path to the file, or a glob pattern in its file name.
 
-        Raises:
-            ValueError: If the provided file path does not point to an existing file.
+        The path is only checked when the file is first read, so creating many sources
+        doesn't touch the filesystem.
         """
         return self._file_path
 
@@ -65,17 +98,41 @@ class FileSource(DataSource):
         Sets the file path.
 
         Parameters:
-            value (Union[str, Path]): The path to the file.
+            value (Union[str, Path]): The path to the file, or a glob pattern in its file name.
+        """
+        path = value if isinstance(value, Path) else Path(value)
+        self._file_path = path
+        self._is_glob = not _GLOB_CHARS.isdisjoint(path.name)
+        self._validated = False
+
+    @property
+    def file_paths(self) -> list[Path]:
+        """
+        list[Path]: The files read by the source.
+
+        A glob pattern is expanded on every access, so files added since the source was
+        created are included. Matches are sorted by name, which sets the row order.
 
         Raises:
-            ValueError: If the file path does not point to an existing file.
+            ValueError: If the file path does not point to an existing file, or the pattern
+                doesn't match any file.
         """
-        path = Path(value)
-        if not path.is_file():
+        if not self._is_glob:
+            if not self._validated:
+                if not self._file_path.is_file():
+                    raise ValueError(
+                        f"Invalid file path: {self._file_path}. "
+                        "The path must point to an existing file."
+                    )
+                self._validated = True
+            return [self._file_path]
+
+        paths = sorted(p for p in self._file_path.parent.glob(self._file_path.name) if p.is_file())
+        if not paths:
             raise ValueError(
-                f"Invalid file path: {value}. The path must point to an existing file."
+                f"Invalid file path: {self._file_path}. The pattern must match at least one file."
             )
-        self._file_path = path
+        return paths
 
     @property
     def encoding(self) -> EncodingType:
@@ -100,7 +157,7 @@ class FileSource(DataSource):
             TypeError: If the type is incorrect.
         """
         if isinstance(value, str):
-            if value not in EncodingType:
+            if value not in _ENCODING_VALUES:
                 raise ValueError(
                     f"Unsupported encoding: {value}. Must be one of {EncodingType.values()}."
                 )
@@ -113,6 +170,18 @@ class FileSource(DataSource):
 
         self._encoding = value
 
+    @property
+    def _polars_encoding(self) -> str:
+        """
+        str: The encoding name expected by the Polars readers.
+
+        Polars only decodes "utf8" natively; any other name makes it transcode the
+        whole file in Python before parsing.
+        """
+        if self.encoding is EncodingType.UTF8:
+            return "utf8"
+        return self.encoding.value
+
     @property
     def has_header(self) -> bool:
         """
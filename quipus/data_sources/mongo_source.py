@@ -1,4 +1,8 @@
-from typing import Optional, override
+import threading
+import time
+from itertools import islice
+from typing import Any, Callable, Optional, override
+from urllib.parse import quote_plus, urlsplit
 
 import polars as pl
 from pymongo import MongoClient
@@ -8,6 +12,32 @@ from quipus.utils import DBConfig
 
 from .database_source import DataBaseSource
 
+# Setter validation rules: expected type, extra check on the value and error message.
+_VALIDATORS: dict[str, tuple[type, Optional[Callable[[Any], bool]], str]] = {
+    "collection_name": (
+        str,
+        str.strip,
+        "The collection name must be a non-empty string.",
+    ),
+    "query": (dict, None, "The query must be a dictionary."),
+}
+
+
+def _validate(name: str, value: Any) -> None:
+    """
+    Validates a value assigned to an attribute listed in `_VALIDATORS`.
+
+    Parameters:
+        name (str): The name of the attribute.
+        value (Any): The value to validate.
+
+    Raises:
+        ValueError: If the value has the wrong type or fails the extra check.
+    """
+    expected_type, check, message = _VALIDATORS[name]
+    if not isinstance(value, expected_type) or (check is not None and not check(value)):
+        raise ValueError(message)
+
 
 class MongoDBSource(DataBaseSource):
     """
@@ -19,8 +49,30 @@ class MongoDBSource(DataBaseSource):
           database.
         collection_name (str): The name of the collection to query.
         query (dict): The query to be executed on the collection.
+        columns (Optional[list[str]]): The fields to retrieve from each document.
+        use_pymongoarrow (bool): Whether `load_data` decodes documents with PyMongoArrow.
     """
 
+    # Number of documents fetched per round trip and converted to a DataFrame at a time.
+    BATCH_SIZE: int = 10_000
+    # Number of random documents whose fields are merged by `get_columns`.
+    SCHEMA_SAMPLE_SIZE: int = 64
+    # Minimum time between two pings sent by `connect`; MongoClient monitors servers itself.
+    PING_INTERVAL_NS: int = 30_000_000_000
+    # Idle pooled sockets are closed after this many milliseconds.
+    MAX_IDLE_TIME_MS: int = 60_000
+
+    # Connection string layout; missing parts are filled with empty strings.
+    _CONNECTION_STRING_FORMAT: str = "%s://%s%s%s/%s"
+    # URI scheme, indexed by whether the '+srv' scheme is used.
+    _SCHEMES: tuple[str, str] = ("mongodb", "mongodb+srv")
+
+    # Clients shared by every instance with the same connection string and pool sizes,
+    # together with the number of instances using each of them.
+    _client_cache: dict[tuple, MongoClient] = {}
+    _client_refs: dict[tuple, int] = {}
+    _client_lock = threading.Lock()
+
     def __init__(
         self,
         collection_name: str,
@@ -28,6 +80,8 @@ class MongoDBSource(DataBaseSource):
         connection_string: Optional[str] = None,
         db_config: Optional[DBConfig] = None,
         use_srv: Optional[bool] = False,
+        columns: Optional[list[str]] = None,
+        use_pymongoarrow: bool = False,
     ):
         """
         Initializes a MongoDBSource instance with the specified parameters.
@@ -41,6 +95,10 @@ class MongoDBSource(DataBaseSource):
               the connection string. Defaults to None.
             use_srv (Optional[bool]): Whether to use the '+srv' scheme for MongoDB.
               Defaults to False.
+            columns (Optional[list[str]]): The fields to retrieve. Filtering happens on
+              the server. Defaults to None, which retrieves every field.
+            use_pymongoarrow (bool): Whether `load_data` decodes documents with PyMongoArrow,
+              which builds Arrow columns straight from BSON. Defaults to False.
 
         Raises:
             ValueError: If neither db_config nor connection_string is provided.
@@ -53,13 +111,18 @@ class MongoDBSource(DataBaseSource):
             connection_string = self._build_connection_string(db_config, use_srv)
 
         if not db_config and connection_string:
-            self.db_config.database = connection_string.split("/")[-1]
+            db_config = DBConfig(database=urlsplit(connection_string).path.lstrip("/"))
 
         super().__init__(connection_string=connection_string, db_config=db_config)
         self.collection_name = collection_name
-        self.query = query
+        self.query = query if query is not None else {}
+        self.columns = columns
+        self.use_pymongoarrow = use_pymongoarrow
+        self._columns_cache: dict[str, list[str]] = {}
         self._client = None
+        self._client_key: Optional[tuple] = None
         self._database = None
+        self._last_ping_ns: Optional[int] = None
         self.connected = False
 
     @property
@@ -83,10 +146,74 @@ class MongoDBSource(DataBaseSource):
         Raises:
             ValueError: If the provided query is not a dictionary.
         """
-        if not isinstance(value, dict):
-            raise ValueError("The query must be a dictionary.")
+        _validate("query", value)
         self._query = value
 
+    @property
+    def columns(self) -> Optional[list[str]]:
+        """
+        Optional[list[str]]: The fields to retrieve from each document.
+
+        Raises:
+            TypeError: If any field name is not a string.
+        """
+        return self._columns
+
+    @columns.setter
+    def columns(self, value: Optional[list[str]]) -> None:
+        """
+        Sets the fields to retrieve from each document.
+
+        Parameters:
+            value (Optional[list[str]]): List of field names.
+
+        Raises:
+            ValueError: If columns is empty.
+            TypeError: If any field name is not a string or columns is not a list.
+        """
+        if value is None:
+            self._columns = value
+            return
+
+        if not isinstance(value, list):
+            raise TypeError("columns must be a list of field names.")
+
+        if not value:
+            raise ValueError("columns cannot be empty.")
+
+        if not all(isinstance(col, str) for col in value):
+            raise TypeError("All field names must be strings.")
+
+        self._columns = value
+
+    @property
+    def use_pymongoarrow(self) -> bool:
+        """
+        bool: Whether `load_data` decodes documents with PyMongoArrow.
+
+        PyMongoArrow decodes BSON in C straight into Arrow columns, skipping the Python
+        dictionaries built by PyMongo. It must be installed separately.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        return self._use_pymongoarrow
+
+    @use_pymongoarrow.setter
+    def use_pymongoarrow(self, value: bool) -> None:
+        """
+        Sets whether `load_data` decodes documents with PyMongoArrow.
+
+        Parameters:
+            value (bool): Boolean indicating if PyMongoArrow is used.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        if not isinstance(value, bool):
+            raise TypeError("use_pymongoarrow must be a boolean value.")
+        self._use_pymongoarrow = value
+
     @property
     def collection_name(self) -> str:
         """
@@ -108,16 +235,17 @@ class MongoDBSource(DataBaseSource):
         Raises:
             ValueError: If the collection name is not a string or is empty.
         """
-        if not isinstance(value, str) or not value.strip():
-            raise ValueError("The collection name must be a non-empty string.")
+        _validate("collection_name", value)
         self._collection_name = value
 
     @override
     def initialize_pool(self, min_connections: int = 1, max_connections: int = 10):
         """
-        Initializes the connection pool for MongoDB by creating a MongoClient instance.
+        Initializes the connection pool for MongoDB by getting a MongoClient instance.
 
         MongoDB handles connection pooling automatically, this method only initializes the client.
+        Instances with the same connection string and pool sizes share a single client, so
+        they share its connections too. Calling it again once initialized does nothing.
 
         Parameters:
             min_connections (int): The minimum number of connections in the pool. Defaults to 1.
@@ -126,23 +254,59 @@ class MongoDBSource(DataBaseSource):
         Raises:
             ConnectionError: If the client fails to connect to MongoDB.
         """
+        if self._client:
+            return
+
+        key = (self.connection_string, min_connections, max_connections)
+        cls = type(self)
+        with cls._client_lock:
+            client = cls._client_cache.get(key)
+            if client is None:
+                client = MongoClient(
+                    self.connection_string,
+                    minPoolSize=min_connections,
+                    maxPoolSize=max_connections,
+                    maxIdleTimeMS=self.MAX_IDLE_TIME_MS,
+                )
+                cls._client_cache[key] = client
+            cls._client_refs[key] = cls._client_refs.get(key, 0) + 1
+
+        self._client = client
+        self._client_key = key
         try:
-            self._client = MongoClient(
-                self.connection_string,
-                minPoolSize=min_connections,
-                maxPoolSize=max_connections,
-            )
-            self._client.admin.command("ping")
+            self.__ping()
             self._database = self._client[self.db_config.database]
 
         except ConnectionFailure as e:
+            self.__release_client()
             raise ConnectionError(f"Failed to connect to MongoDB: {e}") from e
 
+    def __release_client(self) -> None:
+        """
+        Stops using the client, closing it once no other instance shares it.
+        """
+        key = self._client_key
+        cls = type(self)
+        if key is None:
+            self._client.close()
+        else:
+            with cls._client_lock:
+                cls._client_refs[key] -= 1
+                if cls._client_refs[key] == 0:
+                    del cls._client_refs[key]
+                    cls._client_cache.pop(key).close()
+
+        self._client = None
+        self._client_key = None
+
     @override
     def connect(self):
         """
         Establishes a connection to the MongoDB database and sets the connected status.
 
+        The server is only pinged when it wasn't reached in the last `PING_INTERVAL_NS`,
+        so reconnecting a recently used source doesn't cost a round trip.
+
         Raises:
             ConnectionError: If an error occurs while trying to connect to the database.
         """
@@ -153,23 +317,38 @@ class MongoDBSource(DataBaseSource):
             self._database = self._client[self.db_config.database]
 
         try:
-            self._client.admin.command("ping")
+            if (
+                self._last_ping_ns is None
+                or time.monotonic_ns() - self._last_ping_ns > self.PING_INTERVAL_NS
+            ):
+                self.__ping()
             self.connected = True
         except Exception as e:
             self.connected = False
             raise ConnectionError("Failed to connect to the MongoDB database.") from e
 
+    def __ping(self) -> None:
+        """
+        Pings the server and records when it was last reached.
+        """
+        self._client.admin.command("ping")
+        self._last_ping_ns = time.monotonic_ns()
+
     @override
     def disconnect(self):
         """
-        Closes the MongoDB client connection and sets the connection status to False.
+        Releases the MongoDB client and sets the connection status to False.
+
+        The client is closed once no other instance shares it.
 
         Raises:
             RuntimeError: If the MongoDB client is not initialized.
         """
         if not self._client:
             raise RuntimeError("MongoDB client not initialized.")
-        self._client.close()
+        self.__release_client()
+        self._columns_cache.clear()
+        self._last_ping_ns = None
         self.connected = False
 
     @override
@@ -177,6 +356,10 @@ class MongoDBSource(DataBaseSource):
         """
         Loads data from the specified MongoDB collection based on the query.
 
+        The query and the field selection run on the server as an aggregation pipeline,
+        so only the requested fields are transferred. Documents are converted in batches
+        of `BATCH_SIZE`, so only one batch is held as Python objects at a time.
+
         Returns:
             pl.DataFrame: A Polars DataFrame containing the query results.
 
@@ -188,15 +371,60 @@ class MongoDBSource(DataBaseSource):
             raise ConnectionError("Not connected to the MongoDB database.")
 
         collection = self._database[self.collection_name]
-        result_cursor = collection.find(self.query)
+        pipeline: list[dict] = [{"$match": self.query}]
+        if self.columns:
+            projection = {column: 1 for column in self.columns}
+            if "_id" not in projection:
+                projection["_id"] = 0
+            pipeline.append({"$project": projection})
+
+        if self.use_pymongoarrow:
+            return self.__aggregate_polars(collection, pipeline)
+
+        cursor = collection.aggregate(pipeline, batchSize=self.BATCH_SIZE)
+
+        frames = []
+        while batch := list(islice(cursor, self.BATCH_SIZE)):
+            frames.append(self.to_polars_df(batch))
+
+        if not frames:
+            return pl.DataFrame()
 
-        result = list(result_cursor)
-        return self.to_polars_df(result) if result else pl.DataFrame()
+        # Batches may infer different types or miss sparse fields; align them on concat.
+        return pl.concat(frames, how="diagonal_relaxed")
+
+    def __aggregate_polars(self, collection, pipeline: list[dict]) -> pl.DataFrame:
+        """
+        Runs the aggregation pipeline through PyMongoArrow.
+
+        Parameters:
+            collection (Collection): The collection to query.
+            pipeline (list[dict]): The aggregation pipeline.
+
+        Returns:
+            pl.DataFrame: A Polars DataFrame containing the query results.
+
+        Raises:
+            ImportError: If PyMongoArrow is not installed.
+        """
+        try:
+            from pymongoarrow.api import aggregate_polars_all
+        except ImportError as e:
+            raise ImportError(
+                "use_pymongoarrow requires PyMongoArrow. "
+                "Install it with 'pip install pymongoarrow'."
+            ) from e
+
+        return aggregate_polars_all(collection, pipeline, batchSize=self.BATCH_SIZE)
 
     @override
     def get_columns(self, *args, **kwargs) -> list[str]:
         """
-        Retrieves the list of fields from the first document in the specified MongoDB collection.
+        Retrieves the list of fields in the specified MongoDB collection.
+
+        The fields are merged from a random sample of `SCHEMA_SAMPLE_SIZE` documents, so
+        fields missing from some documents are still found. They are listed in order of
+        first appearance and cached per collection until the source disconnects.
 
         Parameters:
             table_name (str): The name of the collection.
@@ -216,18 +444,28 @@ class MongoDBSource(DataBaseSource):
         if not table_name:
             raise ValueError("Table name must be provided.")
 
-        collection = self._database[table_name]
-        document = collection.find_one()
+        if table_name not in self._columns_cache:
+            collection = self._database[table_name]
+            documents = collection.aggregate([{"$sample": {"size": self.SCHEMA_SAMPLE_SIZE}}])
+
+            fields: dict[str, None] = {}
+            for document in documents:
+                fields.update(dict.fromkeys(document))
 
-        if not document:
-            raise ValueError(f"Collection '{table_name}' is empty or does not exist.")
+            if not fields:
+                raise ValueError(f"Collection '{table_name}' is empty or does not exist.")
 
-        return list(document.keys())
+            self._columns_cache[table_name] = list(fields)
+
+        return list(self._columns_cache[table_name])
 
     def _build_connection_string(self, db_config: DBConfig, use_srv: bool) -> str:
         """
         Constructs a MongoDB connection string based on the provided configuration.
 
+        Credentials are percent-encoded, so they may contain characters such as '@' or
+        ':'. Parts missing from the configuration are left out.
+
         Parameters:
             db_config (DBConfig): The database configuration object.
             use_srv (bool): Whether to use the '+srv' scheme for MongoDB.
@@ -235,14 +473,18 @@ class MongoDBSource(DataBaseSource):
         Returns:
             str: The constructed connection string.
         """
-        scheme = "mongodb+srv" if use_srv else "mongodb"
-        if use_srv:
-            return (
-                f"{scheme}://{db_config.user}:{db_config.password}@"
-                f"{db_config.host}/{db_config.database}"
-            )
-
-        return (
-            f"{scheme}://{db_config.user}:{db_config.password}@"
-            f"{db_config.host}:{db_config.port}/{db_config.database}"
+        credentials = (
+            f"{quote_plus(db_config.user)}:{quote_plus(db_config.password or '')}@"
+            if db_config.user
+            else ""
+        )
+        # SRV records provide the port, so it can't be part of the host.
+        port = f":{db_config.port}" if db_config.port and not use_srv else ""
+
+        return self._CONNECTION_STRING_FORMAT % (
+            self._SCHEMES[bool(use_srv)],
+            credentials,
+            db_config.host,
+            port,
+            db_config.database or "",
         )
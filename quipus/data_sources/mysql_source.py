@@ -1,5 +1,9 @@
+import os
+from collections import deque
+from contextlib import suppress
 from typing import Optional, override
 
+import mysql.connector
 import polars as pl
 from mysql.connector import Error, pooling
 
@@ -15,12 +19,26 @@ class MySQLSource(DataBaseSource):
 
     Attributes:
         query (str): The SQL query to be executed on the database.
+        use_connectorx (bool): Whether `load_data` reads through ConnectorX.
+        partition_on (Optional[str]): The numeric column ConnectorX splits the query on.
+        reset_session (bool): Whether pooled connections reset their session when released.
     """
 
+    # Number of rows fetched and converted to a DataFrame at a time.
+    BATCH_SIZE: int = 50_000
+    # Unlike SHOW COLUMNS, it takes no metadata lock on the table and accepts parameters.
+    _COLUMNS_QUERY: str = (
+        "SELECT COLUMN_NAME FROM information_schema.columns "
+        "WHERE table_schema = DATABASE() AND table_name = %s ORDER BY ORDINAL_POSITION"
+    )
+
     def __init__(
         self,
         query: str,
         db_config: Optional[DBConfig] = None,
+        use_connectorx: bool = False,
+        partition_on: Optional[str] = None,
+        reset_session: bool = False,
     ):
         """
         Initializes a MySQLSource instance with a query and optional connection details.
@@ -29,13 +47,30 @@ class MySQLSource(DataBaseSource):
             query (str): The SQL query to execute.
             db_config (Optional[DBConfig]): A DBConfig instance for constructing
                 the connection string. Defaults to None.
+            use_connectorx (bool): Whether `load_data` reads through ConnectorX, which
+                decodes rows straight into Arrow memory. Defaults to False.
+            partition_on (Optional[str]): A numeric column of the query result used by
+                ConnectorX to split the query into ranges fetched in parallel, one per CPU.
+                Defaults to None, which fetches the result over a single connection.
+            reset_session (bool): Whether pooled connections reset their session state,
+                such as variables and temporary tables, when returned to the pool.
+                Defaults to False.
 
         Raises:
             ValueError: If the query is not a valid string.
         """
-        super().__init__(db_config)
+        super().__init__(db_config=db_config)
         self._connection = None
+        self._connection_pool = None
+        # Connection arguments when connections are opened directly instead of through a pool.
+        self._direct_connection_kwargs: Optional[dict] = None
+        # Connections kept checked out after `disconnect`, reused first by `connect`.
+        self._hot_connections: deque = deque(maxlen=1)
+        self._columns_cache: dict[str, list[str]] = {}
         self.query = query
+        self.use_connectorx = use_connectorx
+        self.partition_on = partition_on
+        self.reset_session = reset_session
         self.connected = False
 
     @property
@@ -63,24 +98,128 @@ class MySQLSource(DataBaseSource):
             raise ValueError("The query must be a non-empty string.")
         self._query = value
 
+    @property
+    def use_connectorx(self) -> bool:
+        """
+        bool: Whether `load_data` reads through ConnectorX.
+
+        ConnectorX decodes the result set in Rust straight into Arrow memory, skipping
+        the Python objects built by the connector. It opens its own connection, so no
+        call to `connect` is needed. ConnectorX must be installed separately.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        return self._use_connectorx
+
+    @use_connectorx.setter
+    def use_connectorx(self, value: bool) -> None:
+        """
+        Sets whether `load_data` reads through ConnectorX.
+
+        Parameters:
+            value (bool): Boolean indicating if ConnectorX is used.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        if not isinstance(value, bool):
+            raise TypeError("use_connectorx must be a boolean value.")
+        self._use_connectorx = value
+
+    @property
+    def partition_on(self) -> Optional[str]:
+        """
+        Optional[str]: The numeric column ConnectorX splits the query on.
+
+        Only used together with `use_connectorx`.
+
+        Raises:
+            TypeError: If the value is not a string.
+        """
+        return self._partition_on
+
+    @partition_on.setter
+    def partition_on(self, value: Optional[str]) -> None:
+        """
+        Sets the numeric column ConnectorX splits the query on.
+
+        Parameters:
+            value (Optional[str]): The column name, or None to disable partitioning.
+
+        Raises:
+            TypeError: If the value is not a string.
+        """
+        if value is not None and not isinstance(value, str):
+            raise TypeError("partition_on must be a column name.")
+        self._partition_on = value
+
+    @property
+    def reset_session(self) -> bool:
+        """
+        bool: Whether pooled connections reset their session when released.
+
+        The reset costs a round trip to the server on every release. Read-only queries
+        leave no session state behind, so it is skipped unless enabled. It must be set
+        before `initialize_pool` is called.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        return self._reset_session
+
+    @reset_session.setter
+    def reset_session(self, value: bool) -> None:
+        """
+        Sets whether pooled connections reset their session when released.
+
+        Parameters:
+            value (bool): Boolean indicating if sessions are reset.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        if not isinstance(value, bool):
+            raise TypeError("reset_session must be a boolean value.")
+        self._reset_session = value
+
     @override
     def initialize_pool(self, min_connections: int = 1, max_connections: int = 10):
         """
         Initializes the connection pool for MySQL.
 
+        Up to `min_connections` released connections are kept by the instance instead of
+        being returned to the pool, so reconnecting skips the pool, its lock and the
+        session reset. With a single connection, no pool is created: the connection is
+        opened directly on first use and kept.
+
         Parameters:
             min_connections (int): The minimum number of connections in the pool. Defaults to 1.
             max_connections (int): The maximum number of connections in the pool. Defaults to 10.
         """
-        self._connection_pool = pooling.MySQLConnectionPool(
-            pool_size=max_connections,
-            pool_reset_session=True,
-            user=self.db_config.user,
-            password=self.db_config.password,
-            host=self.db_config.host,
-            port=self.db_config.port,
-            database=self.db_config.database,
-        )
+        # Kept connections belong to the previous pool, so they are handed back to it.
+        self.__release_hot_connections()
+        connection_kwargs = {
+            # Decode the protocol with the C extension rather than the pure Python parser.
+            "use_pure": False,
+            "connection_timeout": 10,
+            "user": self.db_config.user,
+            "password": self.db_config.password,
+            "host": self.db_config.host,
+            "port": self.db_config.port,
+            "database": self.db_config.database,
+        }
+        if min_connections == max_connections == 1:
+            self._connection_pool = None
+            self._direct_connection_kwargs = connection_kwargs
+        else:
+            self._connection_pool = pooling.MySQLConnectionPool(
+                pool_size=max_connections,
+                pool_reset_session=self.reset_session,
+                **connection_kwargs,
+            )
+            self._direct_connection_kwargs = None
+        self._hot_connections = deque(maxlen=min_connections)
 
     @override
     def connect(self) -> None:
@@ -90,12 +229,17 @@ class MySQLSource(DataBaseSource):
         Raises:
             RuntimeError: If an error occurs while trying to connect to the database.
         """
-        if not hasattr(self, "_connection_pool") or self._connection_pool is None:
+        if self._connection_pool is None and self._direct_connection_kwargs is None:
             self.initialize_pool()
 
         if not self._connection:
             try:
-                self._connection = self._connection_pool.get_connection()
+                if self._hot_connections:
+                    self._connection = self._hot_connections.pop()
+                elif self._direct_connection_kwargs is not None:
+                    self._connection = mysql.connector.connect(**self._direct_connection_kwargs)
+                else:
+                    self._connection = self._connection_pool.get_connection()
                 self.connected = True
             except Error as e:
                 raise ConnectionError(f"Error connecting to the database: {e}") from e
@@ -103,7 +247,10 @@ class MySQLSource(DataBaseSource):
     @override
     def disconnect(self):
         """
-        Closes the current connection and sets the connected status to False.
+        Releases the current connection and sets the connected status to False.
+
+        The connection is kept for the next `connect` while fewer than `min_connections`
+        are kept, and returned to the pool otherwise.
 
         Raises:
             ConnectionError: If there is no active connection or an error occurs
@@ -113,17 +260,54 @@ class MySQLSource(DataBaseSource):
             raise ConnectionError("No active connection to disconnect.")
 
         try:
-            self._connection.close()
+            if len(self._hot_connections) < self._hot_connections.maxlen:
+                self._hot_connections.append(self._connection)
+            else:
+                # Closing a pooled connection returns it to the pool instead.
+                self._connection.close()
+            self._connection = None
+            self._columns_cache.clear()
             self.connected = False
         except Error as e:
             raise ConnectionError(f"Error disconnecting from the database: {e}") from e
 
+    def close(self) -> None:
+        """
+        Releases every connection held by the instance and drops the connection pool.
+
+        The active connection, if any, is released as in `disconnect`. The connections
+        kept for reuse are returned to the pool, or closed if opened directly. A later
+        `connect` initializes a new pool.
+        """
+        if self._connection:
+            self.disconnect()
+        self.__release_hot_connections()
+        self._connection_pool = None
+        self._direct_connection_kwargs = None
+
+    def __release_hot_connections(self) -> None:
+        """
+        Releases the connections kept for reuse by `connect`.
+
+        Raises:
+            ConnectionError: If an error occurs while releasing a connection.
+        """
+        try:
+            while self._hot_connections:
+                # Closing a pooled connection returns it to the pool instead.
+                self._hot_connections.pop().close()
+        except Error as e:
+            raise ConnectionError(f"Error disconnecting from the database: {e}") from e
+
     @override
     def load_data(self) -> pl.DataFrame:
         """
         Executes the configured SQL query and loads the data from the MySQL database
         into a Polars DataFrame.
 
+        Rows are streamed from the server with an unbuffered cursor and converted in
+        batches of `BATCH_SIZE`, so the full result is never held as Python tuples.
+
         Returns:
             pl.DataFrame: A DataFrame containing the query result.
 
@@ -131,24 +315,75 @@ class MySQLSource(DataBaseSource):
             ConnectionError: If not connected to the database.
             RuntimeError: If an error occurs during query execution.
         """
+        if self.use_connectorx:
+            return self._load_data_with_connectorx()
+
         if not self.connected or not self._connection:
             raise ConnectionError("Not connected to the MySQL database.")
 
         try:
-            cursor = self._connection.cursor()
-            cursor.execute(self.query)
-            result = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
+            cursor = self._connection.cursor(buffered=False)
+            try:
+                cursor.execute(self.query)
+                columns = [desc[0] for desc in cursor.description]
+
+                batches = iter(lambda: cursor.fetchmany(self.BATCH_SIZE), [])
+                data = self._concat_batches(batches, columns)
+            except BaseException:
+                # Rows left unread would make the next query on this connection fail.
+                with suppress(Error):
+                    if self._connection.unread_result:
+                        self._connection.consume_results()
+                    cursor.close()
+                raise
             cursor.close()
-            return self.to_polars_df(result, columns)
         except Error as e:
             raise RuntimeError(f"Error executing query: {e}") from e
 
+        return data
+
+    def _load_data_with_connectorx(self) -> pl.DataFrame:
+        """
+        Executes the configured SQL query through ConnectorX.
+
+        When `partition_on` is set, the query is split into one range of that column per
+        CPU, each fetched over its own connection.
+
+        Returns:
+            pl.DataFrame: A DataFrame containing the query result.
+
+        Raises:
+            ImportError: If ConnectorX is not installed.
+            ValueError: If no DBConfig was provided.
+        """
+        try:
+            import connectorx as cx
+        except ImportError as e:
+            raise ImportError(
+                "use_connectorx requires ConnectorX. Install it with 'pip install connectorx'."
+            ) from e
+
+        if self.db_config is None:
+            raise ValueError("A DBConfig is required to connect through ConnectorX.")
+
+        uri = self.db_config.mysql_uri
+        if self.partition_on is None:
+            return cx.read_sql(uri, self.query, return_type="polars")
+        return cx.read_sql(
+            uri,
+            self.query,
+            return_type="polars",
+            partition_on=self.partition_on,
+            partition_num=os.cpu_count() or 1,
+        )
+
     @override
     def get_columns(self, *args, **kwargs) -> list[str]:
         """
         Retrieves the list of columns from a specified table in the MySQL database.
 
+        The columns of each table are cached until the source disconnects.
+
         Parameters:
             table_name (str): The name of the table to retrieve column names from.
 
@@ -157,6 +392,7 @@ class MySQLSource(DataBaseSource):
 
         Raises:
             ConnectionError: If not connected to the database.
+            ValueError: If the table name is not provided or the table does not exist.
             RuntimeError: If an error occurs during retrieval.
         """
         if not self.connected or not self._connection:
@@ -166,12 +402,18 @@ class MySQLSource(DataBaseSource):
         if not table_name:
             raise ValueError("Table name must be provided.")
 
-        query = f"SHOW COLUMNS FROM {table_name}"
-        try:
-            cursor = self._connection.cursor()
-            cursor.execute(query)
-            columns = [row[0] for row in cursor.fetchall()]
-            cursor.close()
-            return columns
-        except Error as e:
-            raise RuntimeError(f"Error retrieving columns: {e}") from e
+        if table_name not in self._columns_cache:
+            try:
+                cursor = self._connection.cursor(prepared=True)
+                cursor.execute(self._COLUMNS_QUERY, (table_name,))
+                columns = [row[0] for row in cursor.fetchall()]
+                cursor.close()
+            except Error as e:
+                raise RuntimeError(f"Error retrieving columns: {e}") from e
+
+            if not columns:
+                raise ValueError(f"Table '{table_name}' does not exist.")
+
+            self._columns_cache[table_name] = columns
+
+        return list(self._columns_cache[table_name])
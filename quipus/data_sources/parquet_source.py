@@ -1,10 +1,16 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, Union, override
+from typing import Any, Iterator, Optional, Union, override
 
 import polars as pl
 
 from .file_source import FileSource
 
+# Options of `pl.read_parquet` that `pl.scan_parquet` doesn't accept.
+_EAGER_READ_OPTIONS: frozenset[str] = frozenset({"use_pyarrow", "pyarrow_options", "memory_map"})
+
 
 class ParquetSource(FileSource):
     """
@@ -14,59 +20,282 @@ class ParquetSource(FileSource):
         FileSource: Base class for handling file sources.
 
     Attributes:
-        file_path (Union[str, Path]): The path to the Parquet file.
+        file_path (Union[str, Path, bytes, io.BytesIO]): The path to the Parquet file, a glob
+            pattern matching several Parquet files with the same schema, or the content of a
+            Parquet file already in memory.
         columns (Optional[list[str]]): Specific columns to read from the file.
         read_options (Optional[dict[str, Any]]): Additional options for reading the file.
+        row_filter (Optional[pl.Expr]): A predicate selecting the rows to load.
+        readahead (bool): Whether the kernel is asked to prefetch whole files before reads.
     """
 
     def __init__(
         self,
-        file_path: Union[str, Path],
+        file_path: Union[str, Path, bytes, io.BytesIO],
         columns: Optional[list[str]] = None,
         read_options: Optional[dict[str, Any]] = None,
+        row_filter: Optional[pl.Expr] = None,
+        readahead: bool = False,
     ):
         """
         Initializes a ParquetSource instance with the specified parameters.
 
         Parameters:
-            file_path (Union[str, Path]): The path to the Parquet file.
+            file_path (Union[str, Path, bytes, io.BytesIO]): The path to the Parquet file, a
+                glob pattern in its file name, e.g. "exports/*.parquet", or the content of a
+                Parquet file already in memory, e.g. an HTTP response body.
             columns (Optional[list[str]]): Columns to be read from the file.
                 Defaults to None, which reads all columns.
             read_options (Optional[dict[str, Any]]): Additional options for reading
                 the file, passed directly to the Polars reader. Defaults to None.
+            row_filter (Optional[pl.Expr]): A predicate selecting the rows to load, e.g.
+                `pl.col("country") == "PE"`. Defaults to None, which loads every row.
+            readahead (bool): Whether the kernel is asked to prefetch whole files into the
+                page cache before they are read. Defaults to False.
         """
         super().__init__(
             file_path=file_path,
             columns=columns,
             read_options=read_options,
         )
+        self.row_filter = row_filter
+        self.readahead = readahead
+        self._columns_cache: Optional[tuple[tuple, list[str]]] = None
+
+    @property
+    def file_path(self) -> Union[Path, bytes, io.BytesIO]:
+        """
+        Union[Path, bytes, io.BytesIO]: The path to the Parquet file, a glob pattern in its
+        file name, or the in-memory content of a Parquet file.
+
+        In-memory content is read in place, without being written to disk, and must not
+        be modified while the source uses it.
+        """
+        if self._buffer is not None:
+            return self._buffer
+        return self._file_path
+
+    @file_path.setter
+    def file_path(self, value: Union[str, Path, bytes, io.BytesIO]) -> None:
+        """
+        Sets the file path or the in-memory content of the Parquet file.
+
+        Parameters:
+            value (Union[str, Path, bytes, io.BytesIO]): The path to the Parquet file, a glob
+                pattern in its file name, or the content of a Parquet file.
+        """
+        if isinstance(value, (bytes, io.BytesIO)):
+            self._buffer = value
+            return
+        self._buffer = None
+        FileSource.file_path.fset(self, value)
+
+    @property
+    def _sources(self) -> list[Union[Path, bytes, io.BytesIO]]:
+        """
+        list[Union[Path, bytes, io.BytesIO]]: The files or in-memory content to read.
+        """
+        if self._buffer is not None:
+            return [self._buffer]
+        return self.file_paths
+
+    @property
+    def row_filter(self) -> Optional[pl.Expr]:
+        """
+        Optional[pl.Expr]: A predicate selecting the rows to load.
+
+        The predicate is pushed down into the Parquet reader, which skips the row groups
+        whose min/max statistics can't match it. Columns it refers to don't need to be
+        in `columns`.
+
+        Raises:
+            TypeError: If the value is not a Polars expression.
+        """
+        return self._row_filter
+
+    @row_filter.setter
+    def row_filter(self, value: Optional[pl.Expr]) -> None:
+        """
+        Sets the predicate selecting the rows to load.
+
+        Parameters:
+            value (Optional[pl.Expr]): The predicate, or None to load every row.
+
+        Raises:
+            TypeError: If the value is not a Polars expression.
+        """
+        if value is not None and not isinstance(value, pl.Expr):
+            raise TypeError("row_filter must be a Polars expression.")
+        self._row_filter = value
+
+    @property
+    def readahead(self) -> bool:
+        """
+        bool: Whether the kernel is asked to prefetch whole files before reads.
+
+        The kernel reads the files asynchronously with deep I/O queues while Polars
+        parses the footers, which pays off when most of a cold file is read, e.g. from
+        a network or spinning disk. It is ignored where `os.posix_fadvise` is missing,
+        such as on Windows and macOS, and for in-memory content.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        return self._readahead
+
+    @readahead.setter
+    def readahead(self, value: bool) -> None:
+        """
+        Sets whether the kernel is asked to prefetch whole files before reads.
+
+        Parameters:
+            value (bool): Boolean indicating if files are prefetched.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        if not isinstance(value, bool):
+            raise TypeError("readahead must be a boolean value.")
+        self._readahead = value
+
+    def _advise_readahead(self, sources: list[Union[Path, bytes, io.BytesIO]]) -> None:
+        """
+        Asks the kernel to start reading the files into the page cache, if `readahead` is set.
+
+        The call returns immediately; the reads continue in the background.
+
+        Parameters:
+            sources (list[Union[Path, bytes, io.BytesIO]]): The files about to be read.
+        """
+        if not self.readahead or self._buffer is not None or not hasattr(os, "posix_fadvise"):
+            return
+
+        for path in sources:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
 
     @override
-    def load_data(self) -> pl.DataFrame:
+    def scan_data(self) -> pl.LazyFrame:
+        """
+        Lazily scans the Parquet file, so only the selected columns and the row groups
+        needed by the query are read. The files matching a glob pattern are scanned as a
+        single query, read in parallel.
+
+        Filters added to the returned LazyFrame before collecting it are pushed down into
+        the reader like `row_filter`, so they also skip row groups.
+
+        Returns:
+            pl.LazyFrame: The lazy query reading the Parquet file.
         """
-        Loads data from the Parquet file into a Polars DataFrame.
+        sources = self._sources
+        self._advise_readahead(sources)
+        lazy_frame = self._scan(sources)
+        if self.row_filter is not None:
+            lazy_frame = lazy_frame.filter(self.row_filter)
+        if self.columns:
+            lazy_frame = lazy_frame.select(self.columns)
+        return lazy_frame
+
+    def _scan(self, sources: list[Union[Path, bytes, io.BytesIO]]) -> pl.LazyFrame:
+        """
+        Builds the lazy scan of the given sources with `read_options`.
+
+        Options only `pl.read_parquet` supports, such as `use_pyarrow`, can't be scanned,
+        so with any of them each source is read eagerly and wrapped in a LazyFrame.
+
+        Parameters:
+            sources (list[Union[Path, bytes, io.BytesIO]]): The files or in-memory content.
 
         Returns:
-            pl.DataFrame: A Polars DataFrame containing the data from the Parquet file.
+            pl.LazyFrame: The lazy query reading the sources.
+        """
+        if _EAGER_READ_OPTIONS.isdisjoint(self.read_options):
+            return pl.scan_parquet(source=sources, **self.read_options)
+        return pl.concat(
+            [pl.read_parquet(source=source, **self.read_options) for source in sources],
+            rechunk=False,
+        ).lazy()
+
+    def load_data_batched(self, batch_size: int = 100_000) -> Iterator[pl.DataFrame]:
+        """
+        Lazily loads the Parquet file in batches, so only a couple of batches are held in
+        memory at a time.
+
+        Each batch is a slice of the file read on its own, and Polars only decodes the row
+        groups overlapping it. The next batch is read in a background thread while the
+        current one is being processed. Slices are taken before `row_filter` is applied,
+        so batches may hold fewer rows than `batch_size`; empty ones are skipped.
+
+        Parameters:
+            batch_size (int): The number of rows read per batch. Defaults to 100_000.
+
+        Yields:
+            pl.DataFrame: Consecutive chunks of the Parquet file, in file order.
 
         Raises:
-            RuntimeError: If an error occurs while loading the data.
+            TypeError: If batch_size is not an integer.
+            ValueError: If batch_size is not positive.
         """
-        return pl.read_parquet(
-            source=self.file_path, columns=self.columns, **self.read_options
-        )
+        if not isinstance(batch_size, int):
+            raise TypeError("batch_size must be an integer value.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        # Polars releases the GIL while reading, so reading ahead overlaps with the caller.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            for query in self._batch_queries(batch_size):
+                future = executor.submit(query.collect)
+                if pending is not None and not (frame := pending.result()).is_empty():
+                    yield frame
+                pending = future
+            if pending is not None and not (frame := pending.result()).is_empty():
+                yield frame
+
+    def _batch_queries(self, batch_size: int) -> Iterator[pl.LazyFrame]:
+        """
+        Builds the lazy queries reading each batch of `load_data_batched`.
+
+        Parameters:
+            batch_size (int): The number of rows read per batch.
+
+        Yields:
+            pl.LazyFrame: The query reading the next batch, in file order.
+        """
+        for source in self._sources:
+            self._advise_readahead([source])
+            lazy_frame = self._scan([source])
+            # Answered from the footer, without reading any data page.
+            n_rows = lazy_frame.select(pl.len()).collect().item()
+            for offset in range(0, n_rows, batch_size):
+                batch = lazy_frame.slice(offset, batch_size)
+                if self.row_filter is not None:
+                    batch = batch.filter(self.row_filter)
+                if self.columns:
+                    batch = batch.select(self.columns)
+                yield batch
 
     @override
     def get_columns(self, *args, **kwargs) -> list[str]:
         """
         Retrieves the list of columns from the Parquet file.
 
+        Only the file metadata is read, and the result is cached until a file is modified,
+        the in-memory content is replaced, or the read options change.
+
         Returns:
             list[str]: A list of column names from the Parquet file.
         """
-        df = pl.read_parquet(
-            source=self.file_path,
-            n_rows=0,
-            **self.read_options,
-        )
-        return df.columns
+        sources = self._sources
+        if self._buffer is not None:
+            sources_key = (id(self._buffer),)
+        else:
+            sources_key = tuple((path, path.stat().st_mtime_ns) for path in sources)
+        cache_key = (sources_key, repr(self.read_options))
+        if self._columns_cache is None or self._columns_cache[0] != cache_key:
+            lazy_frame = self._scan(sources)
+            self._columns_cache = (cache_key, lazy_frame.collect_schema().names())
+        return list(self._columns_cache[1])
@@ -1,12 +1,21 @@
+import logging
+import os
+from collections import deque
+from itertools import islice
 from typing import Optional, override
 
 import polars as pl
+import psycopg
+from psycopg import sql
+from psycopg.conninfo import conninfo_to_dict
 from psycopg_pool import ConnectionPool
 
-from quipus.utils import DBConfig
+from quipus.utils import Connectable, DBConfig
 
 from .database_source import DataBaseSource
 
+logger = logging.getLogger(__name__)
+
 
 class PostgreSQLSource(DataBaseSource):
     """
@@ -16,13 +25,28 @@ class PostgreSQLSource(DataBaseSource):
     Attributes:
         connection_string (str): The connection string for the PostgreSQL database.
         query (str): The SQL query to be executed on the database.
+        use_connectorx (bool): Whether `load_data` reads through ConnectorX.
+        partition_on (Optional[str]): The numeric column ConnectorX splits the query on.
+        use_copy (bool): Whether `load_data` reads through a binary COPY.
+        use_binary (bool): Whether `load_data` fetches rows in PostgreSQL's binary format.
     """
 
+    # Number of rows fetched and converted to a DataFrame at a time.
+    BATCH_SIZE: int = 50_000
+    _COLUMNS_QUERY: str = (
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_name = %s ORDER BY ordinal_position"
+    )
+
     def __init__(
         self,
         query: str,
         connection_string: Optional[str] = None,
         db_config: Optional[DBConfig] = None,
+        use_connectorx: bool = False,
+        partition_on: Optional[str] = None,
+        use_copy: bool = False,
+        use_binary: bool = False,
     ):
         """
         Initializes a PostgreSQLSource instance with a query and optional connection details.
@@ -33,17 +57,63 @@ class PostgreSQLSource(DataBaseSource):
                 Defaults to None, which constructs it from db_config if provided.
             db_config (Optional[DBConfig]): A DBConfig instance for constructing
                 the connection string. Defaults to None.
+            use_connectorx (bool): Whether `load_data` reads through ConnectorX, which
+                decodes rows straight into Arrow memory. Defaults to False.
+            partition_on (Optional[str]): A numeric column of the query result used by
+                ConnectorX to split the query into ranges fetched in parallel, one per CPU.
+                Defaults to None, which fetches the result over a single connection.
+            use_copy (bool): Whether `load_data` reads the result through
+                `COPY ... TO STDOUT (FORMAT BINARY)`. Defaults to False.
+            use_binary (bool): Whether `load_data` fetches rows in PostgreSQL's binary
+                format instead of text. Defaults to False.
         """
         if db_config and not connection_string:
-            connection_string = (
-                f"postgresql://{db_config.user}:{db_config.password}@"
-                f"{db_config.host}:{db_config.port}/{db_config.database}"
-            )
+            connection_string = db_config.postgres_uri
         super().__init__(connection_string, db_config)
         self._connection = None
+        self._connection_pool = None
+        self._columns_cache: dict[str, list[str]] = {}
+        # Whether connections are opened directly instead of through a pool.
+        self._direct_connections = False
+        # Connections kept checked out after `disconnect`, reused first by `connect`.
+        self._hot_connections: deque = deque(maxlen=1)
         self.query = query
+        self.use_connectorx = use_connectorx
+        self.partition_on = partition_on
+        self.use_copy = use_copy
+        self.use_binary = use_binary
         self.connected = False
 
+    @property
+    def connection_string(self) -> str:
+        """
+        str: The connection string for the PostgreSQL database, as a URI or key=value pairs.
+
+        It is parsed when set, so a malformed string fails here rather than when the
+        first connection is opened.
+
+        Raises:
+            ValueError: If the connection string is not a string, is empty or is malformed.
+        """
+        return self._connection_string
+
+    @connection_string.setter
+    def connection_string(self, value: str) -> None:
+        """
+        Sets the connection string for the PostgreSQL database.
+
+        Parameters:
+            value (str): The new connection string.
+
+        Raises:
+            ValueError: If the connection string is not a string, is empty or is malformed.
+        """
+        Connectable.connection_string.fset(self, value)
+        try:
+            conninfo_to_dict(value)
+        except psycopg.ProgrammingError as e:
+            raise ValueError(f"Invalid connection string: {e}") from e
+
     @property
     def query(self) -> str:
         """
@@ -71,6 +141,121 @@ class PostgreSQLSource(DataBaseSource):
             raise ValueError("The query cannot be empty.")
         self._query = value
 
+    @property
+    def use_connectorx(self) -> bool:
+        """
+        bool: Whether `load_data` reads through ConnectorX.
+
+        ConnectorX decodes the result set in Rust straight into Arrow memory, skipping
+        the Python objects built by psycopg. It opens its own connection, so no call to
+        `connect` is needed. ConnectorX must be installed separately.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        return self._use_connectorx
+
+    @use_connectorx.setter
+    def use_connectorx(self, value: bool) -> None:
+        """
+        Sets whether `load_data` reads through ConnectorX.
+
+        Parameters:
+            value (bool): Boolean indicating if ConnectorX is used.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        if not isinstance(value, bool):
+            raise TypeError("use_connectorx must be a boolean value.")
+        self._use_connectorx = value
+
+    @property
+    def partition_on(self) -> Optional[str]:
+        """
+        Optional[str]: The numeric column ConnectorX splits the query on.
+
+        Only used together with `use_connectorx`.
+
+        Raises:
+            TypeError: If the value is not a string.
+        """
+        return self._partition_on
+
+    @partition_on.setter
+    def partition_on(self, value: Optional[str]) -> None:
+        """
+        Sets the numeric column ConnectorX splits the query on.
+
+        Parameters:
+            value (Optional[str]): The column name, or None to disable partitioning.
+
+        Raises:
+            TypeError: If the value is not a string.
+        """
+        if value is not None and not isinstance(value, str):
+            raise TypeError("partition_on must be a column name.")
+        self._partition_on = value
+
+    @property
+    def use_copy(self) -> bool:
+        """
+        bool: Whether `load_data` reads the result through a binary COPY.
+
+        COPY streams the rows in PostgreSQL's compact binary format, without the per-row
+        protocol messages of a regular query, and psycopg decodes them in C. Only queries
+        that can be wrapped in `COPY (...) TO STDOUT`, such as SELECT, are supported.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        return self._use_copy
+
+    @use_copy.setter
+    def use_copy(self, value: bool) -> None:
+        """
+        Sets whether `load_data` reads the result through a binary COPY.
+
+        Parameters:
+            value (bool): Boolean indicating if COPY is used.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        if not isinstance(value, bool):
+            raise TypeError("use_copy must be a boolean value.")
+        self._use_copy = value
+
+    @property
+    def use_binary(self) -> bool:
+        """
+        bool: Whether `load_data` fetches rows in PostgreSQL's binary format.
+
+        Numbers and timestamps are then sent in their native representation and
+        psycopg unpacks them instead of parsing their text, which is cheaper on numeric
+        results. Values of types without a binary loader in psycopg, e.g. custom enums,
+        are returned as bytes.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        return self._use_binary
+
+    @use_binary.setter
+    def use_binary(self, value: bool) -> None:
+        """
+        Sets whether `load_data` fetches rows in PostgreSQL's binary format.
+
+        Parameters:
+            value (bool): Boolean indicating if rows are fetched in binary format.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+        if not isinstance(value, bool):
+            raise TypeError("use_binary must be a boolean value.")
+        self._use_binary = value
+
     @override
     def initialize_pool(
         self, min_connections: int = 1, max_connections: int = 10
@@ -78,15 +263,27 @@ class PostgreSQLSource(DataBaseSource):
         """
         Initializes the connection pool for the PostgreSQL database.
 
+        Up to `min_connections` released connections are kept by the instance instead of
+        being returned to the pool, so reconnecting skips the pool and its lock. With a
+        single connection, no pool (nor its background worker threads) is created: the
+        connection is opened directly and kept.
+
         Parameters:
             min_connections (int): The minimum number of connections in the pool. Defaults to 1.
             max_connections (int): The maximum number of connections in the pool. Defaults to 10.
         """
-        self._connection_pool = ConnectionPool(
-            conninfo=self.connection_string,
-            min_size=min_connections,
-            max_size=max_connections,
-        )
+        # Kept connections belong to the previous pool, so they are handed back to it.
+        self.__release_hot_connections()
+        self._direct_connections = min_connections == max_connections == 1
+        if self._direct_connections:
+            self._connection_pool = None
+        else:
+            self._connection_pool = ConnectionPool(
+                conninfo=self.connection_string,
+                min_size=min_connections,
+                max_size=max_connections,
+            )
+        self._hot_connections = deque(maxlen=min_connections)
 
     @override
     def connect(self) -> None:
@@ -96,15 +293,14 @@ class PostgreSQLSource(DataBaseSource):
         Raises:
             RuntimeError: If an error occurs while trying to connect to the database.
         """
-        if not hasattr(self, "_connection_pool") or self._connection_pool is None:
+        if self._connection_pool is None and not self._direct_connections:
             self.initialize_pool()
 
         try:
             if not self._connection:
-                self._connection = self._connection_pool.getconn()
-                self._connection.autocommit = True
+                self._connection = self.__pop_hot_connection() or self.__acquire_connection()
                 self.connected = True
-                print("Conexión exitosa.\n")
+                logger.debug("Connected to the PostgreSQL database.")
 
         except Exception as e:
             self.connected = False
@@ -113,50 +309,204 @@ class PostgreSQLSource(DataBaseSource):
     @override
     def disconnect(self) -> None:
         """
-        Releases the current connection back to the pool and sets the connected status to False.
+        Releases the current connection and sets the connected status to False.
+
+        The connection is kept for the next `connect` while fewer than `min_connections`
+        are kept, and returned to the pool otherwise.
 
         Raises:
             RuntimeError: If an error occurs during disconnection or no active connection exists.
         """
         if self.connected and self._connection:
             try:
-                self._connection_pool.putconn(self._connection)
+                if len(self._hot_connections) < self._hot_connections.maxlen:
+                    self._hot_connections.append(self._connection)
+                else:
+                    self.__release_connection(self._connection)
+                self._connection = None
+                self._columns_cache.clear()
                 self.connected = False
-                print("\nDesconexión exitosa.")
+                logger.debug("Disconnected from the PostgreSQL database.")
             except Exception as e:
                 raise RuntimeError(f"Error disconnecting from the database: {e}") from e
         else:
             raise RuntimeError("No active connection to disconnect.")
 
+    def close(self) -> None:
+        """
+        Releases every connection held by the instance and closes the connection pool.
+
+        The active connection, if any, is released as in `disconnect`. The connections
+        kept for reuse are returned to the pool, or closed if opened directly, and the
+        pool is closed. A later `connect` initializes a new pool.
+        """
+        if self.connected and self._connection:
+            self.disconnect()
+        self.__release_hot_connections()
+        if self._connection_pool is not None:
+            pool, self._connection_pool = self._connection_pool, None
+            pool.close()
+        self._direct_connections = False
+
+    def __release_hot_connections(self) -> None:
+        """
+        Releases the connections kept for reuse by `connect`.
+        """
+        while self._hot_connections:
+            self.__release_connection(self._hot_connections.pop())
+
+    def __pop_hot_connection(self):
+        """
+        Takes the most recently released connection kept by the instance.
+
+        Connections closed in the meantime are released, so the pool discards them.
+
+        Returns:
+            Optional[Connection]: A usable connection, or None if none is kept.
+        """
+        while self._hot_connections:
+            connection = self._hot_connections.pop()
+            if not connection.closed:
+                return connection
+            self.__release_connection(connection)
+        return None
+
+    def __acquire_connection(self):
+        """
+        Gets a new connection in autocommit mode, from the pool or opened directly.
+
+        Returns:
+            Connection: The connection.
+        """
+        if self._direct_connections:
+            return psycopg.connect(self.connection_string, autocommit=True)
+        connection = self._connection_pool.getconn()
+        connection.autocommit = True
+        return connection
+
+    def __release_connection(self, connection) -> None:
+        """
+        Returns a connection to the pool, or closes it if it was opened directly.
+
+        Parameters:
+            connection (Connection): The connection to release.
+        """
+        if self._direct_connections:
+            connection.close()
+        else:
+            self._connection_pool.putconn(connection)
+
     @override
     def load_data(self) -> pl.DataFrame:
         """
         Executes the configured SQL query and loads data from the PostgreSQL database
         into a Polars DataFrame.
 
+        Rows are streamed from a server-side cursor and converted in batches of
+        `BATCH_SIZE`, so the full result is never held as Python tuples.
+
         Returns:
             pl.DataFrame: A DataFrame containing the query result.
 
         Raises:
             RuntimeError: If not connected to the database or if an error occurs during execution.
         """
+        if self.use_connectorx:
+            return self._load_data_with_connectorx()
+
         if not self.connected or not self._connection:
             raise RuntimeError("Not connected to the database.")
 
+        if self.use_copy:
+            return self._load_data_with_copy()
+
         try:
-            with self._connection.cursor() as cursor:
+            # Server-side cursors only live inside a transaction, even in autocommit mode.
+            with (
+                self._connection.transaction(),
+                self._connection.cursor(
+                    name="quipus_load_data", binary=self.use_binary
+                ) as cursor,
+            ):
+                cursor.itersize = self.BATCH_SIZE
                 cursor.execute(self.query)
-                result = cursor.fetchall()
                 columns = [desc[0] for desc in cursor.description]
-                return self.to_polars_df(result, columns)
+
+                batches = iter(lambda: cursor.fetchmany(self.BATCH_SIZE), [])
+                return self._concat_batches(batches, columns)
+        except Exception as e:
+            raise RuntimeError(f"Error loading data: {e}") from e
+
+    def _load_data_with_copy(self) -> pl.DataFrame:
+        """
+        Executes the configured SQL query through `COPY ... TO STDOUT (FORMAT BINARY)`.
+
+        The binary format carries no column names or types, so the query is described
+        first with `LIMIT 0`. Rows are converted in batches of `BATCH_SIZE`.
+
+        Returns:
+            pl.DataFrame: A DataFrame containing the query result.
+
+        Raises:
+            RuntimeError: If an error occurs during execution.
+        """
+        # The configured query is run as is, like in `load_data`; it's only wrapped.
+        query = sql.SQL(self.query.strip().rstrip(";"))
+        try:
+            with self._connection.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL("SELECT * FROM ({}) AS quipus_query LIMIT 0").format(query)
+                )
+                columns = [desc.name for desc in cursor.description]
+                type_oids = [desc.type_code for desc in cursor.description]
+
+                copy_statement = sql.SQL("COPY ({}) TO STDOUT (FORMAT BINARY)").format(query)
+                with cursor.copy(copy_statement) as copy:
+                    copy.set_types(type_oids)
+                    rows = copy.rows()
+                    batches = iter(lambda: list(islice(rows, self.BATCH_SIZE)), [])
+                    return self._concat_batches(batches, columns)
         except Exception as e:
             raise RuntimeError(f"Error loading data: {e}") from e
 
+    def _load_data_with_connectorx(self) -> pl.DataFrame:
+        """
+        Executes the configured SQL query through ConnectorX.
+
+        When `partition_on` is set, the query is split into one range of that column per
+        CPU, each fetched over its own connection.
+
+        Returns:
+            pl.DataFrame: A DataFrame containing the query result.
+
+        Raises:
+            ImportError: If ConnectorX is not installed.
+        """
+        try:
+            import connectorx as cx
+        except ImportError as e:
+            raise ImportError(
+                "use_connectorx requires ConnectorX. Install it with 'pip install connectorx'."
+            ) from e
+
+        if self.partition_on is None:
+            return cx.read_sql(self.connection_string, self.query, return_type="polars")
+        return cx.read_sql(
+            self.connection_string,
+            self.query,
+            return_type="polars",
+            partition_on=self.partition_on,
+            partition_num=os.cpu_count() or 1,
+        )
+
     @override
     def get_columns(self, *args, **kwargs) -> list[str]:
         """
         Retrieves the list of column names from a specified table in the database.
 
+        The lookup runs as a server-side prepared statement, planned once per connection,
+        and the columns of each table are cached until the source disconnects.
+
         Parameters:
             table_name (str): The name of the table to retrieve column names from.
 
@@ -173,15 +523,12 @@ class PostgreSQLSource(DataBaseSource):
         if not table_name:
             raise ValueError("Table name must be provided.")
 
-        query = """
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_name = %s;
-        """
-        try:
-            with self._connection.cursor() as cursor:
-                cursor.execute(query, (table_name,))
-                columns = cursor.fetchall()
-                return [col[0] for col in columns]
-        except Exception as e:
-            raise RuntimeError(f"Error retrieving columns: {e}") from e
+        if table_name not in self._columns_cache:
+            try:
+                with self._connection.cursor() as cursor:
+                    cursor.execute(self._COLUMNS_QUERY, (table_name,), prepare=True)
+                    self._columns_cache[table_name] = [col[0] for col in cursor.fetchall()]
+            except Exception as e:
+                raise RuntimeError(f"Error retrieving columns: {e}") from e
+
+        return list(self._columns_cache[table_name])
@@ -3,10 +3,13 @@
 from pathlib import Path
 from typing import Any, Optional, Union, override
 
+import fastexcel
 import polars as pl
 
 from .file_source import FileSource
 
+_SHEET_TYPES: tuple[type, ...] = (str, int)
+
 
 class XLSXSource(FileSource):
     """
@@ -16,7 +19,8 @@ class XLSXSource(FileSource):
         FileSource: Base class for handling file sources.
 
     Attributes:
-        file_path (Union[str, Path]): Path to the Excel file.
+        file_path (Union[str, Path]): Path to the Excel file, or a glob pattern matching
+            several Excel files with the same layout.
         sheet (Optional[Union[str, int]]): The sheet name or index to be read.
         has_header (bool): Indicates if the Excel sheet has a header row.
         columns (Optional[list[str]]): Specific columns to read from the Excel sheet.
@@ -37,7 +41,8 @@ class XLSXSource(FileSource):
         Initializes an XLSXSource object with specified parameters.
 
         Parameters:
-            file_path (Union[str, Path]): The path to the Excel file.
+            file_path (Union[str, Path]): The path to the Excel file, or a glob pattern in its
+                file name, e.g. "reports/*.xlsx".
             sheet (Optional[Union[str, int]]): The sheet to read. Can be a sheet name or index.
                 Defaults to the first sheet (0).
             has_header (bool): Specifies if the sheet has a header row. Defaults to True.
@@ -54,6 +59,7 @@ class XLSXSource(FileSource):
             date_columns=date_columns,
         )
         self.sheet = sheet
+        self._data_cache: Optional[tuple[tuple, pl.DataFrame]] = None
 
     @property
     def sheet(self) -> Optional[Union[str, int]]:
@@ -74,84 +80,147 @@ class XLSXSource(FileSource):
             value (Optional[Union[str, int]]): The sheet name (str) or index (int).
 
         Raises:
-            TypeError: If the value is not a string or integer.
+            TypeError: If the value is not a string or integer, e.g. a boolean.
+            ValueError: If the value is a negative index.
         """
-        if not isinstance(value, (str, int)):
+        # bool is a subclass of int, but True is not a sheet index.
+        if isinstance(value, bool) or not isinstance(value, _SHEET_TYPES):
             raise TypeError("Sheet name must be a string or an integer.")
+        if isinstance(value, int) and value < 0:
+            raise ValueError("Sheet index must be a non-negative integer.")
         self._sheet = value
 
     @override
-    def load_data(self) -> pl.DataFrame:
+    def scan_data(self) -> pl.LazyFrame:
         """
-        Loads data from the Excel file into a Polars DataFrame.
+        Reads the specified sheet and wraps it in a LazyFrame.
+
+        Excel files can't be scanned lazily, so the sheet is read eagerly. With a glob
+        pattern, the sheet of every matching file is read and stacked. Sheets are parsed
+        by the Rust calamine engine unless `read_options` sets another `engine`.
+
+        The data read is cached until a file is modified or the reading settings change,
+        so later loads and `get_columns` don't parse the workbook again.
 
         Returns:
-            pl.DataFrame: A Polars DataFrame containing the data from the specified sheet.
-        """
-        return pl.read_excel(
-            source=self.file_path,
-            sheet_name=self.sheet if isinstance(self.sheet, str) else None,
-            sheet_id=self.sheet if isinstance(self.sheet, int) else None,
-            has_header=self.has_header,
-            columns=self.columns,
-            **self.read_options,
+            pl.LazyFrame: A LazyFrame over the data from the specified sheet.
+
+        Raises:
+            ValueError: If the sheet name or index is invalid.
+        """
+        cache_key = self._cache_key()
+        if self._data_cache is not None and self._data_cache[0] == cache_key:
+            return self._data_cache[1].lazy()
+
+        read_options = {"engine": "calamine", **self.read_options}
+        frames = []
+        for path in self.file_paths:
+            try:
+                frames.append(
+                    pl.read_excel(
+                        source=path,
+                        has_header=self.has_header,
+                        columns=self.columns,
+                        **self._sheet_options(),
+                        **read_options,
+                    )
+                )
+            except ValueError as e:
+                if self._has_sheet(path):
+                    raise
+                raise self._sheet_not_found() from e
+        data = pl.concat(frames, rechunk=False)
+        self._data_cache = (cache_key, data)
+        return data.lazy()
+
+    def _cache_key(self) -> tuple:
+        """
+        Builds the key identifying the data read with the current files and settings.
+
+        Returns:
+            tuple: The modification time of every file and the reading settings.
+        """
+        return (
+            tuple((path, path.stat().st_mtime_ns) for path in self.file_paths),
+            self.sheet,
+            self.has_header,
+            repr(self.columns),
+            repr(self.read_options),
         )
 
-    def _select_sheet(
-        self, result: Union[pl.DataFrame, dict[str, pl.DataFrame]]
-    ) -> pl.DataFrame:
+    def _sheet_options(self) -> dict[str, Union[str, int]]:
         """
-        Selects the specified sheet from the result based on sheet_name or sheet_id.
+        Builds the options selecting the sheet in `pl.read_excel`.
 
-        Parameters:
-            result (Union[pl.DataFrame, dict[str, pl.DataFrame]]): The result from pl.read_excel,
-            which can be a single DataFrame or a dictionary of DataFrames.
+        A sheet is always named or numbered explicitly, so Polars reads only that sheet
+        instead of every sheet of the workbook. Polars numbers sheets from 1, while
+        `sheet` is a 0-based index.
 
         Returns:
-            pl.DataFrame: The DataFrame corresponding to the specified sheet.
+            dict[str, Union[str, int]]: The `sheet_name` or `sheet_id` option.
+        """
+        if isinstance(self.sheet, str):
+            return {"sheet_name": self.sheet}
+        return {"sheet_id": self.sheet + 1}
 
-        Raises:
-            ValueError: If the sheet name or index is invalid.
+    def _has_sheet(self, path: Path) -> bool:
         """
-        if not isinstance(result, dict):
-            return result
+        Checks whether a workbook has the selected sheet, reading only its sheet list.
 
-        sheet_names = list(result.keys())
+        Parameters:
+            path (Path): The path of the workbook.
 
-        # Excel sheet passed as a string
+        Returns:
+            bool: True if the sheet exists in the workbook.
+        """
+        sheet_names = fastexcel.read_excel(path).sheet_names
         if isinstance(self.sheet, str):
-            try:
-                return result[self.sheet]
-            except KeyError as e:
-                raise ValueError(
-                    f"Sheet name '{self.sheet}' not found in the Excel file."
-                ) from e
-
-        # Excel sheet passed as an integer (0-based index)
-        if isinstance(self.sheet, int):
-            try:
-                return result[sheet_names[self.sheet]]
-            except IndexError as e:
-                raise ValueError(f"sheet_id {self.sheet} is out of range.") from e
+            return self.sheet in sheet_names
+        return self.sheet < len(sheet_names)
 
-        # Excel sheet not specified, returning first
-        return result[sheet_names[0]]
+    def _sheet_not_found(self) -> ValueError:
+        """
+        Builds the error raised when the selected sheet doesn't exist.
+
+        Returns:
+            ValueError: The error, naming the sheet or 0-based index as given.
+        """
+        if isinstance(self.sheet, str):
+            return ValueError(f"Sheet name '{self.sheet}' not found in the Excel file.")
+        return ValueError(f"sheet_id {self.sheet} is out of range.")
 
     @override
     def get_columns(self, *args, **kwargs) -> list[str]:
         """
-        Retrieves the column names from the Excel file.
+        Retrieves the column names from the Excel file, or the first file matching the
+        glob pattern.
+
+        When the whole sheet was already loaded and is still current, its columns are
+        returned without reading the file again. Otherwise only the header row is read,
+        through calamine, without building any column.
 
         Returns:
             list[str]: A list of column names from the specified sheet.
-        """
-        result: pl.DataFrame = pl.read_excel(
-            source=self.file_path,
-            sheet_name=self.sheet if isinstance(self.sheet, str) else None,
-            sheet_id=self.sheet if isinstance(self.sheet, int) else None,
-            has_header=self.has_header,
-            engine="calamine",
-            read_options={"n_rows": 0},
-        )
 
-        return self._select_sheet(result).columns
+        Raises:
+            ValueError: If the sheet name or index is invalid.
+        """
+        if (
+            self.columns is None
+            and self._data_cache is not None
+            and self._data_cache[0] == self._cache_key()
+        ):
+            return self._data_cache[1].columns
+
+        reader = fastexcel.read_excel(self.file_paths[0])
+        try:
+            sheet = reader.load_sheet(
+                self.sheet, header_row=0 if self.has_header else None, n_rows=0
+            )
+        except fastexcel.SheetNotFoundError as e:
+            raise self._sheet_not_found() from e
+
+        if not self.has_header:
+            # The names Polars gives to the columns of a sheet without header.
+            return [f"column_{i}" for i in range(1, len(sheet.selected_columns) + 1)]
+        return [column.name for column in sheet.selected_columns]
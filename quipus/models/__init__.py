@@ -6,8 +6,37 @@ customizing documents like invoices.
 
 Classes:
     Template: Manages HTML templates with associated CSS and assets.
+    PDFBackend: Abstract base class for the engines that lay out HTML as PDF.
+    WeasyPrintBackend: PDF backend using WeasyPrint, the default one.
+    ChromiumBackend: PDF backend using headless Chromium through Playwright.
 """
 
-from .template import Template
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Template"]
+if TYPE_CHECKING:
+    from .pdf_backend import ChromiumBackend, PDFBackend, WeasyPrintBackend
+    from .template import Template
+
+# Imported on first access, like the root package exports.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ChromiumBackend": ".pdf_backend",
+    "PDFBackend": ".pdf_backend",
+    "WeasyPrintBackend": ".pdf_backend",
+    "Template": ".template",
+}
+
+__all__ = ["Template", "PDFBackend", "WeasyPrintBackend", "ChromiumBackend"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
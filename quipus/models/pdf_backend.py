@@ -0,0 +1,216 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from weasyprint import HTML
+
+if TYPE_CHECKING:
+    from .template import Template
+
+
+class PDFBackend(ABC):
+    """
+    An abstract base class for the engines that turn rendered HTML into PDF documents.
+    """
+
+    @abstractmethod
+    def render(self, html_string: str, template: "Template") -> bytes:
+        """
+        Abstract method to be overridden by subclasses to lay out HTML as a PDF document.
+
+        Args:
+            html_string (str): The HTML to lay out, with its placeholders already filled.
+            template (Template): The template the HTML was rendered from, used to resolve
+                its stylesheet and relative URLs.
+
+        Returns:
+            bytes: The content of the PDF document.
+        """
+
+
+class WeasyPrintBackend(PDFBackend):
+    """
+    PDF backend using WeasyPrint, the default one.
+
+    Stylesheets and fonts are taken from the template, which parses them once. Images
+    referenced by the documents (logos, signatures...) are decoded once and shared by
+    every render of the backend.
+    """
+
+    def __init__(self):
+        """
+        Initializes a WeasyPrintBackend instance.
+        """
+        self._cache: dict[str, Any] = {}
+
+    def render(self, html_string: str, template: "Template") -> bytes:
+        """
+        Lays out HTML as a PDF document with WeasyPrint.
+
+        Args:
+            html_string (str): The HTML to lay out, with its placeholders already filled.
+            template (Template): The template the HTML was rendered from.
+
+        Returns:
+            bytes: The content of the PDF document.
+        """
+        html = HTML(string=html_string, base_url=template.html_path)
+        return html.write_pdf(
+            stylesheets=template.stylesheets,
+            font_config=template.font_config,
+            cache=self._cache,
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Gets the state used to pickle the instance, e.g. when sent to worker processes.
+
+        Decoded images can't be pickled, so each process fills its own cache.
+
+        Returns:
+            dict[str, Any]: The instance attributes with an empty image cache.
+        """
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
+
+
+class ChromiumBackend(PDFBackend):
+    """
+    PDF backend using a headless Chromium driven by Playwright.
+
+    Chromium lays documents out much faster than WeasyPrint, which pays off on large
+    batches. A single browser page is started on first use and reused for every render;
+    call `close` (or use the backend as a context manager) to shut it down.
+
+    Playwright is not a dependency of quipus and must be installed separately, together
+    with its Chromium build (`playwright install chromium`).
+
+    Attributes:
+        pdf_options (dict[str, Any]): Extra options passed to Playwright's `page.pdf`.
+    """
+
+    def __init__(self, pdf_options: Optional[dict[str, Any]] = None):
+        """
+        Initializes a ChromiumBackend instance.
+
+        Args:
+            pdf_options (Optional[dict[str, Any]]): Extra options passed to Playwright's
+                `page.pdf`, e.g. `{"format": "A4"}`. Defaults to printing backgrounds.
+        """
+        self.pdf_options = pdf_options if pdf_options else {"print_background": True}
+        self._playwright = None
+        self._browser = None
+        self._page = None
+
+    @property
+    def pdf_options(self) -> dict[str, Any]:
+        """
+        dict[str, Any]: Extra options passed to Playwright's `page.pdf`.
+
+        Raises:
+            TypeError: If the value is not a dictionary.
+        """
+        return self._pdf_options
+
+    @pdf_options.setter
+    def pdf_options(self, value: dict[str, Any]) -> None:
+        """
+        Sets the extra options passed to Playwright's `page.pdf`.
+
+        Args:
+            value (dict[str, Any]): The options.
+
+        Raises:
+            TypeError: If the value is not a dictionary.
+        """
+        if not isinstance(value, dict):
+            raise TypeError("pdf_options must be a dictionary.")
+        self._pdf_options = value
+
+    def render(self, html_string: str, template: "Template") -> bytes:
+        """
+        Lays out HTML as a PDF document with headless Chromium.
+
+        The HTML is written into a page opened on the template file, so relative URLs of
+        images, stylesheets and assets resolve against the template's directory, as with
+        WeasyPrint's `base_url`. The page is only navigated when the template changes.
+
+        Args:
+            html_string (str): The HTML to lay out, with its placeholders already filled.
+            template (Template): The template the HTML was rendered from.
+
+        Returns:
+            bytes: The content of the PDF document.
+        """
+        page = self.__get_page()
+        # `set_content` keeps the page URL, which is the base of the relative URLs.
+        base_url = Path(template.html_path).resolve().as_uri()
+        if page.url != base_url:
+            page.goto(base_url)
+        page.set_content(html_string)
+        if template.css_path:
+            page.add_style_tag(path=template.css_path)
+        return page.pdf(**self.pdf_options)
+
+    def close(self) -> None:
+        """
+        Closes the browser, if it was started.
+        """
+        if self._browser is not None:
+            self._browser.close()
+        if self._playwright is not None:
+            self._playwright.stop()
+        self._playwright = None
+        self._browser = None
+        self._page = None
+
+    def __get_page(self):
+        if self._page is None:
+            try:
+                from playwright.sync_api import sync_playwright
+            except ImportError as e:
+                raise ImportError(
+                    "ChromiumBackend requires Playwright. Install it with "
+                    "'pip install playwright' and 'playwright install chromium'."
+                ) from e
+
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch()
+            self._page = self._browser.new_page()
+        return self._page
+
+    def __enter__(self):
+        """
+        Enters a runtime context related to this object.
+
+        Returns:
+            ChromiumBackend: The current instance of the class.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exits the runtime context, closing the browser.
+
+        Args:
+            exc_type (type): The type of the exception.
+            exc_value (Exception): The exception instance.
+            traceback (TracebackType): The traceback object.
+        """
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Gets the state used to pickle the instance, e.g. when sent to worker processes.
+
+        The browser can't be pickled, so each process starts its own on first use.
+
+        Returns:
+            dict[str, Any]: The instance attributes without the browser handles.
+        """
+        state = self.__dict__.copy()
+        state["_playwright"] = None
+        state["_browser"] = None
+        state["_page"] = None
+        return state
@@ -1,22 +1,42 @@
+import hashlib
 import os
-from typing import Any, Optional, Self
+from collections import OrderedDict
+from string import Formatter
+from typing import Any, Callable, Optional, Self
+
+import polars as pl
+from weasyprint import CSS
+from weasyprint.text.fonts import FontConfiguration
+
+from ..utils import write_atomic
+from .pdf_backend import PDFBackend, WeasyPrintBackend
+
+# HTML content plus its (literal, placeholder) segments, or None when str.format_map is needed.
+_CompiledHTML = tuple[str, Optional[list[tuple[str, Optional[str]]]]]
 
 
 class Template:
     """
     Class that represents an HTML template with its associated paths for CSS and assets.
 
+    Rendered PDFs are memoized by the digest of their HTML, so rows producing identical
+    HTML are written without laying the document out again.
+
     Attributes:
         html_path (str): Path to the HTML file.
         css_path (str): Path to the CSS file.
         assets_path (str): Path to the assets folder.
+        backend (PDFBackend): Engine used to lay out the rendered HTML as PDF.
     """
 
+    PDF_CACHE_SIZE: int = 128
+
     def __init__(
         self,
         html_path: str,
         css_path: Optional[str] = None,
         assets_path: Optional[str] = None,
+        backend: Optional[PDFBackend] = None,
     ):
         """
         Initializes an instance of the Template class.
@@ -25,10 +45,19 @@ class Template:
             html_path (str): Path to the HTML file.
             css_path (Optional[str]): Path to the CSS file.
             assets_path (Optional[str]): Path to the assets folder.
+            backend (Optional[PDFBackend]): Engine used to lay out PDFs.
+                Defaults to WeasyPrint.
         """
+        self.__font_config: Optional[FontConfiguration] = None
+        self.__stylesheets: Optional[list[CSS]] = None
+        self.__compiled_html: Optional[_CompiledHTML] = None
+        self.__render_values: Optional[Callable[[dict[str, Any]], str]] = None
+        self.__pdf_cache: OrderedDict[bytes, bytes] = OrderedDict()
+        self.__dirs_created: set[str] = set()
         self.html_path = html_path
         self.css_path = css_path
         self.assets_path = assets_path
+        self.backend = backend if backend else WeasyPrintBackend()
 
     @classmethod
     def from_template_path(cls, template_path: str) -> Self:
@@ -99,6 +128,9 @@ class Template:
         if not os.path.isfile(value):
             raise FileNotFoundError(f"'{value}' file does not exist.")
 
+        self.__compiled_html = None
+        self.__render_values = None
+        self.__pdf_cache = OrderedDict()
         self.__html_path = value
 
     @property
@@ -124,6 +156,9 @@ class Template:
             ValueError: If 'value' is an empty string.
             FileNotFoundError: If the file at 'value' does not exist.
         """
+        self.__stylesheets = None
+        self.__pdf_cache = OrderedDict()
+
         if value is None:
             self.__css_path = value
             return
@@ -183,6 +218,36 @@ class Template:
 
         self.__assets_path = value
 
+    @property
+    def backend(self) -> PDFBackend:
+        """
+        Get the engine used to lay out the rendered HTML as PDF.
+
+        Returns:
+            PDFBackend: The PDF backend.
+        """
+        return self.__backend
+
+    @backend.setter
+    def backend(self, value: PDFBackend):
+        """
+        Set the engine used to lay out the rendered HTML as PDF.
+
+        Args:
+            value (PDFBackend): The PDF backend.
+
+        Raises:
+            TypeError: If 'value' is not a PDFBackend.
+        """
+        if not isinstance(value, PDFBackend):
+            raise TypeError(
+                "'backend' must be an instance of PDFBackend.",
+                f"Current type: {type(value)}.",
+            )
+
+        self.__pdf_cache = OrderedDict()
+        self.__backend = value
+
     def render_html(self) -> str:
         """
         Renders the template by reading the content of the HTML file.
@@ -222,7 +287,305 @@ class Template:
         if not all(isinstance(k, str) for k in values.keys()):
             raise TypeError("All keys in the dictionary must be a string.")
 
-        return self.render_html().format(**values)
+        html, parts = self.__compile_html()
+        if parts is None:
+            return html.format_map(values)
+
+        if self.__render_values is None:
+            self.__render_values = self.__generate_renderer(parts)
+        return self.__render_values(values)
+
+    def render_html_columns(self, columns: dict[str, list[Any]]) -> list[str]:
+        """
+        Renders the HTML template once per row of column-oriented data.
+
+        Rows are read by position from the column lists, so no dictionary is built per
+        row; a Polars DataFrame can be passed as `df.to_dict(as_series=False)`.
+
+        Args:
+            columns (dict[str, list[Any]]): Lists of values of the same length, keyed by
+                placeholder name.
+
+        Returns:
+            list[str]: The rendered HTML strings, one per row.
+
+        Raises:
+            TypeError: If 'columns' is not a dictionary of lists with string keys.
+            ValueError: If the lists don't all have the same length.
+            KeyError: If not all placeholders in the HTML template could be substituted.
+        """
+        if not isinstance(columns, dict):
+            raise TypeError(
+                "'columns' must be a dictionary.",
+                f"Current type: {type(columns)}",
+            )
+
+        if not all(isinstance(k, str) for k in columns.keys()):
+            raise TypeError("All keys in the dictionary must be a string.")
+
+        if not all(isinstance(v, list) for v in columns.values()):
+            raise TypeError("All values in the dictionary must be lists.")
+
+        lengths = {len(v) for v in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All lists in 'columns' must have the same length.")
+        n_rows = lengths.pop() if lengths else 0
+
+        html, parts = self.__compile_html()
+        if parts is None:
+            names = list(columns)
+            return [
+                html.format_map(dict(zip(names, row)))
+                for row in zip(*columns.values(), strict=True)
+            ]
+
+        # Each placeholder column is formatted once; rows then only join strings.
+        formatted: dict[str, list[str]] = {}
+        segments = []
+        for literal, field_name in parts:
+            if field_name is not None and field_name not in formatted:
+                formatted[field_name] = [format(value) for value in columns[field_name]]
+            segments.append((literal, formatted[field_name] if field_name else None))
+
+        rendered = []
+        for i in range(n_rows):
+            row = []
+            for literal, values in segments:
+                row.append(literal)
+                if values is not None:
+                    row.append(values[i])
+            rendered.append("".join(row))
+        return rendered
+
+    def render_html_frame(self, data: pl.DataFrame) -> list[str]:
+        """
+        Renders the HTML template once per row of a Polars DataFrame.
+
+        The rows are assembled by Polars in native code. String and integer columns are
+        converted there too, while other columns are formatted in Python with `format`,
+        so every value renders exactly as with `render_html_with_values`.
+
+        Args:
+            data (pl.DataFrame): The rows, with one column per placeholder name.
+
+        Returns:
+            list[str]: The rendered HTML strings, one per row.
+
+        Raises:
+            TypeError: If 'data' is not a Polars DataFrame.
+            KeyError: If not all placeholders in the HTML template could be substituted.
+        """
+        if not isinstance(data, pl.DataFrame):
+            raise TypeError(
+                "'data' must be a Polars DataFrame.",
+                f"Current type: {type(data)}",
+            )
+
+        html, parts = self.__compile_html()
+        if parts is None:
+            return self.render_html_columns(data.to_dict(as_series=False))
+
+        if all(field_name is None for _, field_name in parts):
+            return ["".join(literal for literal, _ in parts)] * data.height
+
+        segments: list[pl.Expr] = []
+        for literal, field_name in parts:
+            if literal:
+                segments.append(pl.lit(literal))
+            if field_name is not None:
+                if field_name not in data.columns:
+                    raise KeyError(field_name)
+                segments.append(self.__format_column(data.get_column(field_name)))
+
+        return data.select(pl.concat_str(segments)).to_series().to_list()
+
+    @staticmethod
+    def __format_column(column: pl.Series) -> pl.Expr:
+        """
+        Builds the expression giving the text of each value of a column, as `format` does.
+
+        Args:
+            column (pl.Series): The column substituted into a placeholder.
+
+        Returns:
+            pl.Expr: The expression evaluating to the formatted values.
+        """
+        # Polars writes these types like Python; nulls become "None", like format(None).
+        if column.dtype == pl.String or column.dtype.is_integer():
+            return pl.col(column.name).cast(pl.String).fill_null("None")
+        return pl.lit(pl.Series([format(value) for value in column.to_list()], dtype=pl.String))
+
+    def __compile_html(self) -> _CompiledHTML:
+        """
+        Reads and parses the HTML template once, caching the result until 'html_path' changes.
+
+        The template is split into literal segments followed by the placeholder name to
+        substitute after each one. Templates using format specs, conversions or indexed
+        placeholders are not split and fall back to `str.format_map`.
+
+        Returns:
+            _CompiledHTML: The HTML content and its parsed segments, or None as
+                segments when `str.format_map` must be used.
+        """
+        if self.__compiled_html is not None:
+            return self.__compiled_html
+
+        html = self.render_html()
+        parts: Optional[list[tuple[str, Optional[str]]]] = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(html):
+            if field_name is not None and (
+                format_spec or conversion or not field_name.isidentifier()
+            ):
+                parts = None
+                break
+            parts.append((literal, field_name))
+
+        self.__compiled_html = (html, parts)
+        return self.__compiled_html
+
+    def __generate_renderer(
+        self, parts: list[tuple[str, Optional[str]]]
+    ) -> Callable[[dict[str, Any]], str]:
+        """
+        Generates a function rendering the parsed template for a dictionary of values.
+
+        The segments become the arguments of a single `str.join` call, so rendering a row
+        doesn't loop over them. Literals are embedded through `repr` and placeholder
+        names are identifiers, so no template content is ever run as code.
+
+        Args:
+            parts (list[tuple[str, Optional[str]]]): The parsed segments of the template.
+
+        Returns:
+            Callable[[dict[str, Any]], str]: The function rendering the template.
+        """
+        items = []
+        for literal, field_name in parts:
+            if literal:
+                items.append(repr(literal))
+            if field_name is not None:
+                items.append(f"format(values[{field_name!r}])")
+
+        arguments = ", ".join(items) or "''"
+        source = f"def render(values):\n    return ''.join(({arguments},))\n"
+        namespace: dict[str, Any] = {}
+        # Safe: the source only holds repr() literals and values[...] lookups, no template
+        # text is evaluated as code.
+        # pylint: disable-next=exec-used
+        exec(compile(source, f"<template {self.html_path}>", "exec"), namespace)  # noqa: S102
+        return namespace["render"]
+
+    @property
+    def font_config(self) -> FontConfiguration:
+        """
+        Get the WeasyPrint font configuration shared by every render of this template.
+
+        Returns:
+            FontConfiguration: The font configuration, created on first access.
+        """
+        if self.__font_config is None:
+            self.__font_config = FontConfiguration()
+        return self.__font_config
+
+    @property
+    def stylesheets(self) -> list[CSS]:
+        """
+        Get the parsed stylesheets applied when rendering this template.
+
+        The CSS file is parsed once and reused until 'css_path' changes.
+
+        Returns:
+            list[CSS]: The parsed stylesheets, empty when no CSS path is set.
+        """
+        if self.__stylesheets is None:
+            self.__stylesheets = (
+                [CSS(filename=self.css_path, font_config=self.font_config)]
+                if self.css_path
+                else []
+            )
+        return self.__stylesheets
+
+    def to_pdf(self, values: dict[str, Any], output_path: str, create_dir: bool = False) -> None:
+        """
+        Renders the template with the provided values and writes it as a PDF file.
+
+        Args:
+            values (dict[str, Any]): Values used to fill the template placeholders.
+            output_path (str): Path of the PDF file to write.
+            create_dir (bool): Whether to create the parent directory of 'output_path'
+                when missing. Each directory is only created once per instance.
+        """
+        if create_dir:
+            self.__ensure_dir(os.path.dirname(output_path))
+
+        write_atomic(output_path, self.render_pdf(values))
+
+    def __ensure_dir(self, directory: str) -> None:
+        """
+        Creates a directory if missing, remembering it to skip the syscall next time.
+
+        Args:
+            directory (str): The directory to create.
+        """
+        if directory and directory not in self.__dirs_created:
+            os.makedirs(directory, exist_ok=True)
+            self.__dirs_created.add(directory)
+
+    def render_pdf(self, values: dict[str, Any]) -> bytes:
+        """
+        Renders the template with the provided values as PDF bytes, without writing them.
+
+        Args:
+            values (dict[str, Any]): Values used to fill the template placeholders.
+
+        Returns:
+            bytes: The content of the rendered PDF.
+        """
+        html_string = self.render_html_with_values(values=values)
+        key = hashlib.blake2b(html_string.encode(), digest_size=16).digest()
+
+        pdf = self.__pdf_cache.get(key)
+        if pdf is None:
+            pdf = self.backend.render(html_string, self)
+            self.__pdf_cache[key] = pdf
+            if len(self.__pdf_cache) > self.PDF_CACHE_SIZE:
+                self.__pdf_cache.popitem(last=False)
+        else:
+            self.__pdf_cache.move_to_end(key)
+
+        return pdf
+
+    def to_batch_pdf(self, values_list: list[dict[str, Any]], output_path: str) -> None:
+        """
+        Renders the template once per item and writes every page into a single PDF file.
+
+        All the items are laid out as one document, so the backend setup (fonts,
+        stylesheets, PDF structure) is paid once instead of once per item. Each item
+        starts on a new page.
+
+        Args:
+            values_list (list[dict[str, Any]]): Values used to fill the template, one
+                dictionary per item.
+            output_path (str): Path of the PDF file to write.
+
+        Raises:
+            TypeError: If 'values_list' is not a list.
+            ValueError: If 'values_list' is empty.
+        """
+        if not isinstance(values_list, list):
+            raise TypeError(
+                "'values_list' must be a list of dictionaries.",
+                f"Current type: {type(values_list)}",
+            )
+
+        if not values_list:
+            raise ValueError("'values_list' cannot be empty.")
+
+        html_string = "".join(
+            f'<div style="break-after: page">{self.render_html_with_values(values)}</div>'
+            for values in values_list
+        )
+        write_atomic(output_path, self.backend.render(html_string, self))
 
     def render_css(self) -> str:
         """
@@ -242,6 +605,23 @@ class Template:
         with open(self.css_path) as css:
             return css.read()
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Gets the state used to pickle the instance, e.g. when sent to worker processes.
+
+        WeasyPrint objects can't be pickled, so they are rebuilt on first use. Cached PDFs
+        are dropped as well to keep the payload small.
+
+        Returns:
+            dict[str, Any]: The instance attributes without the cached WeasyPrint objects.
+        """
+        state = self.__dict__.copy()
+        state["_Template__font_config"] = None
+        state["_Template__stylesheets"] = None
+        state["_Template__render_values"] = None
+        state["_Template__pdf_cache"] = OrderedDict()
+        return state
+
     def __str__(self) -> str:
         """
         Represents the Template instance as a string.
@@ -14,10 +14,25 @@ Classes:
     TemplateManager: Manages document templates and integrates them with data sources.
 """
 
-from .s3_delivery import AWSConfig, S3Delivery
-from .sftp_delivery import SFTPDelivery
-from .smtp_delivery import EmailMessageBuilder, EmailSender, SMTPConfig
-from .template_manager import TemplateManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .s3_delivery import AWSConfig, S3Delivery
+    from .sftp_delivery import SFTPDelivery
+    from .smtp_delivery import EmailMessageBuilder, EmailSender, SMTPConfig
+    from .template_manager import TemplateManager
+
+# Imported on first access, like the root package exports.
+_LAZY_EXPORTS: dict[str, str] = {
+    "AWSConfig": ".s3_delivery",
+    "S3Delivery": ".s3_delivery",
+    "SFTPDelivery": ".sftp_delivery",
+    "EmailMessageBuilder": ".smtp_delivery",
+    "EmailSender": ".smtp_delivery",
+    "SMTPConfig": ".smtp_delivery",
+    "TemplateManager": ".template_manager",
+}
 
 __all__ = [
     "EmailMessageBuilder",
@@ -28,3 +43,16 @@ __all__ = [
     "SMTPConfig",
     "TemplateManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,13 @@
+from collections import deque
+from collections.abc import Callable, Iterable
 from typing import Optional
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from s3transfer.futures import TransferFuture
+from s3transfer.manager import TransferManager
+
+from ..utils import iter_files
 
 
 class AWSConfig:
@@ -45,7 +53,7 @@ class AWSConfig:
         if not isinstance(value, str):
             raise TypeError("AWS access key must be a string.")
 
-        if not value or len(value) == 0:
+        if not value:
             raise ValueError("AWS access key cannot be empty.")
 
         self._aws_access_key_id = value
@@ -68,7 +76,7 @@ class AWSConfig:
         if not isinstance(value, str):
             raise TypeError("AWS secret access key must be a string.")
 
-        if not value or len(value) == 0:
+        if not value:
             raise ValueError("AWS secret access key cannot be empty.")
 
         self._aws_secret_access_key = value
@@ -91,7 +99,7 @@ class AWSConfig:
         if not isinstance(value, str):
             raise TypeError("AWS region must be a string.")
 
-        if not value or len(value) == 0:
+        if not value:
             raise ValueError("AWS region cannot be empty.")
 
         self._aws_region = value
@@ -121,8 +129,22 @@ class S3Delivery:
 
     Attributes:
         _aws_config (AWSConfig): AWS configuration object.
+        _client (S3.Client): S3 client shared by every upload, created on first use.
     """
 
+    # Files larger than this are uploaded as concurrent parts of this size.
+    MULTIPART_CHUNK_SIZE: int = 8 * 1024 * 1024
+
+    # Objects larger than this are copied between buckets as concurrent parts of this size.
+    COPY_CHUNK_SIZE: int = 16 * 1024 * 1024
+
+    # HTTPS connections the client keeps open, shared by concurrent uploads.
+    MAX_POOL_CONNECTIONS: int = 32
+
+    # Attempts per request, retried with exponential backoff on throttling and
+    # transient errors.
+    MAX_ATTEMPTS: int = 3
+
     def __init__(self, aws_config: AWSConfig) -> None:
         """
         Initialize the S3Delivery object.
@@ -131,6 +153,7 @@ class S3Delivery:
             aws_config (AWSConfig): AWS configuration object.
         """
         self._aws_config = aws_config
+        self._client = None
 
     @property
     def aws_config(self) -> AWSConfig:
@@ -151,6 +174,29 @@ class S3Delivery:
             raise TypeError("AWS configuration must be an AWSConfig object.")
 
         self._aws_config = value
+        self._client = None
+
+    @property
+    def client(self):
+        """
+        Get the S3 client, creating it on first use.
+
+        The client is reused by every upload, so its service model is loaded once and
+        its connections are kept open between requests. It is created again after
+        'aws_config' changes.
+        """
+        if self._client is None:
+            self._client = boto3.client(
+                "s3",
+                aws_access_key_id=self._aws_config.aws_access_key_id,
+                aws_secret_access_key=self._aws_config.aws_secret_access_key,
+                region_name=self._aws_config.aws_region,
+                config=Config(
+                    max_pool_connections=self.MAX_POOL_CONNECTIONS,
+                    retries={"mode": "standard", "max_attempts": self.MAX_ATTEMPTS},
+                ),
+            )
+        return self._client
 
     def upload_file(self, file_path: str, bucket_name: str, key: str) -> None:
         """
@@ -169,41 +215,193 @@ class S3Delivery:
         if not isinstance(key, str):
             raise TypeError("Key must be a string.")
 
-        if not file_path or len(file_path) == 0:
+        if not file_path:
             raise ValueError("File path cannot be empty.")
-        if not bucket_name or len(bucket_name) == 0:
+        if not bucket_name:
             raise ValueError("Bucket name cannot be empty.")
-        if not key or len(key) == 0:
+        if not key:
             raise ValueError("Key cannot be empty.")
 
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=self._aws_config.aws_access_key_id,
-            aws_secret_access_key=self._aws_config.aws_secret_access_key,
-            region_name=self._aws_config.aws_region,
-        )
-        s3.upload_file(file_path, bucket_name, key)
+        self.client.upload_file(file_path, bucket_name, key)
 
-    def upload_many_files(self, files: list[tuple[str, str]], bucket_name: str) -> None:
+    def upload_many_files(
+        self,
+        files: Iterable[tuple[str, str]],
+        bucket_name: str,
+        max_workers: int = 16,
+        max_concurrency: int = 10,
+        max_bandwidth: Optional[int] = None,
+    ) -> None:
         """
         Upload multiple files to an S3 bucket.
 
+        Files are uploaded concurrently, and files larger than `MULTIPART_CHUNK_SIZE` are
+        split into parts uploaded concurrently as well, so the batch isn't bound by the
+        latency of each request. Every upload of the batch goes through a single transfer
+        manager, so 'max_bandwidth' caps the batch as a whole.
+
+        'files' is consumed as uploads progress, so a generator such as `iter_files` keeps
+        producing paths while the first files are uploaded, and only a bounded number of
+        pending uploads is held in memory.
+
         Args:
-            files (list): List of tuples containing the file path and key for each file.
+            files (Iterable[tuple[str, str]]): Tuples containing the file path and key for
+                each file.
             bucket_name (str): Name of the bucket to upload the files to.
+            max_workers (int): Number of files uploaded at the same time. Defaults to 16.
+            max_concurrency (int): Number of parts of a large file uploaded at the same
+                time. Defaults to 10. The requests of the whole batch are capped at
+                `MAX_POOL_CONNECTIONS`.
+            max_bandwidth (Optional[int]): Maximum bytes per second sent by all the uploads
+                together, so they don't saturate the link and get throttled by S3.
+                Defaults to None, for no limit.
+
+        Raises:
+            TypeError: If 'files' is not an iterable or 'bucket_name' is not a string.
+            ValueError: If 'max_workers', 'max_concurrency' or 'max_bandwidth' is not a
+                positive integer.
         """
 
-        if not isinstance(files, list):
-            raise TypeError("Files must be a list.")
+        if isinstance(files, (str, bytes)) or not isinstance(files, Iterable):
+            raise TypeError("Files must be an iterable of (path, key) tuples.")
 
         if not isinstance(bucket_name, str):
             raise TypeError("Bucket name must be a string.")
+        if not bucket_name:
+            raise ValueError("Bucket name cannot be empty.")
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("Max workers must be a positive integer.")
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("Max concurrency must be a positive integer.")
+
+        if max_bandwidth is not None and (
+            not isinstance(max_bandwidth, int) or max_bandwidth < 1
+        ):
+            raise ValueError("Max bandwidth must be a positive integer.")
+
+        # Each transfer manager has its own bandwidth limiter, so the batch shares one.
+        # Its request threads are shared too, and never outnumber the client's
+        # connections, so none of them waits for a connection or discards one.
+        config = TransferConfig(
+            multipart_threshold=self.MULTIPART_CHUNK_SIZE,
+            multipart_chunksize=self.MULTIPART_CHUNK_SIZE,
+            max_concurrency=min(max_workers * max_concurrency, self.MAX_POOL_CONNECTIONS),
+            max_bandwidth=max_bandwidth,
+        )
+        with TransferManager(self.client, config) as manager:
+            self.__run_transfers(
+                lambda file_path, key: manager.upload(file_path, bucket_name, key),
+                files,
+                max_workers,
+            )
+
+    def upload_directory(
+        self, directory: str, bucket_name: str, prefix: str = "", **kwargs
+    ) -> None:
+        """
+        Upload every file under a directory, including subdirectories, to an S3 bucket.
+
+        The key of each file is its path relative to 'directory', with "/" separators.
+        The directory is listed while the first files are being uploaded.
+
+        Args:
+            directory (str): Path to the directory to be uploaded, e.g. "output".
+            bucket_name (str): Name of the bucket to upload the files to.
+            prefix (str): Text prepended to every key, e.g. "reports/". Defaults to "".
+            **kwargs: Concurrency options passed to `upload_many_files`.
 
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=self._aws_config.aws_access_key_id,
-            aws_secret_access_key=self._aws_config.aws_secret_access_key,
-            region_name=self._aws_config.aws_region,
+        Raises:
+            TypeError: If 'directory' or 'prefix' is not a string.
+            FileNotFoundError: If 'directory' does not exist.
+        """
+        if not isinstance(directory, str):
+            raise TypeError("Directory must be a string.")
+
+        if not isinstance(prefix, str):
+            raise TypeError("Prefix must be a string.")
+
+        self.upload_many_files(iter_files(directory, prefix), bucket_name, **kwargs)
+
+    def mirror_many(
+        self,
+        copies: Iterable[tuple[str, str, str, str]],
+        max_workers: int = 16,
+        max_concurrency: int = 10,
+    ) -> None:
+        """
+        Copy multiple objects between S3 buckets, without downloading them.
+
+        Each object is copied by S3 itself, so no data goes through this machine. Objects
+        larger than `COPY_CHUNK_SIZE` are copied as concurrent parts, and several objects
+        are copied at the same time. Failed requests are retried with exponential
+        backoff, up to `MAX_ATTEMPTS` attempts.
+
+        Args:
+            copies (Iterable[tuple[str, str, str, str]]): Tuples containing the source
+                bucket, source key, destination bucket and destination key of each object.
+            max_workers (int): Number of objects copied at the same time. Defaults to 16.
+            max_concurrency (int): Number of parts of a large object copied at the same
+                time. Defaults to 10. The requests of the whole batch are capped at
+                `MAX_POOL_CONNECTIONS`.
+
+        Raises:
+            TypeError: If 'copies' is not an iterable.
+            ValueError: If 'max_workers' or 'max_concurrency' is not a positive integer.
+        """
+
+        if isinstance(copies, (str, bytes)) or not isinstance(copies, Iterable):
+            raise TypeError(
+                "Copies must be an iterable of "
+                "(source bucket, source key, bucket, key) tuples."
+            )
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("Max workers must be a positive integer.")
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("Max concurrency must be a positive integer.")
+
+        # One transfer manager copies the whole batch, with no more request threads
+        # than the client has connections.
+        config = TransferConfig(
+            multipart_threshold=self.COPY_CHUNK_SIZE,
+            multipart_chunksize=self.COPY_CHUNK_SIZE,
+            max_concurrency=min(max_workers * max_concurrency, self.MAX_POOL_CONNECTIONS),
         )
-        for file_path, key in files:
-            s3.upload_file(file_path, bucket_name, key)
+        with TransferManager(self.client, config) as manager:
+            self.__run_transfers(
+                lambda source_bucket, source_key, bucket_name, key: manager.copy(
+                    {"Bucket": source_bucket, "Key": source_key}, bucket_name, key
+                ),
+                copies,
+                max_workers,
+            )
+
+    @staticmethod
+    def __run_transfers(
+        transfer: Callable[..., TransferFuture], arguments: Iterable[tuple], max_workers: int
+    ) -> None:
+        """
+        Start a transfer with each tuple of arguments, and wait for all of them.
+
+        The transfers run in the threads of their transfer manager. 'arguments' is consumed
+        as transfers complete, so at most two transfers per worker are pending at any time.
+
+        Args:
+            transfer (Callable[..., TransferFuture]): Starts a transfer and returns its future.
+            arguments (Iterable[tuple]): The positional arguments of each transfer.
+            max_workers (int): Number of files transferred at the same time.
+
+        Raises:
+            Exception: The first error raised by a transfer, once it is reached.
+        """
+        pending: deque[TransferFuture] = deque()
+        for args in arguments:
+            pending.append(transfer(*args))
+            if len(pending) >= 2 * max_workers:
+                pending.popleft().result()
+
+        while pending:
+            pending.popleft().result()
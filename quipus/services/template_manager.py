@@ -1,27 +1,86 @@
+import itertools
+import multiprocessing
 import os
-from typing import Any, Callable, Literal, Self
-from weasyprint import HTML
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Literal, Optional, Self
+
+import polars as pl
+
 from ..models import Template
-from ..data_sources import CSVDataSource
+from ..data_sources import CSVSource
+from ..utils import write_atomic
+
+_worker_templates: list[Template] = []
+
+
+def _init_worker(templates: list[Template]) -> None:
+    """
+    Stores the templates once per worker process, so each task only ships its row data.
+
+    Args:
+        templates (list[Template]): Templates available to the worker, in the same order
+            as in the manager.
+    """
+    _worker_templates[:] = templates
+
+
+def _render_pdf_in_worker(job: tuple[int, dict[str, Any], str]) -> str:
+    """
+    Renders a single PDF inside a worker process initialized with `_init_worker`.
+
+    Args:
+        job (tuple[int, dict[str, Any], str]): Index of the template, values and target.
+
+    Returns:
+        str: The path of the written PDF.
+    """
+    index, values, target = job
+    _worker_templates[index].to_pdf(values, target)
+    return target
+
+
+def _render_pdfs_in_worker(jobs: tuple[tuple[int, dict[str, Any], str], ...]) -> list[str]:
+    """
+    Renders a chunk of PDFs inside a worker process initialized with `_init_worker`.
+
+    Args:
+        jobs (tuple[tuple[int, dict[str, Any], str], ...]): The jobs of the chunk.
+
+    Returns:
+        list[str]: The paths of the written PDFs, in job order.
+    """
+    return [_render_pdf_in_worker(job) for job in jobs]
 
 
 class TemplateManager:
     __SUPPORTED_SOURCE_TYPES: list[str] = ["csv"]
+    # Maximum number of rendered PDFs waiting to be written to disk.
+    __PENDING_WRITES: int = 32
+    # Rows sent to a worker process per task.
+    __RENDER_CHUNK_SIZE: int = 8
 
     def __init__(self) -> None:
         self.templates = []
         self.decide_template_func = None
         self.decide_filename_func = None
+        self.deliver_func = None
+        self.delivery_workers = 4
 
     @property
-    def data(self) -> list[dict[str, Any]]:
+    def data(self) -> list[dict[str, Any]] | pl.DataFrame:
         return self.__data
 
     @data.setter
-    def data(self, value: list[dict[str, Any]]):
+    def data(self, value: list[dict[str, Any]] | pl.DataFrame):
+        # A DataFrame is kept columnar; its rows are built one at a time when rendering.
+        if isinstance(value, pl.DataFrame):
+            self.__data = value
+            return
+
         if not isinstance(value, list):
             raise TypeError(
-                "'value' must be a list of dictionary with string keys.",
+                "'value' must be a Polars DataFrame or a list of dictionary with string keys.",
                 f"Current type: {type(value)}",
             )
 
@@ -66,6 +125,28 @@ class TemplateManager:
     def decide_filename_func(self, value: Callable[[dict[str, str]], str] | None):
         self.__decide_filename_func = value
 
+    @property
+    def deliver_func(self) -> Callable[[str], None] | None:
+        return self.__deliver_func
+
+    @deliver_func.setter
+    def deliver_func(self, value: Callable[[str], None] | None):
+        self.__deliver_func = value
+
+    @property
+    def delivery_workers(self) -> int:
+        return self.__delivery_workers
+
+    @delivery_workers.setter
+    def delivery_workers(self, value: int):
+        if not isinstance(value, int) or value < 1:
+            raise ValueError(
+                "'delivery_workers' must be a positive integer.",
+                f"Current value: {value}.",
+            )
+
+        self.__delivery_workers = value
+
     def from_source(self, source_type: Literal["csv"], **kwargs) -> Self:
         if not isinstance(source_type, str):
             raise TypeError(
@@ -92,11 +173,15 @@ class TemplateManager:
         return self
 
     def from_csv(self, path_to_file: str) -> Self:
-        csv_data_source = CSVDataSource(file_path=path_to_file)
-        fetched_data = csv_data_source.fetch_data()
-        self.data = []
-        for row in fetched_data.iter_rows(named=True):
-            self.data.append(row)
+        """
+        Loads the rows to render from a CSV file.
+
+        'data' is set to a list of dictionaries, one per row. To keep a large file
+        columnar until it is rendered, assign its Polars DataFrame to 'data' instead.
+        """
+        # Quoted fields may hold the delimiter, as Polars' own reader expects by default.
+        csv_source = CSVSource(file_path=path_to_file, quote_char='"')
+        self.data = csv_source.load_data().to_dicts()
         return self
 
     def with_multiple_templates(self, templates: list[Template]):
@@ -127,7 +212,12 @@ class TemplateManager:
 
         return self
 
-    def to_pdf(self, output_path: str, create_dir: bool = False) -> Self:
+    def to_pdf(
+        self,
+        output_path: str,
+        create_dir: bool = False,
+        workers: Optional[int] = 1,
+    ) -> Self:
         if not isinstance(output_path, str):
             raise TypeError(
                 "'output_path' must be a string.",
@@ -140,6 +230,12 @@ class TemplateManager:
                 f"Current type: {type(create_dir)}.",
             )
 
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError(
+                "'workers' must be a positive integer or None to use all CPUs.",
+                f"Current value: {workers}.",
+            )
+
         if not self.decide_filename_func:
             raise ValueError(
                 "A method must be implemented to determine the names of the files to be generated. Use the decide_filename_with method to do so."
@@ -150,37 +246,115 @@ class TemplateManager:
         elif not os.path.exists(output_path):
             raise FileNotFoundError(f"'{output_path}' directory does not exist.")
 
+        jobs = self.__resolve_jobs(output_path)
+
+        if workers == 1:
+            self.__render_sequentially(jobs)
+            return self
+
+        # Each render is CPU-bound and independent. Templates are shipped once per
+        # worker, and each job names its template by index, so the worker renders the
+        # very template resolved here. The decide_* and deliver callables stay in this
+        # process, since lambdas can't be pickled. Chunks are submitted as earlier ones
+        # complete, so only a few rows per worker are resolved at a time.
+        max_workers = workers or os.cpu_count() or 1
+        indexes = {id(template): index for index, template in enumerate(self.templates)}
+        chunks = itertools.batched(
+            ((indexes[id(template)], item, target) for template, item, target in jobs),
+            self.__RENDER_CHUNK_SIZE,
+        )
+        pending: deque[Future] = deque()
+        deliveries: list[Future] = []
+        with (
+            ProcessPoolExecutor(
+                max_workers=max_workers,
+                # Forking a process that runs threads may deadlock the child.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.templates,),
+            ) as executor,
+            ThreadPoolExecutor(max_workers=self.delivery_workers) as delivery,
+        ):
+            for chunk in chunks:
+                pending.append(executor.submit(_render_pdfs_in_worker, chunk))
+                if len(pending) >= 2 * max_workers:
+                    self.__deliver(pending.popleft().result(), delivery, deliveries)
+
+            while pending:
+                self.__deliver(pending.popleft().result(), delivery, deliveries)
+
+            for future in deliveries:
+                future.result()
+
+        return self
+
+    def __deliver(
+        self, targets: list[str], delivery: ThreadPoolExecutor, deliveries: list[Future]
+    ) -> None:
+        if self.deliver_func:
+            deliveries.extend(delivery.submit(self.deliver_func, target) for target in targets)
+
+    def __render_sequentially(
+        self, jobs: Iterator[tuple[Template, dict[str, Any], str]]
+    ) -> None:
+        # Writing to disk and delivering release the GIL, so they overlap with rendering
+        # the next row. Deliveries are network-bound and get their own pool of threads.
+        pending: deque[Future] = deque()
+        n_threads = self.delivery_workers if self.deliver_func else 1
+        with ThreadPoolExecutor(max_workers=n_threads) as writer:
+            for template, item, target in jobs:
+                pdf = template.render_pdf(item)
+                pending.append(writer.submit(self.__store, target, pdf))
+                if len(pending) >= self.__PENDING_WRITES:
+                    pending.popleft().result()
+
+            while pending:
+                pending.popleft().result()
+
+    def __store(self, target: str, pdf: bytes) -> None:
+        write_atomic(target, pdf)
+        if self.deliver_func:
+            self.deliver_func(target)
+
+    def __resolve_jobs(self, output_path: str) -> Iterator[tuple[Template, dict[str, Any], str]]:
+        # Templates are checked up front; rows are resolved lazily, as they are rendered.
         if len(self.templates) == 1:
-            for item in self.data:
-                html: HTML = HTML(
-                    string=self.templates[0].render_html_with_values(values=item),
-                    base_url=self.templates[0].html_path,
-                )
-                html.write_pdf(
-                    target=f"{output_path}/{self.decide_filename_func(item)}.pdf"
-                )
-        elif len(self.templates) > 1:
+            template = self.templates[0]
+            return (
+                (template, item, f"{output_path}/{self.decide_filename_func(item)}.pdf")
+                for item in self.__rows()
+            )
+
+        if len(self.templates) > 1:
             if not self.decide_template_func:
                 raise Exception(
                     "Multiple Templates have been established, but there is no way to determine which one to use for each element. Use the decide_template_with method to do so."
                 )
-            for item in self.data:
-                template: Template = self.__get_template_by_html_path(
-                    self.decide_template_func(item)
-                )
-                html: HTML = HTML(
-                    string=template.render_html_with_values(values=item),
-                    base_url=template.html_path,
-                )
-                html.write_pdf(
-                    target=f"{output_path}/{self.decide_filename_func(item)}.pdf"
-                )
-        else:
-            raise ValueError(
-                "When trying to convert to pdf, you must specify at least one template."
-            )
+            return self.__resolve_jobs_by_template(output_path)
 
-        return self
+        raise ValueError(
+            "When trying to convert to pdf, you must specify at least one template."
+        )
+
+    def __resolve_jobs_by_template(
+        self, output_path: str
+    ) -> Iterator[tuple[Template, dict[str, Any], str]]:
+        # Built once, so picking the template of each row is a dict lookup.
+        templates_by_path: dict[str, Template] = {}
+        for template in self.templates:
+            templates_by_path.setdefault(template.html_path, template)
+
+        for item in self.__rows():
+            html_path = self.decide_template_func(item)
+            template = templates_by_path.get(html_path)
+            if template is None:
+                template = self.__get_template_by_html_path(html_path)
+            yield template, item, f"{output_path}/{self.decide_filename_func(item)}.pdf"
+
+    def __rows(self) -> Iterator[dict[str, Any]]:
+        if isinstance(self.data, pl.DataFrame):
+            return self.data.iter_rows(named=True)
+        return iter(self.data)
 
     def __get_template_by_html_path(self, html_path: str):
         for template in self.templates:
@@ -198,3 +372,8 @@ class TemplateManager:
     def decide_filename_with(self, func: Callable[[dict[str, Any]], str]) -> Self:
         self.decide_filename_func = func
         return self
+
+    def deliver_with(self, func: Callable[[str], None], workers: int = 4) -> Self:
+        self.deliver_func = func
+        self.delivery_workers = workers
+        return self
@@ -9,6 +9,8 @@ It includes:
 - DBConfig: Class that handles database configuration settings.
 - ReplacementsDict: TypedDict for template replacements validation.
 - ValidReplacementValue: Union type for valid replacement values.
+- write_atomic: Function that writes a file through a temporary file and a rename.
+- iter_files: Function that lists the files under a directory tree.
 
 Exports:
     EncodingType: Enum class for encoding types.
@@ -16,10 +18,13 @@ Exports:
     DBConfig: Class for managing database configuration.
     ReplacementsDict: TypedDict for template replacements validation.
     ValidReplacementValue: Union type for valid replacement values.
+    write_atomic: Writes a file atomically.
+    iter_files: Lists the files under a directory tree with their relative names.
 """
 
 from .connectable import Connectable
 from .dbconfig import DBConfig
+from .files import iter_files, write_atomic
 from .types import EncodingType, ReplacementsDict, ValidReplacementValue
 
 __all__ = [
@@ -28,4 +33,6 @@ __all__ = [
     "DBConfig",
     "ReplacementsDict",
     "ValidReplacementValue",
+    "write_atomic",
+    "iter_files",
 ]
@@ -1,12 +1,51 @@
 from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import quote
 
 
-@dataclass
+def _build_uri(
+    scheme: str,
+    host: Optional[str],
+    user: Optional[str],
+    password: Optional[str],
+    port: Optional[int],
+    database: Optional[str],
+) -> str:
+    """
+    Builds a database URI from its parts.
+
+    Credentials are percent-encoded, so they may contain characters such as '@' or ':'.
+    Parts missing from the configuration are left out. The URI holds the password in
+    plain text, so it is built on each access rather than kept in a cache.
+
+    Parameters:
+        scheme (str): The URI scheme, e.g. "postgresql".
+        host (Optional[str]): The hostname or IP address of the database server.
+        user (Optional[str]): The username for authentication.
+        password (Optional[str]): The password for authentication.
+        port (Optional[int]): The port number to connect to.
+        database (Optional[str]): The name of the database to connect to.
+
+    Returns:
+        str: The URI.
+    """
+    credentials = ""
+    if user:
+        credentials = quote(user, safe="")
+        if password:
+            credentials += ":" + quote(password, safe="")
+        credentials += "@"
+    port_part = f":{port}" if port else ""
+    return f"{scheme}://{credentials}{host or ''}{port_part}/{database or ''}"
+
+
+@dataclass(slots=True)
 class DBConfig:
     """
     Data class for database configuration.
 
+    Instances store their fields in slots, without a per-instance `__dict__`.
+
     Attributes:
         host (str): The hostname or IP address of the database server.
         user (str): The username for authentication.
@@ -20,3 +59,21 @@ class DBConfig:
     password: Optional[str] = None
     port: Optional[int] = None
     database: Optional[str] = None
+
+    @property
+    def mysql_uri(self) -> str:
+        """
+        str: The `mysql://` URI of the configured database.
+        """
+        return _build_uri(
+            "mysql", self.host, self.user, self.password, self.port, self.database
+        )
+
+    @property
+    def postgres_uri(self) -> str:
+        """
+        str: The `postgresql://` URI of the configured database.
+        """
+        return _build_uri(
+            "postgresql", self.host, self.user, self.password, self.port, self.database
+        )
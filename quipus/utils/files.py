@@ -0,0 +1,54 @@
+import os
+import threading
+from typing import Iterator
+
+
+def write_atomic(path: str, content: bytes) -> None:
+    """
+    Writes binary content to a file so readers never see it partially written.
+
+    The content is written to a temporary file in the same directory, which then
+    replaces 'path' in a single rename. A crash midway leaves the previous file (or
+    none) instead of a truncated one.
+
+    Args:
+        path (str): Path of the file to write.
+        content (bytes): Content to write.
+    """
+    directory, name = os.path.split(path)
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def iter_files(directory: str, prefix: str = "") -> Iterator[tuple[str, str]]:
+    """
+    Yields the files under a directory and its subdirectories, with their relative names.
+
+    Entries are listed with `os.scandir`, whose cached file types spare a `stat` call
+    per entry, and relative names are built by appending each name to its parent's.
+    Symbolic links to directories are not followed.
+
+    Args:
+        directory (str): The directory to list.
+        prefix (str): Text prepended to every relative name, e.g. "reports/".
+            Defaults to an empty string.
+
+    Yields:
+        tuple[str, str]: The path of each file and its name relative to 'directory',
+            with "/" separators, after 'prefix'.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path, f"{prefix}{entry.name}/")
+            elif entry.is_file():
+                yield entry.path, prefix + entry.name
@@ -1,10 +1,12 @@
+import os
+import warnings
 from pathlib import Path
 
 import pytest
 import polars as pl
 import pandas as pd
 
-from quipus import CSVDataSource
+from quipus import CSVDataSource, CSVSource
 
 
 def test_csv_data_source_valid_initialization(tmp_path):
@@ -183,3 +185,225 @@ def test_csv_data_source_invalid_csv(tmp_path):
     assert df is not None
     assert not df.is_empty()
     assert df.shape == (1, 7)
+
+
+def test_csv_source_load_data_batched(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n" + "".join(f"{i},{i * 2}\n" for i in range(25)))
+
+    data_source = CSVSource(file_path=csv_file)
+
+    batches = list(data_source.load_data_batched(batch_size=10))
+
+    assert len(batches) > 1
+    assert pl.concat(batches).equals(data_source.load_data())
+
+
+def test_csv_source_load_data_batched_uses_no_deprecated_reader(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n" + "".join(f"{i},{i * 2}\n" for i in range(25)))
+
+    data_source = CSVSource(file_path=csv_file)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        batches = list(data_source.load_data_batched(batch_size=10))
+
+    assert pl.concat(batches).equals(data_source.load_data())
+
+
+def test_csv_source_load_data_batched_invalid_batch_size(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2\n3,4")
+
+    data_source = CSVSource(file_path=csv_file)
+
+    with pytest.raises(TypeError):
+        next(data_source.load_data_batched(batch_size="10"))
+    with pytest.raises(ValueError):
+        next(data_source.load_data_batched(batch_size=0))
+
+
+def test_csv_source_load_data_parallel(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text(
+        "id,value\n" + "".join(f"{i},{'' if i % 5 == 0 else i / 2}\n" for i in range(1000))
+    )
+
+    data_source = CSVSource(file_path=csv_file)
+
+    assert data_source.load_data_parallel(n_workers=4).equals(data_source.load_data())
+
+
+def test_csv_source_get_columns_cached(tmp_path, monkeypatch):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1;col2\n1;2")
+
+    data_source = CSVSource(file_path=csv_file)
+    assert data_source.get_columns() == ["col1;col2"]
+
+    data_source.delimiter = ";"
+    assert data_source.get_columns() == ["col1", "col2"]
+
+    def fail_read_csv(*args, **kwargs):
+        raise AssertionError("The header should not be parsed again.")
+
+    monkeypatch.setattr(pl, "scan_csv", fail_read_csv)
+    assert data_source.get_columns() == ["col1", "col2"]
+
+
+def test_csv_source_load_data_selected_columns(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("# comment\ncol1,col2,col3\n1,NA,3\n4,5,6")
+
+    data_source = CSVSource(
+        file_path=csv_file, columns=["col3", "col2"], skip_rows=1, na_values=["NA"]
+    )
+
+    assert data_source.get_columns() == ["col1", "col2", "col3"]
+    assert data_source.load_data().to_dicts() == [
+        {"col2": None, "col3": 3},
+        {"col2": 5, "col3": 6},
+    ]
+
+
+def test_csv_source_read_kwargs_follow_options(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1;col2\n1;2")
+
+    data_source = CSVSource(file_path=csv_file)
+    read_kwargs = data_source._read_kwargs
+
+    assert data_source._read_kwargs is read_kwargs
+
+    data_source.delimiter = ";"
+    assert data_source._read_kwargs["separator"] == ";"
+    assert data_source.load_data().columns == ["col1", "col2"]
+
+
+def test_csv_source_scan_data_is_lazy(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2\n3,4")
+
+    data_source = CSVSource(file_path=csv_file, columns=["col2"])
+    lazy_frame = data_source.scan_data()
+
+    assert isinstance(lazy_frame, pl.LazyFrame)
+    assert lazy_frame.filter(pl.col("col2") > 2).collect().to_dicts() == [{"col2": 4}]
+
+
+def test_csv_source_parquet_cache(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2,col3\n1,2,3\n4,5,6")
+
+    data_source = CSVSource(file_path=csv_file, columns=["col3", "col1"], parquet_cache=True)
+
+    assert data_source.load_data().to_dicts() == [
+        {"col1": 1, "col3": 3},
+        {"col1": 4, "col3": 6},
+    ]
+    cache_files = list(tmp_path.glob("test.csv.*.parquet.cache"))
+    assert len(cache_files) == 1
+
+    csv_file.write_text("col1,col2,col3\n7,8,9")
+    os.utime(csv_file, ns=(cache_files[0].stat().st_mtime_ns + 1,) * 2)
+
+    assert data_source.load_data().to_dicts() == [{"col1": 7, "col3": 9}]
+
+
+def test_csv_source_glob_pattern(tmp_path):
+    (tmp_path / "part_1.csv").write_text("col1,col2\n1,2\n3,4", encoding="latin1")
+    (tmp_path / "part_2.csv").write_text("col1,col2\n5,6", encoding="latin1")
+    (tmp_path / "other.txt").write_text("col1,col2\n7,8")
+
+    data_source = CSVSource(file_path=tmp_path / "part_*.csv", columns=["col1"])
+    expected = [{"col1": 1}, {"col1": 3}, {"col1": 5}]
+
+    assert data_source.get_columns() == ["col1", "col2"]
+    assert data_source.load_data().to_dicts() == expected
+    assert pl.concat(data_source.load_data_batched(batch_size=1)).to_dicts() == expected
+    assert data_source.load_data_parallel(n_workers=2).to_dicts() == expected
+
+    (tmp_path / "part_3.csv").write_text("col1,col2\n9,10")
+    assert data_source.load_data()["col1"].to_list() == [1, 3, 5, 9]
+
+    data_source.encoding = "iso-8859-1"
+    assert data_source.load_data()["col1"].to_list() == [1, 3, 5, 9]
+
+
+def test_csv_source_glob_pattern_expanded_once_per_read(tmp_path, monkeypatch):
+    (tmp_path / "part_1.csv").write_text("col1,col2\n1,2")
+    (tmp_path / "part_2.csv").write_text("col1,col2\n3,4")
+    data_source = CSVSource(file_path=tmp_path / "part_*.csv", columns=["col2"])
+    data_source.get_columns()
+
+    globs = []
+    original_glob = Path.glob
+
+    def counting_glob(self, pattern, *args, **kwargs):
+        globs.append(pattern)
+        return original_glob(self, pattern, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "glob", counting_glob)
+
+    assert data_source.get_columns() == ["col1", "col2"]
+    assert data_source._read_kwargs is data_source._read_kwargs
+    assert globs == []
+
+    assert data_source.load_data()["col2"].to_list() == [2, 4]
+    assert globs == ["part_*.csv"]
+
+
+def test_csv_source_glob_pattern_without_matches(tmp_path):
+    data_source = CSVSource(file_path=tmp_path / "*.csv")
+
+    with pytest.raises(ValueError, match="must match at least one file"):
+        data_source.load_data()
+
+
+def test_csv_source_file_path_checked_on_read(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    data_source = CSVSource(file_path=csv_file)
+
+    with pytest.raises(ValueError, match="must point to an existing file"):
+        data_source.get_columns()
+
+    csv_file.write_text("col1,col2\n1,2")
+    assert data_source.load_data().to_dicts() == [{"col1": 1, "col2": 2}]
+
+
+@pytest.mark.parametrize("encoding", ["iso-8859-1", "utf-16"])
+def test_csv_source_non_utf8_encodings(tmp_path, encoding):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("name,city\nJosé,Bogotá\nZoë,Málaga", encoding=encoding)
+
+    data_source = CSVSource(file_path=csv_file, encoding=encoding)
+
+    assert data_source.get_columns() == ["name", "city"]
+    assert data_source.load_data().to_dicts() == [
+        {"name": "José", "city": "Bogotá"},
+        {"name": "Zoë", "city": "Málaga"},
+    ]
+
+
+def test_csv_source_row_filter(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text(
+        "name,lang\n" + "".join(f"user{i},{'es' if i % 3 == 0 else 'en'}\n" for i in range(30))
+    )
+
+    data_source = CSVSource(
+        file_path=csv_file, columns=["name"], row_filter=pl.col("lang") == "es"
+    )
+
+    expected = [{"name": f"user{i}"} for i in range(0, 30, 3)]
+    assert data_source.load_data().to_dicts() == expected
+    assert data_source.load_data_parallel(n_workers=4).to_dicts() == expected
+
+    data_source.columns = None
+    batches = list(data_source.load_data_batched(batch_size=4))
+    assert pl.concat(batches)["name"].to_list() == [row["name"] for row in expected]
+    assert all(not batch.is_empty() for batch in batches)
+
+    with pytest.raises(TypeError):
+        data_source.row_filter = 'lang == "es"'
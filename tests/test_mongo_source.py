@@ -0,0 +1,240 @@
+import sys
+import types
+
+import polars as pl
+import pytest
+
+from quipus import DBConfig, MongoDBSource
+
+
+class MockCollection:
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+
+    def aggregate(self, pipeline, **kwargs):
+        self.calls.append(("aggregate", pipeline, kwargs))
+        documents = self.documents
+        for stage in pipeline:
+            if "$match" in stage:
+                documents = [d for d in documents if d.items() >= stage["$match"].items()]
+            if "$project" in stage:
+                fields = [k for k, v in stage["$project"].items() if v]
+                documents = [{k: d[k] for k in fields if k in d} for d in documents]
+            if "$sample" in stage:
+                documents = documents[: stage["$sample"]["size"]]
+        return iter(documents)
+
+
+class MockDatabase:
+    def __init__(self, collections):
+        self.collections = collections
+
+    def __getitem__(self, name):
+        return self.collections[name]
+
+
+@pytest.fixture
+def db_config():
+    return DBConfig(host="localhost", user="user", password="pass", port=27017, database="db")
+
+
+def connected_source(db_config, documents, **kwargs):
+    source = MongoDBSource(collection_name="people", query={}, db_config=db_config, **kwargs)
+    source._database = MockDatabase({"people": MockCollection(documents)})
+    source.connected = True
+    return source
+
+
+def test_mongo_source_load_data_in_batches(db_config, monkeypatch):
+    documents = [{"name": f"name_{i}", "age": i} for i in range(5)]
+    documents[4]["email"] = "sparse@field.com"
+    source = connected_source(db_config, documents)
+    monkeypatch.setattr(MongoDBSource, "BATCH_SIZE", 2)
+
+    df = source.load_data()
+
+    assert df.height == 5
+    assert df.columns == ["name", "age", "email"]
+    assert df["email"].to_list() == [None, None, None, None, "sparse@field.com"]
+
+
+def test_mongo_source_load_data_projects_on_server(db_config):
+    documents = [{"_id": i, "name": f"name_{i}", "age": i % 2} for i in range(4)]
+    source = connected_source(db_config, documents, columns=["name"])
+    source.query = {"age": 1}
+
+    df = source.load_data()
+
+    assert df.to_dicts() == [{"name": "name_1"}, {"name": "name_3"}]
+    _, pipeline, _ = source._database["people"].calls[-1]
+    assert pipeline == [{"$match": {"age": 1}}, {"$project": {"name": 1, "_id": 0}}]
+
+
+def test_mongo_source_load_data_empty(db_config):
+    source = connected_source(db_config, [])
+
+    assert source.load_data().equals(pl.DataFrame())
+
+
+def test_mongo_source_load_data_not_connected(db_config):
+    source = MongoDBSource(collection_name="people", query={}, db_config=db_config)
+
+    with pytest.raises(ConnectionError):
+        source.load_data()
+
+
+def test_mongo_source_get_columns_cached(db_config):
+    source = connected_source(db_config, [{"_id": 1, "name": "Juan"}, {"_id": 2, "age": 3}])
+    collection = source._database["people"]
+
+    assert source.get_columns("people") == ["_id", "name", "age"]
+    assert source.get_columns(table_name="people") == ["_id", "name", "age"]
+    assert len(collection.calls) == 1
+
+    source._client = type("MockClient", (), {"close": lambda self: None})()
+    source.disconnect()
+    source.connected = True
+
+    source.get_columns("people")
+    assert len(collection.calls) == 2
+
+
+def test_mongo_source_get_columns_empty_collection(db_config):
+    source = connected_source(db_config, [])
+
+    with pytest.raises(ValueError, match="is empty or does not exist"):
+        source.get_columns("people")
+
+
+@pytest.mark.parametrize(
+    "config, use_srv, expected",
+    [
+        (
+            DBConfig(host="h", user="u", password="p@ss:w/rd", port=27017, database="db"),
+            False,
+            "mongodb://u:p%40ss%3Aw%2Frd@h:27017/db",
+        ),
+        (
+            DBConfig(host="cluster.net", user="u", password="p", port=27017, database="db"),
+            True,
+            "mongodb+srv://u:p@cluster.net/db",
+        ),
+        (DBConfig(host="h", port=27017, database="db"), False, "mongodb://h:27017/db"),
+    ],
+)
+def test_mongo_source_build_connection_string(config, use_srv, expected):
+    source = MongoDBSource(collection_name="people", query={}, db_config=config, use_srv=use_srv)
+
+    assert source.connection_string == expected
+
+
+def test_mongo_source_connect_skips_recent_ping(db_config, monkeypatch):
+    pings = []
+
+    class MockAdmin:
+        def command(self, name):
+            pings.append(name)
+
+    class MockClient:
+        def __init__(self, *args, **kwargs):
+            self.admin = MockAdmin()
+
+        def __getitem__(self, name):
+            return MockDatabase({})
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr("quipus.data_sources.mongo_source.MongoClient", MockClient)
+    monkeypatch.setattr(MongoDBSource, "_client_cache", {})
+    monkeypatch.setattr(MongoDBSource, "_client_refs", {})
+    source = MongoDBSource(collection_name="people", query={}, db_config=db_config)
+
+    source.connect()
+    source.connect()
+    assert pings == ["ping"]
+
+    monkeypatch.setattr(MongoDBSource, "PING_INTERVAL_NS", -1)
+    source.connect()
+    assert pings == ["ping", "ping"]
+
+
+def test_mongo_source_load_data_with_pymongoarrow(db_config, monkeypatch):
+    calls = []
+
+    def aggregate_polars_all(collection, pipeline, **kwargs):
+        calls.append(pipeline)
+        return pl.DataFrame({"name": ["Juan"]})
+
+    api = types.ModuleType("pymongoarrow.api")
+    api.aggregate_polars_all = aggregate_polars_all
+    monkeypatch.setitem(sys.modules, "pymongoarrow", types.ModuleType("pymongoarrow"))
+    monkeypatch.setitem(sys.modules, "pymongoarrow.api", api)
+    source = connected_source(db_config, [], columns=["name"], use_pymongoarrow=True)
+
+    assert source.load_data().to_dicts() == [{"name": "Juan"}]
+    assert calls == [[{"$match": {}}, {"$project": {"name": 1, "_id": 0}}]]
+
+
+def test_mongo_source_shares_client(db_config, monkeypatch):
+    clients = []
+
+    class MockClient:
+        def __init__(self, *args, **kwargs):
+            self.kwargs = kwargs
+            self.closed = False
+            self.admin = type("MockAdmin", (), {"command": lambda self, name: None})()
+            clients.append(self)
+
+        def __getitem__(self, name):
+            return MockDatabase({})
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr("quipus.data_sources.mongo_source.MongoClient", MockClient)
+    monkeypatch.setattr(MongoDBSource, "_client_cache", {})
+    monkeypatch.setattr(MongoDBSource, "_client_refs", {})
+    first = MongoDBSource(collection_name="people", query={}, db_config=db_config)
+    second = MongoDBSource(collection_name="pets", query={}, db_config=db_config)
+
+    first.connect()
+    first.initialize_pool()
+    second.connect()
+    assert len(clients) == 1
+    assert clients[0].kwargs["maxIdleTimeMS"] == MongoDBSource.MAX_IDLE_TIME_MS
+
+    first.disconnect()
+    assert not clients[0].closed
+    second.disconnect()
+    assert clients[0].closed
+    assert MongoDBSource._client_cache == {}
+
+
+@pytest.mark.parametrize(
+    "attribute, value",
+    [("collection_name", ""), ("collection_name", "  "), ("collection_name", 1), ("query", [])],
+)
+def test_mongo_source_invalid_attributes(db_config, attribute, value):
+    source = MongoDBSource(collection_name="people", query={}, db_config=db_config)
+
+    with pytest.raises(ValueError):
+        setattr(source, attribute, value)
+
+
+def test_mongo_source_default_query_is_not_shared(db_config):
+    first = MongoDBSource(collection_name="people", db_config=db_config)
+    second = MongoDBSource(collection_name="people", db_config=db_config)
+
+    first.query["age"] = 1
+
+    assert second.query == {}
+
+
+def test_mongo_source_database_from_connection_string():
+    source = MongoDBSource(
+        collection_name="people", connection_string="mongodb://h1:1,h2:2/db?retryWrites=true"
+    )
+
+    assert source.db_config.database == "db"
@@ -0,0 +1,139 @@
+import io
+import os
+
+import polars as pl
+import pytest
+
+from quipus import ParquetSource
+
+
+def test_parquet_source_load_data_selected_columns(tmp_path):
+    parquet_file = tmp_path / "test.parquet"
+    pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}).write_parquet(parquet_file)
+
+    data_source = ParquetSource(file_path=parquet_file, columns=["col2"])
+
+    assert data_source.load_data().to_dicts() == [{"col2": "a"}, {"col2": "b"}]
+
+
+def test_parquet_source_get_columns_cached(tmp_path, monkeypatch):
+    parquet_file = tmp_path / "test.parquet"
+    pl.DataFrame({"col1": [1], "col2": [2]}).write_parquet(parquet_file)
+    data_source = ParquetSource(file_path=parquet_file)
+
+    assert data_source.get_columns() == ["col1", "col2"]
+
+    def fail_scan_parquet(*args, **kwargs):
+        raise AssertionError("The footer should not be parsed again.")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pl, "scan_parquet", fail_scan_parquet)
+        assert data_source.get_columns() == ["col1", "col2"]
+
+    mtime_ns = parquet_file.stat().st_mtime_ns
+    pl.DataFrame({"col3": [3]}).write_parquet(parquet_file)
+    os.utime(parquet_file, ns=(mtime_ns + 1,) * 2)
+
+    assert data_source.get_columns() == ["col3"]
+
+
+def test_parquet_source_row_filter(tmp_path):
+    parquet_file = tmp_path / "test.parquet"
+    pl.DataFrame({"id": range(10), "name": [f"name_{i}" for i in range(10)]}).write_parquet(
+        parquet_file, row_group_size=2
+    )
+
+    data_source = ParquetSource(
+        file_path=parquet_file, columns=["name"], row_filter=pl.col("id") >= 8
+    )
+
+    assert data_source.load_data().to_dicts() == [{"name": "name_8"}, {"name": "name_9"}]
+    assert "SELECTION" in data_source.scan_data().explain()
+
+
+def test_parquet_source_load_data_batched(tmp_path):
+    for part in range(2):
+        pl.DataFrame({"id": range(part * 25, part * 25 + 25)}).with_columns(
+            double=pl.col("id") * 2
+        ).write_parquet(tmp_path / f"part_{part}.parquet", row_group_size=10)
+
+    data_source = ParquetSource(file_path=tmp_path / "part_*.parquet", columns=["double"])
+    batches = list(data_source.load_data_batched(batch_size=10))
+
+    assert [batch.height for batch in batches] == [10, 10, 5, 10, 10, 5]
+    assert pl.concat(batches).equals(data_source.load_data())
+
+    data_source.row_filter = pl.col("id") < 12
+    assert [batch.height for batch in data_source.load_data_batched(batch_size=10)] == [10, 2]
+
+
+def test_parquet_source_load_data_batched_stops_early(tmp_path):
+    parquet_file = tmp_path / "test.parquet"
+    pl.DataFrame({"id": range(100)}).write_parquet(parquet_file, row_group_size=10)
+
+    batches = ParquetSource(file_path=parquet_file).load_data_batched(batch_size=10)
+
+    assert next(batches)["id"].to_list() == list(range(10))
+    assert next(batches)["id"].to_list() == list(range(10, 20))
+    batches.close()
+
+
+@pytest.mark.parametrize("as_buffer", [lambda content: content, io.BytesIO])
+def test_parquet_source_in_memory_content(as_buffer):
+    buffer = io.BytesIO()
+    pl.DataFrame({"id": range(5), "name": list("abcde")}).write_parquet(buffer)
+
+    data_source = ParquetSource(file_path=as_buffer(buffer.getvalue()), columns=["name"])
+
+    assert data_source.get_columns() == ["id", "name"]
+    assert data_source.load_data()["name"].to_list() == list("abcde")
+    assert data_source.load_data()["name"].to_list() == list("abcde")
+    assert [batch.height for batch in data_source.load_data_batched(batch_size=2)] == [2, 2, 1]
+
+
+def test_parquet_source_missing_file(tmp_path):
+    data_source = ParquetSource(file_path=tmp_path / "missing.parquet")
+
+    with pytest.raises(ValueError, match="must point to an existing file"):
+        data_source.load_data()
+
+
+def test_parquet_source_readahead(tmp_path, monkeypatch):
+    parquet_file = tmp_path / "test.parquet"
+    pl.DataFrame({"id": range(5)}).write_parquet(parquet_file)
+    advised = []
+
+    monkeypatch.setattr(os, "posix_fadvise", lambda *args: advised.append(args), raising=False)
+    monkeypatch.setattr(os, "POSIX_FADV_WILLNEED", 3, raising=False)
+    data_source = ParquetSource(file_path=parquet_file)
+
+    data_source.load_data()
+    assert advised == []
+
+    data_source.readahead = True
+    assert data_source.load_data()["id"].to_list() == list(range(5))
+    assert [args[1:] for args in advised] == [(0, 0, 3)]
+
+
+@pytest.mark.parametrize(
+    "read_options", [{"memory_map": False}, {"use_pyarrow": True, "pyarrow_options": {}}]
+)
+def test_parquet_source_read_only_options(tmp_path, read_options):
+    if "use_pyarrow" in read_options:
+        pytest.importorskip("pyarrow")
+    parquet_file = tmp_path / "test.parquet"
+    pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}).write_parquet(parquet_file)
+
+    data_source = ParquetSource(
+        file_path=parquet_file,
+        columns=["col2"],
+        read_options=read_options,
+        row_filter=pl.col("col1") > 1,
+    )
+
+    assert data_source.get_columns() == ["col1", "col2"]
+    assert data_source.load_data().to_dicts() == [{"col2": "b"}, {"col2": "c"}]
+    assert pl.concat(data_source.load_data_batched(batch_size=2))["col2"].to_list() == [
+        "b",
+        "c",
+    ]
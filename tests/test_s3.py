@@ -1,3 +1,5 @@
+from concurrent.futures import Future
+
 import pytest
 import boto3
 from botocore.exceptions import NoCredentialsError
@@ -19,12 +21,53 @@ def s3_delivery(aws_config):
     return S3Delivery(aws_config)
 
 
+class MockTransferManager:
+    instances = []
+
+    def __init__(self, client, config=None):
+        self.client = client
+        self.config = config
+        self.closed = False
+        MockTransferManager.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+    def upload(self, fileobj, bucket, key):
+        return self.__complete(self.client.upload_file, fileobj, bucket, key)
+
+    def copy(self, copy_source, bucket, key):
+        return self.__complete(self.client.copy, copy_source, bucket, key)
+
+    def __complete(self, function, *args):
+        future = Future()
+        try:
+            function(*args, Config=self.config)
+            future.set_result(None)
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+@pytest.fixture(autouse=True)
+def transfer_manager(monkeypatch):
+    MockTransferManager.instances = []
+    monkeypatch.setattr("quipus.services.s3_delivery.TransferManager", MockTransferManager)
+    return MockTransferManager
+
+
 class MockS3Client:
     def __init__(self, *args, **kwargs):
         self.uploaded_files = {}
 
-    def upload_file(self, Filename, Bucket, Key):
-        self.uploaded_files[Key] = {"Bucket": Bucket, "Filename": Filename}
+    def upload_file(self, Filename, Bucket, Key, Config=None):
+        self.uploaded_files[Key] = {"Bucket": Bucket, "Filename": Filename, "Config": Config}
+
+    def copy(self, CopySource, Bucket, Key, Config=None):
+        self.uploaded_files[Key] = {"Bucket": Bucket, "CopySource": CopySource, "Config": Config}
 
 
 # ============== Tests for AWSConfig ==============
@@ -137,11 +180,45 @@ def test_s3_delivery_upload_many_files(monkeypatch, s3_delivery, tmp_path):
 
     bucket_name = "my-bucket"
 
-    s3_delivery.upload_many_files(files, bucket_name)
+    s3_delivery.upload_many_files(files, bucket_name, max_bandwidth=1024 * 1024)
 
     uploaded_files = mock_s3_client.uploaded_files
+    assert uploaded_files["folder/test2.txt"]["Config"].max_bandwidth == 1024 * 1024
     assert "folder/test1.txt" in uploaded_files
     assert "folder/test2.txt" in uploaded_files
+    assert (
+        uploaded_files["folder/test1.txt"]["Config"].max_concurrency
+        == S3Delivery.MAX_POOL_CONNECTIONS
+    )
+    assert (
+        uploaded_files["folder/test1.txt"]["Config"].multipart_chunksize
+        == S3Delivery.MULTIPART_CHUNK_SIZE
+    )
+
+
+def test_s3_delivery_upload_many_files_caps_requests_at_pool_size(monkeypatch, s3_delivery):
+    mock_s3_client = MockS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: mock_s3_client)
+
+    s3_delivery.upload_many_files([("a", "a")], "bucket", max_workers=2, max_concurrency=3)
+    s3_delivery.upload_many_files([("b", "b")], "bucket", max_workers=8, max_concurrency=8)
+
+    uploaded_files = mock_s3_client.uploaded_files
+    assert uploaded_files["a"]["Config"].max_concurrency == 6
+    assert uploaded_files["b"]["Config"].max_concurrency == S3Delivery.MAX_POOL_CONNECTIONS
+
+
+def test_s3_delivery_upload_many_files_raises_upload_errors(monkeypatch, s3_delivery):
+    class FailingS3Client(MockS3Client):
+        def upload_file(self, Filename, Bucket, Key, Config=None):
+            if Key == "bad":
+                raise RuntimeError("Upload failed.")
+            super().upload_file(Filename, Bucket, Key, Config)
+
+    monkeypatch.setattr(boto3, "client", FailingS3Client)
+
+    with pytest.raises(RuntimeError, match="Upload failed."):
+        s3_delivery.upload_many_files([("a", "good"), ("b", "bad")], "bucket", max_workers=2)
 
 
 def test_s3_delivery_upload_file_invalid_parameters(s3_delivery):
@@ -185,3 +262,122 @@ def test_s3_delivery_upload_many_files_invalid_parameters(s3_delivery):
 
     with pytest.raises(TypeError):
         s3_delivery.upload_many_files([("path", "key")], 123)
+
+    with pytest.raises(ValueError):
+        s3_delivery.upload_many_files([("path", "key")], "")
+
+    with pytest.raises(ValueError):
+        s3_delivery.upload_many_files([], "bucket", max_workers=0)
+
+    with pytest.raises(ValueError):
+        s3_delivery.upload_many_files([], "bucket", max_concurrency=0)
+
+    with pytest.raises(ValueError):
+        s3_delivery.upload_many_files([], "bucket", max_bandwidth=0)
+
+
+def test_s3_delivery_upload_many_files_consumes_lazily(monkeypatch, s3_delivery):
+    mock_s3_client = MockS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: mock_s3_client)
+    produced = []
+
+    def files():
+        for i in range(10):
+            produced.append(i)
+            # Never more than two uploads per worker are waiting.
+            assert len(produced) - len(mock_s3_client.uploaded_files) <= 2
+            yield f"file{i}.pdf", f"key{i}"
+
+    s3_delivery.upload_many_files(files(), "my-bucket", max_workers=1)
+
+    assert len(mock_s3_client.uploaded_files) == 10
+
+
+def test_s3_delivery_upload_directory(monkeypatch, s3_delivery, tmp_path):
+    mock_s3_client = MockS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: mock_s3_client)
+    (tmp_path / "es").mkdir()
+    (tmp_path / "es" / "Juan.pdf").write_text("Juan")
+    (tmp_path / "Ana.pdf").write_text("Ana")
+
+    s3_delivery.upload_directory(str(tmp_path), "my-bucket", prefix="reports/")
+
+    uploaded = {
+        key: upload["Filename"] for key, upload in mock_s3_client.uploaded_files.items()
+    }
+    assert uploaded == {
+        "reports/es/Juan.pdf": str(tmp_path / "es" / "Juan.pdf"),
+        "reports/Ana.pdf": str(tmp_path / "Ana.pdf"),
+    }
+
+    with pytest.raises(FileNotFoundError):
+        s3_delivery.upload_directory(str(tmp_path / "missing"), "my-bucket")
+
+
+def test_s3_delivery_reuses_client(monkeypatch, s3_delivery, aws_config):
+    created = []
+
+    def mock_boto3_client(*args, **kwargs):
+        created.append(kwargs)
+        return MockS3Client()
+
+    monkeypatch.setattr(boto3, "client", mock_boto3_client)
+
+    s3_delivery.upload_file("a.pdf", "my-bucket", "a.pdf")
+    s3_delivery.upload_many_files([("b.pdf", "b.pdf")], "my-bucket")
+    assert len(created) == 1
+    assert created[0]["config"].max_pool_connections == S3Delivery.MAX_POOL_CONNECTIONS
+    assert created[0]["config"].retries["max_attempts"] == S3Delivery.MAX_ATTEMPTS
+
+    s3_delivery.aws_config = aws_config
+    s3_delivery.upload_file("a.pdf", "my-bucket", "a.pdf")
+    assert len(created) == 2
+
+
+def test_s3_delivery_mirror_many(monkeypatch, s3_delivery, transfer_manager):
+    mock_s3_client = MockS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: mock_s3_client)
+
+    s3_delivery.mirror_many(
+        [
+            ("source", "reports/Ana.pdf", "mirror", "Ana.pdf"),
+            ("source", "reports/Juan.pdf", "mirror", "Juan.pdf"),
+        ],
+        max_workers=1,
+    )
+
+    copied = mock_s3_client.uploaded_files
+    assert copied["Ana.pdf"]["Bucket"] == "mirror"
+    assert copied["Ana.pdf"]["CopySource"] == {"Bucket": "source", "Key": "reports/Ana.pdf"}
+    assert copied["Juan.pdf"]["Config"].multipart_chunksize == S3Delivery.COPY_CHUNK_SIZE
+    assert copied["Juan.pdf"]["Config"].max_concurrency == 10
+    assert len(transfer_manager.instances) == 1
+    assert transfer_manager.instances[0].client is mock_s3_client
+    assert transfer_manager.instances[0].closed
+
+    with pytest.raises(TypeError):
+        s3_delivery.mirror_many("source/Ana.pdf")
+    with pytest.raises(ValueError):
+        s3_delivery.mirror_many([], max_workers=0)
+
+
+def test_s3_delivery_upload_many_files_share_one_transfer_manager(
+    monkeypatch, s3_delivery, transfer_manager
+):
+    mock_s3_client = MockS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: mock_s3_client)
+
+    s3_delivery.upload_many_files(
+        [(f"file{i}.pdf", f"key{i}") for i in range(10)],
+        "my-bucket",
+        max_workers=4,
+        max_bandwidth=1024,
+    )
+
+    # A single manager holds the only bandwidth limiter of the batch.
+    assert len(transfer_manager.instances) == 1
+    manager = transfer_manager.instances[0]
+    assert manager.client is mock_s3_client
+    assert manager.config.max_bandwidth == 1024
+    assert manager.closed
+    assert len(mock_s3_client.uploaded_files) == 10
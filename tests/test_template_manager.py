@@ -0,0 +1,139 @@
+import polars as pl
+import pytest
+
+from quipus import PDFBackend, Template, TemplateManager
+
+
+class MockHTML:
+    def __init__(self, string, base_url):
+        self.string = string
+
+    def write_pdf(self, **kwargs):
+        return self.string.encode()
+
+
+class TaggedBackend(PDFBackend):
+    # Defined at module level, so worker processes can unpickle it.
+    def __init__(self, tag):
+        self.tag = tag
+
+    def render(self, html_string, template):
+        return f"{self.tag}:{html_string}".encode()
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    monkeypatch.setattr("quipus.models.pdf_backend.HTML", MockHTML)
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<p>{name}</p>")
+
+    manager = TemplateManager()
+    manager.data = [{"name": f"name_{i}"} for i in range(20)]
+    return (
+        manager.with_template(Template(html_path=str(html_file)))
+        .decide_filename_with(lambda item: item["name"])
+    )
+
+
+def test_template_manager_to_pdf(manager, tmp_path):
+    output_dir = tmp_path / "out"
+
+    manager.to_pdf(str(output_dir), create_dir=True)
+
+    assert len(list(output_dir.iterdir())) == 20
+    assert (output_dir / "name_3.pdf").read_bytes() == b"<p>name_3</p>"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_template_manager_to_pdf_delivers_each_file(manager, tmp_path, workers):
+    output_dir = tmp_path / "out"
+    delivered = []
+
+    manager.deliver_with(delivered.append, workers=3)
+    manager.to_pdf(str(output_dir), create_dir=True, workers=workers)
+
+    assert sorted(delivered) == sorted(str(path) for path in output_dir.iterdir())
+    assert len(delivered) == 20
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_template_manager_renders_first_template_with_the_path(tmp_path, workers):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<p>{name}</p>")
+    output_dir = tmp_path / "out"
+
+    manager = TemplateManager()
+    manager.data = [{"name": "Ana"}, {"name": "Juan"}]
+    manager.with_multiple_templates(
+        [
+            Template(html_path=str(html_file), backend=TaggedBackend("first")),
+            Template(html_path=str(html_file), backend=TaggedBackend("second")),
+        ]
+    ).decide_template_with(lambda item: str(html_file)).decide_filename_with(
+        lambda item: item["name"]
+    ).to_pdf(str(output_dir), create_dir=True, workers=workers)
+
+    assert (output_dir / "Ana.pdf").read_bytes() == b"first:<p>Ana</p>"
+    assert (output_dir / "Juan.pdf").read_bytes() == b"first:<p>Juan</p>"
+
+
+def test_template_manager_delivery_errors_are_raised(manager, tmp_path):
+    def fail_delivery(path):
+        raise ConnectionError("Upload failed.")
+
+    manager.deliver_with(fail_delivery)
+
+    with pytest.raises(ConnectionError, match="Upload failed."):
+        manager.to_pdf(str(tmp_path / "out"), create_dir=True)
+
+
+def test_template_manager_invalid_delivery_workers(manager):
+    with pytest.raises(ValueError):
+        manager.deliver_with(print, workers=0)
+
+
+def test_template_manager_to_pdf_from_dataframe(manager, tmp_path):
+    output_dir = tmp_path / "out"
+    manager.data = pl.DataFrame({"name": ["Ana", "Juan"]})
+
+    manager.to_pdf(str(output_dir), create_dir=True)
+
+    assert (output_dir / "Ana.pdf").read_bytes() == b"<p>Ana</p>"
+    assert (output_dir / "Juan.pdf").read_bytes() == b"<p>Juan</p>"
+
+
+def test_template_manager_invalid_data(manager):
+    with pytest.raises(TypeError):
+        manager.data = {"name": "Ana"}
+
+
+def test_template_manager_from_csv_quoted_fields(tmp_path):
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text('name,city\n"Pérez, Ana",Lima\nJuan,"Cusco, Perú"\n')
+
+    manager = TemplateManager().from_csv(str(csv_file))
+
+    assert manager.data == [
+        {"name": "Pérez, Ana", "city": "Lima"},
+        {"name": "Juan", "city": "Cusco, Perú"},
+    ]
+
+
+def test_template_manager_resolves_rows_lazily(manager, monkeypatch, tmp_path):
+    resolved = []
+    rendered = []
+
+    class CountingHTML(MockHTML):
+        def __init__(self, string, base_url):
+            super().__init__(string, base_url)
+            rendered.append(string)
+            # Each row is resolved right before it is rendered.
+            assert len(resolved) == len(rendered)
+
+    monkeypatch.setattr("quipus.models.pdf_backend.HTML", CountingHTML)
+    manager.data = pl.DataFrame({"name": [f"name_{i}" for i in range(5)]})
+    manager.decide_filename_with(lambda item: resolved.append(item) or item["name"])
+
+    manager.to_pdf(str(tmp_path / "out"), create_dir=True)
+
+    assert len(rendered) == 5
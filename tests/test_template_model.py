@@ -1,5 +1,12 @@
+import pickle
+import sys
+import types
+from datetime import date
+from urllib.parse import urljoin
+
 import pytest
-from quipus import Template
+import polars as pl
+from quipus import ChromiumBackend, PDFBackend, Template
 
 
 @pytest.fixture
@@ -113,6 +120,97 @@ def test_template_render_html_with_values_missing_key(sample_html_file):
         template.render_html_with_values({})
 
 
+def test_template_render_html_with_values_escaped_braces(tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<style>p {{ margin: 0; }}</style><p>{name} ({age})</p>")
+
+    template = Template(html_path=str(html_file))
+
+    assert template.render_html_with_values({"name": "Juan", "age": 30}) == (
+        "<style>p { margin: 0; }</style><p>Juan (30)</p>"
+    )
+
+
+def test_template_render_html_with_values_quotes_and_backslashes(tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<p class='a\\b' title=\"{{x}}\">{name}\n{name}</p>")
+
+    template = Template(html_path=str(html_file))
+
+    assert template.render_html_with_values({"name": "\"'"}) == (
+        "<p class='a\\b' title=\"{x}\">\"'\n\"'</p>"
+    )
+
+
+def test_template_render_html_with_values_format_spec(tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<p>{amount:.2f} {name!r}</p>")
+
+    template = Template(html_path=str(html_file))
+
+    assert template.render_html_with_values({"amount": 3.14159, "name": "Juan"}) == (
+        "<p>3.14 'Juan'</p>"
+    )
+
+
+def test_template_render_html_columns(tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<p>{name} ({age}) {{ {name} }}</p>")
+
+    template = Template(html_path=str(html_file))
+
+    assert template.render_html_columns({"name": ["Juan", "Ana"], "age": [30, 25]}) == [
+        "<p>Juan (30) { Juan }</p>",
+        "<p>Ana (25) { Ana }</p>",
+    ]
+
+    with pytest.raises(ValueError, match="must have the same length"):
+        template.render_html_columns({"name": ["Juan"], "age": []})
+
+    with pytest.raises(KeyError):
+        template.render_html_columns({"name": ["Juan"]})
+
+
+def test_template_render_html_frame(tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<p>{name} ({age}) {{ {score} {active} {since} }}</p>")
+    data = pl.DataFrame(
+        {
+            "name": ["Juan", None],
+            "age": [30, None],
+            "score": [1.5, 1e16],
+            "active": [True, None],
+            "since": [date(2024, 1, 31), None],
+        }
+    )
+
+    template = Template(html_path=str(html_file))
+
+    assert template.render_html_frame(data) == [
+        template.render_html_with_values(row) for row in data.to_dicts()
+    ]
+    assert template.render_html_frame(data.clear()) == []
+
+    with pytest.raises(KeyError):
+        template.render_html_frame(data.drop("age"))
+
+    with pytest.raises(TypeError):
+        template.render_html_frame(data.to_dicts())
+
+
+@pytest.mark.parametrize(
+    "html, expected",
+    [("<p>{{ static }}</p>", "<p>{ static }</p>"), ("<p>{score:.1f}</p>", "<p>1.5</p>")],
+)
+def test_template_render_html_frame_without_segments(tmp_path, html, expected):
+    html_file = tmp_path / "template.html"
+    html_file.write_text(html)
+
+    template = Template(html_path=str(html_file))
+
+    assert template.render_html_frame(pl.DataFrame({"score": [1.5, 1.46]})) == [expected] * 2
+
+
 def test_template_render_css(sample_html_file, sample_css_file):
     template = Template(html_path=str(sample_html_file), css_path=str(sample_css_file))
     assert template.render_css() == "body { color: black; }"
@@ -126,6 +224,175 @@ def test_template_render_css_no_path(sample_html_file):
         template.render_css()
 
 
+def test_template_stylesheets_are_cached(sample_html_file, sample_css_file):
+    template = Template(html_path=str(sample_html_file), css_path=str(sample_css_file))
+    stylesheets = template.stylesheets
+
+    assert len(stylesheets) == 1
+    assert template.stylesheets is stylesheets
+    assert template.font_config is template.font_config
+
+    template.css_path = None
+    assert template.stylesheets == []
+
+
+def test_template_pickle_drops_weasyprint_cache(sample_html_file, sample_css_file):
+    template = Template(html_path=str(sample_html_file), css_path=str(sample_css_file))
+    assert template.stylesheets
+
+    template.render_html_with_values({"name": "Juan"})
+
+    restored = pickle.loads(pickle.dumps(template))
+
+    assert restored.render_html_with_values({"name": "Ana"}) == "<html><body>Ana</body></html>"
+    assert restored.html_path == template.html_path
+    assert restored.css_path == template.css_path
+    assert len(restored.stylesheets) == 1
+
+
+def test_template_to_pdf_reuses_identical_renders(monkeypatch, sample_html_file, tmp_path):
+    rendered = []
+
+    class MockHTML:
+        def __init__(self, string, base_url):
+            self.string = string
+
+        def write_pdf(self, **kwargs):
+            rendered.append(self.string)
+            return self.string.encode()
+
+    monkeypatch.setattr("quipus.models.pdf_backend.HTML", MockHTML)
+    template = Template(html_path=str(sample_html_file))
+
+    template.to_pdf({"name": "Juan"}, str(tmp_path / "a.pdf"))
+    template.to_pdf({"name": "Juan"}, str(tmp_path / "b.pdf"))
+    template.to_pdf({"name": "Ana"}, str(tmp_path / "c.pdf"))
+
+    assert rendered == ["<html><body>Juan</body></html>", "<html><body>Ana</body></html>"]
+    assert (tmp_path / "b.pdf").read_bytes() == b"<html><body>Juan</body></html>"
+
+
+def test_template_to_pdf_create_dir(monkeypatch, sample_html_file, tmp_path):
+    class MockHTML:
+        def __init__(self, string, base_url):
+            self.string = string
+
+        def write_pdf(self, **kwargs):
+            return self.string.encode()
+
+    monkeypatch.setattr("quipus.models.pdf_backend.HTML", MockHTML)
+    template = Template(html_path=str(sample_html_file))
+    output_dir = tmp_path / "out" / "nested"
+
+    with pytest.raises(FileNotFoundError):
+        template.to_pdf({"name": "Juan"}, str(output_dir / "a.pdf"))
+
+    template.to_pdf({"name": "Juan"}, str(output_dir / "a.pdf"), create_dir=True)
+
+    def fail_makedirs(*args, **kwargs):
+        raise AssertionError("The directory should not be created again.")
+
+    monkeypatch.setattr("quipus.models.template.os.makedirs", fail_makedirs)
+    template.to_pdf({"name": "Ana"}, str(output_dir / "b.pdf"), create_dir=True)
+
+    assert sorted(p.name for p in output_dir.iterdir()) == ["a.pdf", "b.pdf"]
+
+
+def test_template_to_pdf_keeps_previous_file_on_failure(
+    monkeypatch, sample_html_file, tmp_path
+):
+    class MockBackend(PDFBackend):
+        def render(self, html_string, template):
+            return html_string.encode()
+
+    def fail_replace(*args, **kwargs):
+        raise OSError("Disk full.")
+
+    output_file = tmp_path / "a.pdf"
+    output_file.write_bytes(b"previous")
+    template = Template(html_path=str(sample_html_file), backend=MockBackend())
+    monkeypatch.setattr("quipus.utils.files.os.replace", fail_replace)
+
+    with pytest.raises(OSError, match="Disk full."):
+        template.to_pdf({"name": "Juan"}, str(output_file))
+
+    assert output_file.read_bytes() == b"previous"
+    assert not list(tmp_path.glob(".a.pdf.*"))
+
+
+def test_template_render_pdf_does_not_write(monkeypatch, sample_html_file, tmp_path):
+    class MockHTML:
+        def __init__(self, string, base_url):
+            self.string = string
+
+        def write_pdf(self, **kwargs):
+            return self.string.encode()
+
+    monkeypatch.setattr("quipus.models.pdf_backend.HTML", MockHTML)
+    template = Template(html_path=str(sample_html_file))
+
+    assert template.render_pdf({"name": "Juan"}) == b"<html><body>Juan</body></html>"
+    assert not list(tmp_path.glob("*.pdf"))
+
+
+def test_template_to_batch_pdf_renders_once(monkeypatch, sample_html_file, tmp_path):
+    rendered = []
+
+    class MockHTML:
+        def __init__(self, string, base_url):
+            self.string = string
+
+        def write_pdf(self, **kwargs):
+            rendered.append(self.string)
+            return self.string.encode()
+
+    monkeypatch.setattr("quipus.models.pdf_backend.HTML", MockHTML)
+    template = Template(html_path=str(sample_html_file))
+
+    template.to_batch_pdf([{"name": "Juan"}, {"name": "Ana"}], str(tmp_path / "batch.pdf"))
+
+    assert len(rendered) == 1
+    assert rendered[0].count('break-after: page') == 2
+    assert "Juan" in rendered[0] and "Ana" in rendered[0]
+
+    with pytest.raises(ValueError, match="'values_list' cannot be empty."):
+        template.to_batch_pdf([], str(tmp_path / "empty.pdf"))
+
+
+def test_weasyprint_backend_shares_image_cache(monkeypatch, sample_html_file):
+    caches = []
+
+    class MockHTML:
+        def __init__(self, string, base_url):
+            self.string = string
+
+        def write_pdf(self, cache, **kwargs):
+            caches.append(cache)
+            return self.string.encode()
+
+    monkeypatch.setattr("quipus.models.pdf_backend.HTML", MockHTML)
+    template = Template(html_path=str(sample_html_file))
+
+    template.render_pdf({"name": "Juan"})
+    template.render_pdf({"name": "Ana"})
+
+    assert caches[0] is caches[1]
+
+
+def test_template_custom_backend(sample_html_file, tmp_path):
+    class UpperBackend(PDFBackend):
+        def render(self, html_string, template):
+            return html_string.upper().encode()
+
+    template = Template(html_path=str(sample_html_file), backend=UpperBackend())
+    template.to_pdf({"name": "Juan"}, str(tmp_path / "a.pdf"))
+
+    assert (tmp_path / "a.pdf").read_bytes() == b"<HTML><BODY>JUAN</BODY></HTML>"
+
+    with pytest.raises(TypeError, match="'backend' must be an instance of PDFBackend."):
+        template.backend = "chromium"
+
+
 def test_template_str(sample_html_file, sample_css_file, sample_assets_dir):
     template = Template(
         html_path=str(sample_html_file),
@@ -140,3 +407,55 @@ def test_template_str(sample_html_file, sample_css_file, sample_assets_dir):
         }
     )
     assert str(template) == expected_str
+
+
+def test_chromium_backend_resolves_relative_assets(monkeypatch, tmp_path, sample_assets_dir):
+    class MockPage:
+        url = "about:blank"
+
+        def __init__(self):
+            self.calls = []
+
+        def goto(self, url):
+            self.calls.append(("goto", url))
+            self.url = url
+
+        def set_content(self, html):
+            self.calls.append(("set_content", html))
+
+        def pdf(self, **kwargs):
+            return b"%PDF"
+
+    page = MockPage()
+
+    class MockPlaywright:
+        def start(self):
+            return self
+
+        chromium = property(lambda self: self)
+
+        def launch(self):
+            return self
+
+        def new_page(self):
+            return page
+
+    sync_api = types.ModuleType("playwright.sync_api")
+    sync_api.sync_playwright = MockPlaywright
+    monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("playwright"))
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", sync_api)
+
+    (sample_assets_dir / "logo.png").write_bytes(b"png")
+    html_file = tmp_path / "template.html"
+    html_file.write_text('<img src="assets/logo.png"> {name}')
+    template = Template(html_path=str(html_file), backend=ChromiumBackend())
+
+    assert template.render_pdf({"name": "Ana"}) == b"%PDF"
+    assert template.render_pdf({"name": "Juan"}) == b"%PDF"
+
+    assert page.calls == [
+        ("goto", html_file.resolve().as_uri()),
+        ("set_content", '<img src="assets/logo.png"> Ana'),
+        ("set_content", '<img src="assets/logo.png"> Juan'),
+    ]
+    assert urljoin(page.url, "assets/logo.png") == (sample_assets_dir / "logo.png").as_uri()
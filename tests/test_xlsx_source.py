@@ -0,0 +1,128 @@
+import polars as pl
+import pytest
+from openpyxl import Workbook
+
+from quipus import XLSXSource
+
+
+def write_workbook(path, sheets):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture
+def xlsx_file(tmp_path):
+    return write_workbook(
+        tmp_path / "people.xlsx",
+        {
+            "people": [["name", "age"], ["Juan", 30], ["Ana", 25]],
+            "pets": [["pet"], ["Firulais"]],
+        },
+    )
+
+
+def test_xlsx_source_load_data(xlsx_file):
+    source = XLSXSource(file_path=xlsx_file)
+
+    assert source.load_data().to_dicts() == [
+        {"name": "Juan", "age": 30},
+        {"name": "Ana", "age": 25},
+    ]
+
+
+def test_xlsx_source_uses_calamine_unless_overridden(xlsx_file, monkeypatch):
+    engines = []
+    read_excel = pl.read_excel
+
+    def mock_read_excel(*args, **kwargs):
+        engines.append(kwargs["engine"])
+        return read_excel(*args, **kwargs)
+
+    monkeypatch.setattr("quipus.data_sources.xlsx_source.pl.read_excel", mock_read_excel)
+
+    XLSXSource(file_path=xlsx_file).load_data()
+    XLSXSource(file_path=xlsx_file, read_options={"engine": "openpyxl"}).load_data()
+
+    assert engines == ["calamine", "openpyxl"]
+
+
+def test_xlsx_source_caches_workbook_parse(tmp_path, monkeypatch):
+    xlsx_file = write_workbook(
+        tmp_path / "people.xlsx", {"people": [["name", "age"], ["Juan", 30]]}
+    )
+    reads = []
+    read_excel = pl.read_excel
+
+    def mock_read_excel(*args, **kwargs):
+        reads.append(kwargs)
+        return read_excel(*args, **kwargs)
+
+    monkeypatch.setattr("quipus.data_sources.xlsx_source.pl.read_excel", mock_read_excel)
+    source = XLSXSource(file_path=xlsx_file)
+
+    first = source.load_data()
+    assert source.load_data().equals(first)
+    assert source.get_columns() == ["name", "age"]
+    assert len(reads) == 1
+
+    source.columns = ["name"]
+    assert source.load_data().columns == ["name"]
+    assert len(reads) == 2
+
+    write_workbook(xlsx_file, {"people": [["name", "age"], ["Rosa", 40]]})
+    assert source.load_data().to_dicts() == [{"name": "Rosa"}]
+    assert len(reads) == 3
+
+
+def test_xlsx_source_get_columns_reads_header_only(xlsx_file, monkeypatch):
+    def fail_read_excel(*args, **kwargs):
+        raise AssertionError("get_columns should not read the sheet through Polars.")
+
+    monkeypatch.setattr("quipus.data_sources.xlsx_source.pl.read_excel", fail_read_excel)
+
+    assert XLSXSource(file_path=xlsx_file).get_columns() == ["name", "age"]
+    assert XLSXSource(file_path=xlsx_file, sheet="pets").get_columns() == ["pet"]
+    assert XLSXSource(file_path=xlsx_file, sheet=1).get_columns() == ["pet"]
+    assert XLSXSource(file_path=xlsx_file, has_header=False).get_columns() == [
+        "column_1",
+        "column_2",
+    ]
+
+
+@pytest.mark.parametrize("sheet", ["missing", 5])
+def test_xlsx_source_get_columns_invalid_sheet(xlsx_file, sheet):
+    with pytest.raises(ValueError, match="'missing' not found|sheet_id 5 is out of range"):
+        XLSXSource(file_path=xlsx_file, sheet=sheet).get_columns()
+
+
+def test_xlsx_source_reads_only_selected_sheet(xlsx_file):
+    assert XLSXSource(file_path=xlsx_file, columns=["age"]).load_data().to_dicts() == [
+        {"age": 30},
+        {"age": 25},
+    ]
+    assert XLSXSource(file_path=xlsx_file, sheet=1).load_data().to_dicts() == [
+        {"pet": "Firulais"}
+    ]
+    assert XLSXSource(file_path=xlsx_file, sheet="pets").load_data().columns == ["pet"]
+
+    with pytest.raises(ValueError, match="sheet_id 2 is out of range."):
+        XLSXSource(file_path=xlsx_file, sheet=2).load_data()
+    with pytest.raises(ValueError, match="Sheet name 'missing' not found"):
+        XLSXSource(file_path=xlsx_file, sheet="missing").load_data()
+
+
+@pytest.mark.parametrize("sheet", [True, None, 1.0])
+def test_xlsx_source_invalid_sheet_type(xlsx_file, sheet):
+    with pytest.raises(TypeError):
+        XLSXSource(file_path=xlsx_file, sheet=sheet)
+
+
+def test_xlsx_source_negative_sheet_index(xlsx_file):
+    with pytest.raises(ValueError, match="non-negative"):
+        XLSXSource(file_path=xlsx_file, sheet=-1)